@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# daemon_benchmark.py - Compare cold and warm command latency
+
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Daemon Benchmark
+
+This script runs the same command repeatedly with ``openstack``, which
+starts and authenticates from scratch every time, and with
+``openstack-client``, which hands the command to a running
+``openstack-daemon``, and reports the latency of both.
+
+Start the daemon in the same environment first::
+
+    $ openstack-daemon &
+    $ python daemon_benchmark.py --count 20 flavor list
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def run(executable, command, count):
+    """Return the wall time of each run of a command"""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        subprocess.run(
+            [executable] + command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    print(
+        '%-8s min %.3fs  median %.3fs  mean %.3fs  max %.3fs'
+        % (
+            name,
+            min(timings),
+            statistics.median(timings),
+            statistics.mean(timings),
+            max(timings),
+        )
+    )
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--count',
+        metavar='<count>',
+        type=int,
+        default=10,
+        help='Number of runs of each variant (default: 10)',
+    )
+    parser.add_argument(
+        'command',
+        nargs=argparse.REMAINDER,
+        help='Command to run (default: "versions show")',
+    )
+    opts = parser.parse_args(argv)
+    command = opts.command or ['versions', 'show']
+
+    cold = run('openstack', command, opts.count)
+    warm = run('openstack-client', command, opts.count)
+
+    print('%s (%d runs)' % (' '.join(command), opts.count))
+    report('cold', cold)
+    report('warm', warm)
+    print(
+        'speedup  %.1fx' % (statistics.median(cold) / statistics.median(warm))
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
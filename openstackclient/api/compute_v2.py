@@ -31,6 +31,8 @@ class APIv2(api.BaseAPI):
 
     def __init__(self, **kwargs):
         super(APIv2, self).__init__(**kwargs)
+        # Security group rules indexed by ID, see security_group_rule_find()
+        self._security_group_rules = None
 
     # Overrides
 
@@ -487,6 +489,8 @@ class APIv2(api.BaseAPI):
             value=security_group,
         )['id']
         if security_group is not None:
+            # The rules of the group are deleted with it
+            self._security_group_rules = None
             return self.delete('/%s/%s' % (url, security_group))
 
         return None
@@ -629,6 +633,7 @@ class APIv2(api.BaseAPI):
             'group_id': remote_group,
         }
 
+        self._security_group_rules = None
         return self.create(
             url,
             json={'security_group_rule': params},
@@ -648,6 +653,36 @@ class APIv2(api.BaseAPI):
 
         url = "/os-security-group-rules"
         if security_group_rule_id is not None:
+            self._security_group_rules = None
             return self.delete('/%s/%s' % (url, security_group_rule_id))
 
         return None
+
+    def security_group_rule_find(
+        self,
+        security_group_rule=None,
+    ):
+        """Return a security group rule given its ID
+
+        Compute has no API to get or list security group rules, the rules of
+        the accessible security groups are listed once and indexed by ID.
+        The index is kept for the life of the API object and built again when
+        a rule is not found in it or after a rule is created or deleted.
+
+        :param string security_group_rule:
+            Security group rule ID
+        :returns: A dict of the security group rule attributes
+        """
+
+        rule_id = str(security_group_rule)
+        rules = self._security_group_rules
+        if rules is None or rule_id not in rules:
+            rules = self._security_group_rules = {
+                str(rule.get('id')): rule
+                for security_group in self.security_group_list()
+                for rule in security_group['rules']
+            }
+        if rule_id not in rules:
+            msg = _("Security group rule %s not found") % rule_id
+            raise exceptions.NotFound(msg)
+        return rules[rule_id]
@@ -16,18 +16,66 @@
 import io
 import logging
 import os
+import string
 import sys
 import urllib
 
 from osc_lib import utils
 
 from openstackclient.api import api
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 
 
+LOG = logging.getLogger(__name__)
+
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
 PUBLIC_CONTAINER_ACLS = [GLOBAL_READ_ACL, LIST_CONTENTS_ACL]
 
+# Characters the names following the prefix are expected to start with,
+# used to split listings in key ranges.  Names starting with other
+# characters are still listed, in the first or last range.  In the order of
+# the listings.
+PARTITION_CHARACTERS = (
+    string.digits + string.ascii_uppercase + string.ascii_lowercase
+)
+
+
+def _entry_name(entry):
+    # Listings with a delimiter contain pseudo-directories
+    return entry.get('name', entry.get('subdir'))
+
+
+def _split_listing(
+    partitions, prefix=None, marker=None, end_marker=None, delimiter=None
+):
+    """Split a listing in key ranges
+
+    :returns: a list of ``(marker, end_marker, boundary)`` tuples, where
+        ``boundary`` is True when the marker is a range boundary rather than
+        the marker of the listing
+    """
+    boundaries = []
+    if partitions and partitions > 1:
+        # A boundary ending with the delimiter could be a pseudo-directory
+        # spanning two ranges
+        chars = [c for c in PARTITION_CHARACTERS if c != delimiter]
+        step = len(chars) / partitions
+        for i in range(1, partitions):
+            boundary = (prefix or '') + chars[int(i * step)]
+            if (not marker or boundary > marker) and (
+                not end_marker or boundary < end_marker
+            ):
+                boundaries.append(boundary)
+        boundaries = list(dict.fromkeys(boundaries))
+
+    starts = [(marker, False)] + [(b, True) for b in boundaries]
+    ends = boundaries + [end_marker]
+    return [
+        (start, end, boundary) for (start, boundary), end in zip(starts, ends)
+    ]
+
 
 class APIv1(api.BaseAPI):
     """Object Store v1 API"""
@@ -90,6 +138,7 @@ class APIv1(api.BaseAPI):
         marker=None,
         end_marker=None,
         prefix=None,
+        partitions=None,
         **params
     ):
         """Get containers in an account
@@ -97,6 +146,8 @@ class APIv1(api.BaseAPI):
         :param boolean full_listing:
             if True, return a full listing, else returns a max of
             10000 listings
+        :param integer partitions:
+            with full_listing, number of key ranges listed concurrently
         :param integer limit:
             query return count limit
         :param string marker:
@@ -112,25 +163,15 @@ class APIv1(api.BaseAPI):
         params['format'] = 'json'
 
         if full_listing:
-            data = listing = self.container_list(
+            return self._list_all(
+                self.container_list,
+                partitions=partitions,
                 limit=limit,
                 marker=marker,
                 end_marker=end_marker,
                 prefix=prefix,
                 **params
             )
-            while listing:
-                marker = listing[-1]['name']
-                listing = self.container_list(
-                    limit=limit,
-                    marker=marker,
-                    end_marker=end_marker,
-                    prefix=prefix,
-                    **params
-                )
-                if listing:
-                    data.extend(listing)
-            return data
 
         if limit:
             params['limit'] = limit
@@ -146,16 +187,41 @@ class APIv1(api.BaseAPI):
     def container_save(
         self,
         container=None,
+        concurrency=1,
     ):
         """Save all the content from a container
 
         :param string container:
             name of container to save
+        :param integer concurrency:
+            number of objects to download at the same time
+        :returns:
+            dict with the number of objects saved, their total size and the
+            number of objects which failed to save
         """
 
-        objects = self.object_list(container=container)
-        for object in objects:
-            self.object_save(container=container, object=object['name'])
+        def _save(object):
+            try:
+                self.object_save(container=container, object=object['name'])
+            except Exception as e:
+                LOG.error(
+                    "Failed to save object '%(object)s': %(e)s",
+                    {'object': object['name'], 'e': e},
+                )
+                return False
+            return True
+
+        count = size = failed = 0
+        objects = self.object_iter(container=container)
+        for page in streaming.pages(objects):
+            results = parallel.run(_save, page, workers=concurrency)
+            for object, saved in zip(page, results):
+                if saved:
+                    count += 1
+                    size += object.get('bytes', 0)
+                else:
+                    failed += 1
+        return {'count': count, 'bytes': size, 'failed': failed}
 
     def container_set(
         self,
@@ -307,6 +373,7 @@ class APIv1(api.BaseAPI):
         end_marker=None,
         delimiter=None,
         prefix=None,
+        partitions=None,
         **params
     ):
         """List objects in a container
@@ -316,6 +383,8 @@ class APIv1(api.BaseAPI):
         :param boolean full_listing:
             if True, return a full listing, else returns a max of
             10000 listings
+        :param integer partitions:
+            with full_listing, number of key ranges listed concurrently
         :param integer limit:
             query return count limit
         :param string marker:
@@ -335,7 +404,9 @@ class APIv1(api.BaseAPI):
 
         params['format'] = 'json'
         if full_listing:
-            data = listing = self.object_list(
+            return self._list_all(
+                self.object_list,
+                partitions=partitions,
                 container=container,
                 limit=limit,
                 marker=marker,
@@ -344,23 +415,6 @@ class APIv1(api.BaseAPI):
                 delimiter=delimiter,
                 **params
             )
-            while listing:
-                if delimiter:
-                    marker = listing[-1].get('name', listing[-1].get('subdir'))
-                else:
-                    marker = listing[-1]['name']
-                listing = self.object_list(
-                    container=container,
-                    limit=limit,
-                    marker=marker,
-                    end_marker=end_marker,
-                    prefix=prefix,
-                    delimiter=delimiter,
-                    **params
-                )
-                if listing:
-                    data.extend(listing)
-            return data
 
         if limit:
             params['limit'] = limit
@@ -375,6 +429,56 @@ class APIv1(api.BaseAPI):
 
         return self.list(urllib.parse.quote(container), **params)
 
+    def object_iter(
+        self,
+        container=None,
+        limit=None,
+        marker=None,
+        end_marker=None,
+        delimiter=None,
+        prefix=None,
+        partitions=None,
+        **params
+    ):
+        """Iterate over all the objects in a container
+
+        Unlike a full listing with :meth:`object_list`, the objects are
+        fetched one page at a time as they are consumed, so the listing is
+        never held in memory.
+
+        :param string container:
+            container name to get a listing for
+        :param integer limit:
+            number of objects fetched per request
+        :param string marker:
+            query marker
+        :param string end_marker:
+            query end_marker
+        :param string prefix:
+            query prefix
+        :param string delimiter:
+            string to delimit the queries on
+        :param integer partitions:
+            number of key ranges listed concurrently
+        :returns: an iterator of objects
+        """
+
+        if container is None:
+            return iter(())
+
+        params['format'] = 'json'
+        return self._iter_all(
+            self.object_list,
+            partitions=partitions,
+            container=container,
+            limit=limit,
+            marker=marker,
+            end_marker=end_marker,
+            prefix=prefix,
+            delimiter=delimiter,
+            **params
+        )
+
     def object_save(
         self,
         container=None,
@@ -406,9 +510,10 @@ class APIv1(api.BaseAPI):
                     for chunk in response.iter_content(64 * 1024):
                         f.write(chunk)
             else:
-                if not os.path.exists(os.path.dirname(file)):
-                    if len(os.path.dirname(file)) > 0:
-                        os.makedirs(os.path.dirname(file))
+                # Objects of the same pseudo-directory may be saved
+                # concurrently
+                if os.path.dirname(file):
+                    os.makedirs(os.path.dirname(file), exist_ok=True)
                 with open(file, 'wb') as f:
                     for chunk in response.iter_content(64 * 1024):
                         f.write(chunk)
@@ -561,6 +666,63 @@ class APIv1(api.BaseAPI):
         if headers:
             self.create("", headers=headers)
 
+    def _iter_all(self, list_func, partitions=None, **kwargs):
+        """Iterate over all the entries of a listing, following the markers
+
+        The entries are fetched one page at a time, as they are consumed.
+        With partitions, the listing is split in key ranges, using the
+        characters following the prefix, which are listed concurrently a
+        few pages ahead.
+
+        :param list_func: function returning a page of the listing
+        :param integer partitions: number of key ranges
+        :param kwargs: arguments of list_func
+        :returns: an iterator of entries
+        """
+        ranges = _split_listing(
+            partitions,
+            prefix=kwargs.get('prefix'),
+            marker=kwargs.get('marker'),
+            end_marker=kwargs.get('end_marker'),
+            delimiter=kwargs.get('delimiter'),
+        )
+
+        def _list_range(marker, end_marker, boundary):
+            if boundary:
+                # The marker excludes the entry named after the boundary
+                first = list_func(
+                    **dict(
+                        kwargs,
+                        prefix=marker,
+                        marker=None,
+                        end_marker=None,
+                        limit=1,
+                    )
+                )
+                if first and _entry_name(first[0]) == marker:
+                    yield first[:1]
+
+            range_kwargs = dict(kwargs, marker=marker, end_marker=end_marker)
+            listing = list_func(**range_kwargs)
+            while listing:
+                yield listing
+                range_kwargs['marker'] = _entry_name(listing[-1])
+                listing = list_func(**range_kwargs)
+
+        pages = parallel.chain(
+            [_list_range(*key_range) for key_range in ranges],
+            workers=len(ranges),
+        )
+        for page in pages:
+            yield from page
+
+    def _list_all(self, list_func, partitions=None, **kwargs):
+        """Return all the entries of a listing, following the markers
+
+        :returns: a list of entries, see :meth:`_iter_all`
+        """
+        return list(self._iter_all(list_func, partitions=partitions, **kwargs))
+
     def _find_account_id(self):
         url_parts = urllib.parse.urlparse(self.endpoint)
         return url_parts.path.split('/')[-1]
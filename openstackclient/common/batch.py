@@ -0,0 +1,224 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Run a file of commands concurrently with a single shell
+
+Each line of the batch file is a command, as it would be typed after
+``openstack``.  Blank lines and lines starting with ``#`` are ignored.  The
+commands are independent and run concurrently, except that a line
+containing only ``wait`` waits for all the previous commands to complete
+before starting the following ones.
+
+One JSON document is written per command, in completion order, with the
+line number, the command, its exit status, its duration in seconds and its
+captured output.
+"""
+
+from concurrent import futures
+import inspect
+import io
+import json
+import logging
+import shlex
+import sys
+import threading
+import time
+
+from osc_lib import exceptions
+
+from openstackclient.i18n import _
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+
+BARRIER = 'wait'
+
+
+class _ThreadLocalStream(object):
+    """File-like object writing to a per-thread stream
+
+    Threads that did not set a stream write to the default one.
+    """
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    @property
+    def stream(self):
+        return getattr(self._local, 'stream', None) or self._default
+
+    @stream.setter
+    def stream(self, stream):
+        self._local.stream = stream
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, data):
+        return self.stream.write(data)
+
+    def flush(self):
+        return self.stream.flush()
+
+    def isatty(self):
+        return False
+
+
+def parse_batch(stream):
+    """Parse a batch file
+
+    :param stream: File-like object to read the commands from
+    :returns: an iterator of ``(line_number, argv)`` tuples, where ``argv``
+        is ``None`` for the ``wait`` barrier
+    """
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line == BARRIER:
+            yield number, None
+            continue
+        try:
+            yield number, shlex.split(line, comments=True)
+        except ValueError as e:
+            msg = _("Invalid command on line %(line)d: %(error)s")
+            raise exceptions.CommandError(msg % {'line': number, 'error': e})
+
+
+class BatchRunner(object):
+    """Run commands concurrently with an initialized shell
+
+    The commands share the client manager, and so the authenticated session,
+    of the shell.
+
+    :param app: An initialized :class:`openstackclient.shell.OpenStackShell`
+    :param workers: Maximum number of commands running at the same time
+    :param output: File-like object receiving the JSON results, defaults to
+        the standard output of the shell
+    """
+
+    def __init__(self, app, workers=DEFAULT_WORKERS, output=None):
+        self.app = app
+        self.workers = workers
+        self.output = output or app.stdout
+        self._prepare_lock = threading.Lock()
+        self._output_lock = threading.Lock()
+        self._auth_required = False
+
+    def _run_command(self, argv):
+        """Run a single command, as cliff's ``run_subcommand`` would
+
+        The client manager is shared, so only its preparation is serialized,
+        and it is not cleaned up between commands.
+        """
+        command_manager = self.app.command_manager
+        cmd_factory, cmd_name, sub_argv = command_manager.find_command(argv)
+        kwargs = {}
+        if 'cmd_name' in inspect.getfullargspec(cmd_factory.__init__).args:
+            kwargs['cmd_name'] = cmd_name
+        cmd = cmd_factory(self.app, self.app.options, **kwargs)
+        with self._prepare_lock:
+            self.app.prepare_to_run_command(cmd)
+            # Do not drop authentication from under the commands still
+            # running when a command that does not need it is prepared
+            self._auth_required = (
+                self._auth_required or self.app.client_manager._auth_required
+            )
+            self.app.client_manager._auth_required = self._auth_required
+        cmd_parser = cmd.get_parser(' '.join([self.app.NAME, cmd_name]))
+        parsed_args = cmd_parser.parse_args(sub_argv)
+        try:
+            return cmd.run(parsed_args)
+        finally:
+            self.app.update_resolution_cache(cmd)
+
+    def _run(self, number, argv):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        self.app.stdout.stream = stdout
+        self.app.stderr.stream = stderr
+        start = time.monotonic()
+        try:
+            rc = self._run_command(argv)
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            if self.app.options.debug:
+                LOG.exception(e)
+            else:
+                LOG.error(e)
+            rc = 1
+        finally:
+            self.app.stdout.stream = None
+            self.app.stderr.stream = None
+        result = {
+            'line': number,
+            'command': ' '.join(shlex.quote(arg) for arg in argv),
+            'rc': rc,
+            'elapsed': round(time.monotonic() - start, 3),
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+        }
+        with self._output_lock:
+            self.output.write(json.dumps(result) + '\n')
+            self.output.flush()
+        return rc
+
+    def _redirect_logging(self, stream):
+        """Send console log messages to the stream of each command"""
+        consoles = (sys.stderr, sys.__stderr__, stream.stream)
+        saved = []
+        for handler in logging.getLogger('').handlers:
+            if (
+                isinstance(handler, logging.StreamHandler)
+                and not isinstance(handler, logging.FileHandler)
+                and handler.stream in consoles
+            ):
+                saved.append((handler, handler.setStream(stream)))
+        return saved
+
+    def run(self, stream):
+        """Run the commands of a batch file
+
+        :param stream: File-like object to read the commands from
+        :returns: 0 if all the commands succeeded, 1 otherwise
+        """
+        app_streams = (self.app.stdout, self.app.stderr)
+        self.app.stdout = _ThreadLocalStream(self.app.stdout)
+        self.app.stderr = _ThreadLocalStream(self.app.stderr)
+        saved_handlers = self._redirect_logging(self.app.stderr)
+        saved_stdout = sys.stdout
+        sys.stdout = self.app.stdout
+
+        failed = False
+        try:
+            with futures.ThreadPoolExecutor(self.workers) as executor:
+                pending = []
+                for number, argv in parse_batch(stream):
+                    if argv is None:
+                        futures.wait(pending)
+                        failed |= any(f.result() != 0 for f in pending)
+                        pending = []
+                        continue
+                    pending.append(executor.submit(self._run, number, argv))
+                futures.wait(pending)
+                failed |= any(f.result() != 0 for f in pending)
+        finally:
+            sys.stdout = saved_stdout
+            for handler, handler_stream in saved_handlers:
+                handler.setStream(handler_stream)
+            self.app.stdout, self.app.stderr = app_streams
+        return 1 if failed else 0
@@ -0,0 +1,108 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Delete several resources at once
+
+The delete commands accept several resources and report the failures
+following the rules in doc/source/command-errors.rst: each failure is
+logged, the other resources are still deleted, and the command fails with
+the number of failures at the end.  With ``--parallel``, the resources are
+looked up and deleted from a pool of threads, the failures are still logged
+in the order of the resources once all of them are processed.
+"""
+
+import logging
+
+from osc_lib import exceptions
+
+from openstackclient.common import parallel
+from openstackclient.i18n import _
+
+
+LOG = logging.getLogger(__name__)
+
+
+def add_parallel_option(parser):
+    parser.add_argument(
+        '--parallel',
+        metavar='<count>',
+        type=int,
+        default=1,
+        help=_('Number of resources to delete at the same time (default: 1)'),
+    )
+
+
+def run(func, resources, resource_type, workers=1, fatal=()):
+    """Call a function for each resource, logging the failures
+
+    :param func: Function deleting the resource with the given name or ID
+    :param resources: Names or IDs of the resources
+    :param resource_type: Type of the resources, used in the error messages
+    :param workers: Maximum number of resources deleted at the same time
+    :param fatal: Exception classes aborting the command instead of being
+        counted as failures
+    :returns: The list of the results of the successful calls, in the order
+        of the resources
+    """
+
+    def _call(resource):
+        try:
+            return True, func(resource)
+        except fatal:
+            raise
+        except Exception as e:
+            return False, e
+
+    results = []
+    for resource, (success, result) in zip(
+        resources, parallel.run(_call, resources, workers=workers)
+    ):
+        if success:
+            results.append(result)
+            continue
+        LOG.error(
+            _(
+                "Failed to delete %(resource)s with name or ID "
+                "'%(name_or_id)s': %(e)s"
+            ),
+            {'resource': resource_type, 'name_or_id': resource, 'e': result},
+        )
+    return results
+
+
+def check(resources, results, resource_type):
+    """Fail if some resources could not be deleted
+
+    :param resources: Names or IDs of the resources
+    :param results: Results of the successful deletions, see :func:`run`
+    :param resource_type: Type of the resources, used in the error message
+    :raises: ``CommandError`` with the number of failures
+    """
+    failures = len(resources) - len(results)
+    if failures:
+        msg = _("%(num)s of %(total)s %(resource)ss failed to delete.") % {
+            'num': failures,
+            'total': len(resources),
+            'resource': resource_type,
+        }
+        raise exceptions.CommandError(msg)
+
+
+def delete(func, resources, resource_type, workers=1, fatal=()):
+    """Delete resources, failing if some of them could not be deleted
+
+    See :func:`run` for the parameters.
+    """
+    results = run(func, resources, resource_type, workers, fatal)
+    check(resources, results, resource_type)
+    return results
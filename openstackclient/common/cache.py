@@ -0,0 +1,87 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers for the on-disk caches kept between invocations"""
+
+import json
+import logging
+import os
+import tempfile
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = 'openstackclient'
+
+
+def get_cache_dir():
+    """Return the directory used for on-disk caches
+
+    Follows the XDG base directory specification, so ``$XDG_CACHE_HOME``
+    takes precedence over ``~/.cache``.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return os.path.join(base, CACHE_DIR_NAME)
+
+
+def get_cache_path(name):
+    """Return the path of the cache file ``name`` in the cache directory"""
+    return os.path.join(get_cache_dir(), name)
+
+
+def read_json(path):
+    """Load a JSON cache file
+
+    :param path: Path of the cache file
+    :returns: The decoded data, or ``None`` if the file is missing or
+        cannot be decoded
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        LOG.debug('Ignoring unreadable cache file %s: %s', path, e)
+        return None
+
+
+def write_json(path, data):
+    """Atomically write a JSON cache file
+
+    The data is written to a temporary file in the same directory which is
+    then renamed over ``path``, so concurrent readers never see a partially
+    written file.  Failures are logged and otherwise ignored since a cache
+    must never break the command being run.
+
+    :param path: Path of the cache file
+    :param data: JSON-serializable data to store
+    :returns: ``True`` if the file was written
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        LOG.debug('Unable to write cache file %s: %s', path, e)
+        return False
+    return True
@@ -21,8 +21,15 @@ import sys
 
 from osc_lib import clientmanager
 from osc_lib import shell
+from oslo_utils import strutils
 import stevedore
 
+from openstackclient.common import discovery_cache
+from openstackclient.common import image_cache
+from openstackclient.common import project_cache
+from openstackclient.common import resolution_cache
+from openstackclient.common import token_cache
+
 
 LOG = logging.getLogger(__name__)
 
@@ -66,6 +73,11 @@ class ClientManager(clientmanager.ClientManager):
         # store original auth_type
         self._original_auth_type = cli_options.auth_type
 
+        self._token_cache = None
+        self._discovery_cache = None
+        self._project_lookup = None
+        self._image_index = None
+
     def setup_auth(self):
         """Set up authentication"""
 
@@ -94,7 +106,180 @@ class ClientManager(clientmanager.ClientManager):
             except TypeError as e:
                 self._fallback_load_auth_plugin(e)
 
-        return super(ClientManager, self).setup_auth()
+        super(ClientManager, self).setup_auth()
+        self._setup_discovery_cache()
+        # Bind the resolution cache to the session with the configured TTL
+        self.get_resolution_cache()
+
+    @property
+    def discovery_cache_ttl(self):
+        """Number of seconds version discovery results are cached"""
+        ttl = self._cli_options.config.get('discovery_cache_ttl')
+        if ttl is None:
+            return discovery_cache.DEFAULT_TTL
+        return int(ttl)
+
+    def _setup_discovery_cache(self):
+        """Persist the version discovery results of the session"""
+        ttl = self.discovery_cache_ttl
+        if ttl <= 0:
+            return
+        self._discovery_cache = discovery_cache.DiscoveryCache(ttl=ttl)
+        self._discovery_cache.update(self.session._discovery_cache)
+        self.session._discovery_cache = self._discovery_cache
+
+    def refresh_discovery_cache(self):
+        """Discover the service versions again instead of using the cache"""
+        self.setup_auth()
+        if self._discovery_cache is not None:
+            self._discovery_cache.refresh()
+        else:
+            self.session._discovery_cache.clear()
+        if self.auth and hasattr(self.auth, '_discovery_cache'):
+            self.auth._discovery_cache.clear()
+
+    @property
+    def project_cache_ttl(self):
+        """Number of seconds project names are cached on disk"""
+        ttl = self._cli_options.config.get('project_cache_ttl')
+        if ttl is None:
+            return project_cache.DEFAULT_TTL
+        return int(ttl)
+
+    def _get_project(self, project_id):
+        # The projects are called tenants by the Identity v2 client
+        api_version = (self._api_version or {}).get('identity')
+        if str(api_version).startswith('2'):
+            return self.identity.tenants.get(project_id)
+        return self.identity.projects.get(project_id)
+
+    def get_project_lookup(self):
+        """Return the lookup resolving project IDs to projects
+
+        The lookup is shared by the commands, so a project is fetched at
+        most once per process.
+        """
+        if self._project_lookup is None:
+            self._project_lookup = project_cache.ProjectLookup(
+                self._get_project,
+                ttl=self.project_cache_ttl,
+                scope=self._cli_options.config.get('auth', {}).get('auth_url'),
+            )
+        return self._project_lookup
+
+    @property
+    def image_cache_ttl(self):
+        """Number of seconds the image property index is cached on disk"""
+        ttl = self._cli_options.config.get('image_cache_ttl')
+        if ttl is None:
+            return image_cache.DEFAULT_TTL
+        return int(ttl)
+
+    def get_image_index(self):
+        """Return the index finding images by property
+
+        The images visible depend on the project, so the index is stored
+        per authentication URL and project.
+        """
+        if self._image_index is None:
+            ttl = self.image_cache_ttl
+            auth_url = self._cli_options.config.get('auth', {}).get('auth_url')
+            scope = None
+            if ttl > 0 and auth_url:
+                auth_ref = self.auth_ref
+                if auth_ref and auth_ref.project_id:
+                    scope = '%s %s' % (auth_url, auth_ref.project_id)
+            self._image_index = image_cache.ImagePropertyIndex(
+                lambda **query: self.image.images(**query),
+                lambda image_id: self.image.find_image(
+                    image_id, ignore_missing=True
+                ),
+                ttl=ttl,
+                scope=scope,
+            )
+        return self._image_index
+
+    @property
+    def resolution_cache_ttl(self):
+        """Number of seconds the IDs of the names resolved are cached"""
+        ttl = self._cli_options.config.get('resolution_cache_ttl')
+        if ttl is None:
+            return resolution_cache.DEFAULT_TTL
+        return int(ttl)
+
+    def get_resolution_cache(self):
+        """Return the cache of the IDs of the resources found by name
+
+        The cache is bound to the session, it is ``None`` before the
+        authentication is set up.
+        """
+        session = getattr(self, 'session', None)
+        if session is None:
+            return None
+        return resolution_cache.get_cache(
+            session, ttl=self.resolution_cache_ttl
+        )
+
+    def find_resource_id(self, proxy, resource, name_or_id, **attrs):
+        """Return the ID of a resource found with an openstacksdk proxy
+
+        The IDs found by name are cached, see
+        :func:`resolution_cache.find_sdk_resource_id`.
+        """
+        return resolution_cache.find_sdk_resource_id(
+            self.get_resolution_cache(), proxy, resource, name_or_id, **attrs
+        )
+
+    def find_resource(self, proxy, resource, name_or_id, **attrs):
+        """Return a resource found with an openstacksdk proxy
+
+        The IDs found by name are cached and the resource is fetched by ID,
+        see :func:`resolution_cache.find_sdk_resource`.
+        """
+        return resolution_cache.find_sdk_resource(
+            self.get_resolution_cache(), proxy, resource, name_or_id, **attrs
+        )
+
+    @property
+    def token_cache_enabled(self):
+        """Check if the on-disk token cache is enabled"""
+        return strutils.bool_from_string(
+            self._cli_options.config.get('token_cache')
+        )
+
+    @property
+    def auth_ref(self):
+        """Dereference will trigger an auth if it hasn't already
+
+        With the token cache enabled, a cached token is used instead of
+        authenticating when there is one.
+        """
+        if (
+            not self._auth_required
+            or self._auth_ref
+            or not self.token_cache_enabled
+        ):
+            return super(ClientManager, self).auth_ref
+
+        self.setup_auth()
+        self._token_cache = token_cache.TokenCache(self.auth)
+        with self._token_cache.lock():
+            if self._token_cache.load():
+                self._auth_ref = self.auth.auth_ref
+            else:
+                self._auth_ref = self.auth.get_auth_ref(self.session)
+                self.auth.auth_ref = self._auth_ref
+                self._token_cache.save()
+        return self._auth_ref
+
+    def update_token_cache(self):
+        """Store the token again if it changed while running a command
+
+        The session fetches a new token when a request is rejected, for
+        example because the cached token was revoked.
+        """
+        if self._token_cache is not None:
+            self._token_cache.save()
 
     def _fallback_load_auth_plugin(self, e):
         # NOTES(RuiChen): Hack to avoid auth plugins choking on data they don't
@@ -0,0 +1,215 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Persistent index of the command entry points
+
+Loading a command group through stevedore imports every module providing a
+command in that group, so a single ``openstack server list`` used to import
+the implementation of every command of every loaded API.  The index records
+the ``module:Class`` target of each command so that the command manager can
+register lightweight entry points and only import the command that is
+actually run.
+"""
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import sys
+
+from osc_lib.command import commandmanager
+
+import openstackclient
+from openstackclient.common import cache
+
+
+LOG = logging.getLogger(__name__)
+
+INDEX_FILE = 'command-index.json'
+
+# Bump when the layout of the index file changes
+INDEX_FORMAT = 1
+
+# Only entry point groups in this namespace are indexed
+GROUP_PREFIX = 'openstack.'
+
+
+def _get_stamp():
+    """Return a value that changes whenever installed packages change
+
+    Installing, upgrading or removing a distribution adds or removes its
+    metadata directory, which updates the modification time of the
+    containing ``sys.path`` entry.  This is the same heuristic used by
+    stevedore for its own entry point cache.
+    """
+    stamp = hashlib.sha256()
+    stamp.update(sys.version.encode('utf-8'))
+    stamp.update(str(openstackclient.__version__).encode('utf-8'))
+    for path in sys.path:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
+        stamp.update(('%s:%s\n' % (path, mtime)).encode('utf-8'))
+    return stamp.hexdigest()
+
+
+def _scan_entry_points():
+    """Collect the ``openstack.*`` entry points of installed distributions
+
+    :returns: a tuple of the entry points, as a dict mapping group names to
+        a list of ``[name, value]`` pairs, and a dict mapping the name of
+        each contributing distribution to its version
+    """
+    groups = {}
+    distributions = {}
+    seen = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata['Name']
+        # Only the first distribution found on sys.path is importable
+        if not name or name.lower() in seen:
+            continue
+        seen.add(name.lower())
+
+        found = False
+        for ep in dist.entry_points:
+            if not ep.group.startswith(GROUP_PREFIX):
+                continue
+            groups.setdefault(ep.group, []).append([ep.name, ep.value])
+            found = True
+        if found:
+            distributions[name] = dist.version
+
+    for entries in groups.values():
+        entries.sort()
+    return groups, distributions
+
+
+def _hash_entry_points(groups):
+    digest = hashlib.sha256()
+    for group in sorted(groups):
+        for name, value in groups[group]:
+            digest.update(('%s:%s=%s\n' % (group, name, value)).encode())
+    return digest.hexdigest()
+
+
+class CommandIndex(object):
+    """On-disk index of the command entry points
+
+    The index is rebuilt, and rewritten, whenever the installed packages
+    change.
+
+    :param path: Location of the index file, defaults to a file in the
+        client cache directory
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache.get_cache_path(INDEX_FILE)
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def _load(self):
+        stamp = _get_stamp()
+        data = cache.read_json(self.path)
+        if (
+            isinstance(data, dict)
+            and data.get('format') == INDEX_FORMAT
+            and data.get('stamp') == stamp
+        ):
+            LOG.debug('Using command index %s', self.path)
+            return data
+
+        LOG.debug('Rebuilding command index %s', self.path)
+        groups, distributions = _scan_entry_points()
+        data = {
+            'format': INDEX_FORMAT,
+            'stamp': stamp,
+            'distributions': distributions,
+            'entry_points_hash': _hash_entry_points(groups),
+            'groups': groups,
+        }
+        cache.write_json(self.path, data)
+        return data
+
+    def get_entry_points(self, group):
+        """Return the entry points registered in a group
+
+        :param group: Name of the entry point group
+        :returns: a list of :class:`importlib.metadata.EntryPoint`, which
+            are only imported when loaded
+        """
+        return [
+            importlib.metadata.EntryPoint(name, value, group)
+            for name, value in self.data['groups'].get(group, [])
+        ]
+
+
+class CommandManager(commandmanager.CommandManager):
+    """Command manager registering commands from the command index
+
+    Commands are looked up in the :class:`CommandIndex` instead of being
+    loaded through stevedore, which defers importing the command modules
+    until a command is found.  If the index is not usable the regular
+    stevedore loading is used.
+    """
+
+    def __init__(self, namespace, convert_underscores=True, index=None):
+        self.index = index if index is not None else CommandIndex()
+        super(CommandManager, self).__init__(
+            namespace,
+            convert_underscores=convert_underscores,
+        )
+
+    def _get_entry_points(self, group):
+        try:
+            return self.index.get_entry_points(group)
+        except Exception as e:
+            LOG.debug('Command index unavailable: %s', e)
+            return None
+
+    def _cmd_name(self, name):
+        if self.convert_underscores:
+            return name.replace('_', ' ')
+        return name
+
+    def load_commands(self, namespace):
+        entry_points = self._get_entry_points(namespace)
+        if entry_points is None:
+            return super(CommandManager, self).load_commands(namespace)
+
+        self.group_list.append(namespace)
+        ignored_modules = getattr(self, 'ignored_modules', ())
+        for ep in entry_points:
+            LOG.debug('found command %r', ep.name)
+            module_name = ep.value.split(':')[0].strip()
+            if ignored_modules and self._is_module_ignored(
+                module_name, ignored_modules
+            ):
+                LOG.debug(
+                    'extension found in ignored module %r: skipping',
+                    module_name,
+                )
+                continue
+            self.commands[self._cmd_name(ep.name)] = ep
+
+    def get_command_names(self, group=None):
+        if group is not None:
+            entry_points = self._get_entry_points(group)
+            if entry_points is not None:
+                return [self._cmd_name(ep.name) for ep in entry_points]
+        return super(CommandManager, self).get_command_names(group)
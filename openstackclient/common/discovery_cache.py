@@ -0,0 +1,157 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""On-disk cache of the API version discovery documents
+
+keystoneauth fetches the version document of an endpoint the first time a
+client needs its versions or microversions, and keeps it in the discovery
+cache of the session.  That cache only lives as long as the process, so
+every invocation fetches the documents again.
+
+:class:`DiscoveryCache` replaces the discovery cache of the session and
+stores the documents, keyed by their URL, for a limited time.
+"""
+
+import logging
+import time
+
+from keystoneauth1 import discover
+
+from openstackclient.common import cache
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_FILE = 'discovery.json'
+
+CACHE_FORMAT = 1
+
+# Seconds a version document is used before being fetched again
+DEFAULT_TTL = 3600
+
+
+class _CachedDiscover(discover.Discover):
+    """Discovery object built from a stored version document"""
+
+    def __init__(self, url, data):
+        self._url = url
+        self._data = data
+
+
+class DiscoveryCache(object):
+    """Discovery cache of a keystoneauth session, persisted on disk
+
+    Only the ``get()`` and item assignment of a dict are used by
+    keystoneauth.
+
+    :param ttl: Number of seconds a version document is used
+    :param path: Path of the cache file, defaults to a file in the client
+        cache directory
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, path=None):
+        self.ttl = ttl
+        self.path = path or cache.get_cache_path(CACHE_FILE)
+        # url -> (timestamp, discover.Discover)
+        self._entries = {}
+        self._stored = None
+        self._refresh = False
+
+    def _read(self):
+        data = cache.read_json(self.path)
+        if not isinstance(data, dict) or data.get('format') != CACHE_FORMAT:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def _is_fresh(self, timestamp):
+        return 0 <= time.time() - timestamp < self.ttl
+
+    def _get_stored(self, url):
+        if self._refresh:
+            return None
+        if self._stored is None:
+            self._stored = self._read()
+        stored = self._stored.get(url)
+        if not stored:
+            return None
+        try:
+            return (
+                float(stored['timestamp']),
+                _CachedDiscover(url, list(stored['versions'])),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            LOG.debug('Ignoring invalid discovery cache entry: %s', e)
+            return None
+
+    def get(self, url, default=None):
+        entry = self._entries.get(url) or self._get_stored(url)
+        if entry is None or not self._is_fresh(entry[0]):
+            return default
+        if url not in self._entries:
+            LOG.debug('Using cached version discovery for %s', url)
+            self._entries[url] = entry
+        return entry[1]
+
+    def __getitem__(self, url):
+        disc = self.get(url)
+        if disc is None:
+            raise KeyError(url)
+        return disc
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    def __setitem__(self, url, disc):
+        entry = self._entries.get(url)
+        if entry is not None and entry[1] is disc:
+            # keystoneauth stores the object it just found again
+            return
+        timestamp = time.time()
+        self._entries[url] = (timestamp, disc)
+        self._store(url, timestamp, disc)
+
+    def _store(self, url, timestamp, disc):
+        # Merge with the entries other invocations may have stored since
+        # the file was read
+        entries = dict(
+            (u, e)
+            for u, e in self._read().items()
+            if isinstance(e, dict)
+            and isinstance(e.get('timestamp'), (int, float))
+            and self._is_fresh(e['timestamp'])
+        )
+        entries[url] = {
+            'timestamp': timestamp,
+            'versions': disc.raw_version_data(
+                allow_experimental=True, allow_unknown=True
+            ),
+        }
+        cache.write_json(
+            self.path, {'format': CACHE_FORMAT, 'entries': entries}
+        )
+        self._stored = entries
+
+    def update(self, entries):
+        """Add discovery objects already fetched, without storing them"""
+        timestamp = time.time()
+        for url, disc in entries.items():
+            self._entries.setdefault(url, (timestamp, disc))
+
+    def refresh(self):
+        """Ignore the cached documents and fetch them again
+
+        The documents fetched from now on replace the stored ones.
+        """
+        self._entries.clear()
+        self._refresh = True
@@ -0,0 +1,209 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Find images by property
+
+``server create --image-property`` looks for the images having the given
+properties.  The Image service only filters listings on a few attributes,
+the other properties are compared client side, which requires listing every
+image.  :class:`ImagePropertyIndex` can index the images by property value
+and store the index on disk for a limited time, so that later invocations
+do not list the images again.
+"""
+
+import logging
+import time
+
+from openstackclient.common import cache
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_FILE = 'images.json'
+
+CACHE_FORMAT = 1
+
+# Seconds the image index is stored on disk, the on-disk cache is disabled by
+# default
+DEFAULT_TTL = 0
+
+# Image attributes the Image service filters listings on, with the values it
+# accepts when it only accepts some
+QUERY_FILTERS = {
+    'name': None,
+    'owner': None,
+    'visibility': ('public', 'private', 'shared', 'community'),
+}
+
+
+def get_properties(image):
+    """Return the attributes and properties of an image with a string value
+
+    The values given on the command line are strings, the other values
+    cannot match them.
+    """
+    items = list(image.items())
+    if image.properties:
+        items.extend(image.properties.items())
+    return {k: v for k, v in items if isinstance(v, str)}
+
+
+def has_properties(image, properties):
+    """Check if an image has all the given property values"""
+    image_properties = get_properties(image)
+    return all(image_properties.get(k) == v for k, v in properties.items())
+
+
+class ImagePropertyIndex(object):
+    """Index of the images by property value, optionally stored on disk
+
+    :param list_images: Function returning the images, accepting the query
+        filters of the image listing as keyword arguments
+    :param get_image: Function returning the image with the given ID, or
+        ``None`` if it does not exist
+    :param ttl: Number of seconds the index is stored on disk, 0 disables the
+        index, the matching images are then listed on each lookup
+    :param scope: Identifier of the images in the cache file, usually the
+        authentication URL and the project ID, the index is disabled without
+        one
+    :param path: Path of the cache file, defaults to a file in the client
+        cache directory
+    """
+
+    def __init__(
+        self, list_images, get_image, ttl=DEFAULT_TTL, scope=None, path=None
+    ):
+        self._list_images = list_images
+        self._get_image = get_image
+        self.ttl = ttl if scope else 0
+        self.scope = scope
+        self.path = path or cache.get_cache_path(CACHE_FILE)
+        self._index = None
+        # Images listed by this process, by ID
+        self._images = {}
+
+    def _read(self):
+        data = cache.read_json(self.path)
+        if not isinstance(data, dict) or data.get('format') != CACHE_FORMAT:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def _is_fresh(self, index):
+        try:
+            return (
+                0 <= time.time() - float(index['timestamp']) < self.ttl
+                and isinstance(index['ids'], list)
+                and isinstance(index['properties'], dict)
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            LOG.debug('Ignoring invalid image cache entry: %s', e)
+            return False
+
+    def _load(self):
+        index = self._read().get(self.scope)
+        if index is not None and self._is_fresh(index):
+            return index
+        return None
+
+    def _build(self):
+        images = list(self._list_images())
+        self._images = {image.id: image for image in images}
+
+        properties = {}
+        for position, image in enumerate(images):
+            for name, value in get_properties(image).items():
+                values = properties.setdefault(name, {})
+                values.setdefault(value, []).append(position)
+        index = {
+            'timestamp': time.time(),
+            'ids': [image.id for image in images],
+            'properties': properties,
+        }
+
+        # Keep the indexes of the other scopes that are still fresh
+        entries = {
+            scope: entry
+            for scope, entry in self._read().items()
+            if isinstance(entry, dict) and self._is_fresh(entry)
+        }
+        entries[self.scope] = index
+        cache.write_json(
+            self.path, {'format': CACHE_FORMAT, 'entries': entries}
+        )
+        return index
+
+    @staticmethod
+    def _match(index, properties):
+        candidates = sorted(
+            (
+                index['properties'].get(name, {}).get(value, [])
+                for name, value in properties.items()
+            ),
+            key=len,
+        )
+        if not candidates:
+            return list(index['ids'])
+        positions = candidates[0]
+        for other in candidates[1:]:
+            other = set(other)
+            positions = [p for p in positions if p in other]
+        return [index['ids'][p] for p in positions]
+
+    def _find_listed(self, properties):
+        query = {
+            name: value
+            for name, value in properties.items()
+            if name in QUERY_FILTERS
+            and (QUERY_FILTERS[name] is None or value in QUERY_FILTERS[name])
+        }
+        images = [
+            image
+            for image in self._list_images(**query)
+            if has_properties(image, properties)
+        ]
+        return [image.id for image in images], images[0] if images else None
+
+    def find(self, properties):
+        """Return the images having the given property values
+
+        Without the index, the images are listed with the properties the
+        Image service filters on, and the others are compared client side.
+        With the index, the images are only listed when the stored index
+        expired, or references an image that no longer exists or no longer
+        has the given properties.
+
+        :param properties: Dict of the wanted property values
+        :returns: A tuple of the IDs of the matching images, in listing
+            order, and the first matching image or ``None``
+        """
+        if self.ttl <= 0:
+            return self._find_listed(properties)
+
+        if self._index is None:
+            self._index = self._load() or self._build()
+        image_ids = self._match(self._index, properties)
+        if not image_ids:
+            return image_ids, None
+
+        image = self._images.get(image_ids[0])
+        if image is None:
+            image = self._get_image(image_ids[0])
+            if image is not None:
+                self._images[image.id] = image
+        if image is None or not has_properties(image, properties):
+            # The stored index is out of date
+            self._index = self._build()
+            image_ids = self._match(self._index, properties)
+            image = self._images[image_ids[0]] if image_ids else None
+        return image_ids, image
@@ -0,0 +1,170 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Resolve the IDs of related resources, for example to display names
+
+Listings often need the name of resources referenced by ID, such as the
+image and flavor of servers.  :class:`ResourceLookup` fetches them with as
+few requests as possible, sent concurrently, and remembers the results so
+the same resource is not fetched twice.
+"""
+
+import logging
+
+from openstackclient.common import parallel
+
+
+LOG = logging.getLogger(__name__)
+
+# Maximum length of the IDs joined in a single "in:" filter.  Apache
+# accepts URLs of up to 8190 characters by default, this leaves room for the
+# endpoint and the other query parameters.
+MAX_FILTER_LENGTH = 4000
+
+
+def chunk_ids(ids, max_length=None):
+    """Split IDs in lists short enough to be used in a filter
+
+    :param ids: Iterable of IDs
+    :param max_length: Maximum length of the IDs of a list joined with
+        commas, defaults to :data:`MAX_FILTER_LENGTH`
+    :returns: A list of lists of IDs
+    """
+    if max_length is None:
+        max_length = MAX_FILTER_LENGTH
+    chunks = []
+    chunk = []
+    length = 0
+    for resource_id in ids:
+        # account for the separator
+        if chunk and length + 1 + len(resource_id) > max_length:
+            chunks.append(chunk)
+            chunk = []
+            length = 0
+        length += len(resource_id) + (1 if chunk else 0)
+        chunk.append(resource_id)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def in_filter(ids):
+    """Return the value of an "in:" filter on IDs"""
+    return 'in:%s' % ','.join(ids)
+
+
+class ResourceLookup(object):
+    """Resolve resource IDs to resources, remembering the results
+
+    Resources are fetched in bulk with ``list_resources`` when it is given,
+    and one by one with ``get_resource`` otherwise, or for the IDs of a bulk
+    request that failed.  Lookup failures are ignored: the resources that
+    could not be found are missing from the results.
+
+    :param get_resource: Function returning the resource with the given ID
+    :param list_resources: Function returning the resources among a list of
+        IDs, it may return other resources as well
+    :param chunked: Whether ``list_resources`` must be called with lists of
+        IDs short enough for an "in:" filter, see :func:`chunk_ids`
+    """
+
+    def __init__(self, get_resource=None, list_resources=None, chunked=True):
+        self.get_resource = get_resource
+        self.list_resources = list_resources
+        self.chunked = chunked
+        # ID -> resource, or None when the lookup failed
+        self._resources = {}
+        # IDs resolved on the first access to the resources, see defer()
+        self._deferred = []
+
+    def __getitem__(self, resource_id):
+        self._resolve_deferred()
+        return self._resources[resource_id]
+
+    def get(self, resource_id, default=None):
+        self._resolve_deferred()
+        resource = self._resources.get(resource_id)
+        return default if resource is None else resource
+
+    def _get(self, resource_id):
+        try:
+            self._resources[resource_id] = self.get_resource(resource_id)
+        except Exception as e:
+            LOG.debug('Unable to get resource %s: %s', resource_id, e)
+            self._resources[resource_id] = None
+        return []
+
+    def _list(self, ids):
+        try:
+            for resource in self.list_resources(ids):
+                self._resources[resource.id] = resource
+        except Exception as e:
+            LOG.debug('Unable to list resources: %s', e)
+            if self.get_resource is not None:
+                return [(self._get, resource_id) for resource_id in ids]
+        for resource_id in ids:
+            self._resources.setdefault(resource_id, None)
+        return []
+
+    def _get_tasks(self, ids):
+        ids = [i for i in dict.fromkeys(ids) if i not in self._resources]
+        if not ids:
+            return []
+        if self.list_resources is None:
+            return [(self._get, resource_id) for resource_id in ids]
+        if not self.chunked:
+            return [(self._list, ids)]
+        return [(self._list, chunk) for chunk in chunk_ids(ids)]
+
+    def defer(self, ids):
+        """Resolve IDs on the first access to the resources
+
+        The IDs are fetched together the first time a resource is requested,
+        so no request is made when the resources end up not being used, for
+        example when a column is not displayed.
+
+        :param ids: Iterable of IDs
+        """
+        self._deferred.extend(ids)
+
+    def _resolve_deferred(self):
+        if self._deferred:
+            ids, self._deferred = self._deferred, []
+            self.resolve(ids)
+
+    def resolve(self, ids, workers=parallel.DEFAULT_WORKERS):
+        """Fetch the resources that were not looked up yet
+
+        :param ids: Iterable of IDs
+        :param workers: Maximum number of concurrent requests
+        """
+        resolve([(self, ids)], workers=workers)
+
+
+def resolve(lookups, workers=parallel.DEFAULT_WORKERS):
+    """Resolve IDs with several lookups sharing a pool of threads
+
+    :param lookups: List of ``(lookup, ids)`` tuples, where ``lookup`` is a
+        :class:`ResourceLookup` and ``ids`` an iterable of IDs to resolve
+    :param workers: Maximum number of concurrent requests
+    """
+    tasks = []
+    for lookup, ids in lookups:
+        tasks.extend(lookup._get_tasks(ids))
+
+    while tasks:
+        # Bulk requests that fail return one-by-one fallbacks
+        results = parallel.run(
+            lambda task: task[0](task[1]), tasks, workers=workers
+        )
+        tasks = [task for result in results for task in result]
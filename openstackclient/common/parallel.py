@@ -0,0 +1,146 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers to make independent API requests concurrently
+
+The requests are sent from a pool of threads sharing the session of the
+client manager.
+"""
+
+import collections
+from concurrent import futures
+import itertools
+import queue
+import threading
+
+
+# Maximum number of requests sent at the same time
+DEFAULT_WORKERS = 8
+
+
+def run(func, items, workers=DEFAULT_WORKERS):
+    """Call a function for each item using a pool of threads
+
+    The calls are made in the calling thread when there is a single item or
+    a single worker.
+
+    :param func: Function called with each item
+    :param items: Iterable of items
+    :param workers: Maximum number of concurrent calls
+    :returns: The list of the results, in the order of the items
+    :raises: The first exception raised by a call, in the order of the items
+    """
+    items = list(items)
+    if len(items) <= 1 or workers <= 1:
+        return [func(item) for item in items]
+
+    with futures.ThreadPoolExecutor(min(workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def imap(func, items, workers=DEFAULT_WORKERS):
+    """Call a function for each item using a pool of threads, lazily
+
+    Unlike :func:`run`, the results are yielded as soon as they are
+    available, in the order of the items, and only ``workers`` calls are
+    made ahead of the results consumed, so long lists of items can be
+    processed while the results are written.
+
+    :param func: Function called with each item
+    :param items: Iterable of items
+    :param workers: Maximum number of concurrent calls
+    :returns: An iterator of the results, in the order of the items
+    :raises: The exception raised by a call, once the results of the
+        previous items were yielded
+    """
+    iterator = iter(items)
+    if workers <= 1:
+        for item in iterator:
+            yield func(item)
+        return
+
+    executor = futures.ThreadPoolExecutor(workers)
+    pending = collections.deque()
+    try:
+        for item in itertools.islice(iterator, workers):
+            pending.append(executor.submit(func, item))
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(iterator, 1):
+                pending.append(executor.submit(func, item))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def chain(iterables, workers=DEFAULT_WORKERS, buffer_size=2):
+    """Iterate over several iterables consumed concurrently
+
+    The items are yielded in order, all the items of the first iterable,
+    then all the items of the second one, and so on.  Each iterable is
+    consumed by a thread which stays at most ``buffer_size`` items ahead,
+    so the memory used does not depend on the length of the iterables.
+
+    :param iterables: List of iterables, usually generators making requests
+    :param workers: Maximum number of iterables consumed at the same time
+    :param buffer_size: Maximum number of items fetched ahead per iterable
+    :returns: An iterator of the items
+    :raises: The exception raised by an iterable, once its previous items
+        were yielded
+    """
+    iterables = list(iterables)
+    if len(iterables) <= 1 or workers <= 1:
+        for iterable in iterables:
+            yield from iterable
+        return
+
+    stop = threading.Event()
+    queues = [queue.Queue(buffer_size) for _ in iterables]
+
+    def _put(items, value):
+        # Give up when the caller stops iterating
+        while not stop.is_set():
+            try:
+                items.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _consume(iterable, items):
+        try:
+            for item in iterable:
+                if not _put(items, (True, item)):
+                    return
+        except Exception as e:
+            _put(items, (False, e))
+        else:
+            _put(items, (False, None))
+
+    executor = futures.ThreadPoolExecutor(min(workers, len(iterables)))
+    try:
+        for iterable, items in zip(iterables, queues):
+            executor.submit(_consume, iterable, items)
+        for items in queues:
+            while True:
+                more, value = items.get()
+                if not more:
+                    if value is not None:
+                        raise value
+                    break
+                yield value
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
@@ -0,0 +1,131 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Resolve project IDs to project names
+
+Listings such as ``usage list`` display the name of the projects they
+reference.  Listing every project to find them is slow on clouds with many
+projects, :class:`ProjectLookup` only fetches the referenced projects,
+concurrently, and remembers them for the life of the process.  The names can
+also be stored on disk for a limited time to be reused by later invocations.
+"""
+
+import collections
+import logging
+import time
+
+from openstackclient.common import cache
+from openstackclient.common import lookup
+from openstackclient.common import parallel
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_FILE = 'projects.json'
+
+CACHE_FORMAT = 1
+
+# Seconds a project name is stored on disk, the on-disk cache is disabled by
+# default
+DEFAULT_TTL = 0
+
+# Project built from a stored name
+Project = collections.namedtuple('Project', ['id', 'name'])
+
+
+class ProjectLookup(lookup.ResourceLookup):
+    """Lookup of projects by ID, optionally stored on disk
+
+    :param get_project: Function returning the project with the given ID
+    :param ttl: Number of seconds the project names are stored on disk, 0
+        disables the on-disk cache
+    :param scope: Identifier of the cloud the projects belong to in the cache
+        file, usually the authentication URL, the on-disk cache is disabled
+        without one
+    :param path: Path of the cache file, defaults to a file in the client
+        cache directory
+    """
+
+    def __init__(self, get_project, ttl=DEFAULT_TTL, scope=None, path=None):
+        super().__init__(get_resource=get_project)
+        self.ttl = ttl if scope else 0
+        self.scope = scope
+        self.path = path or cache.get_cache_path(CACHE_FILE)
+
+    def _read(self):
+        data = cache.read_json(self.path)
+        if not isinstance(data, dict) or data.get('format') != CACHE_FORMAT:
+            return {}
+        entries = data.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def _get_fresh(self, entries):
+        stored = entries.get(self.scope)
+        if not isinstance(stored, dict):
+            return {}
+        now = time.time()
+        fresh = {}
+        for project_id, entry in stored.items():
+            try:
+                if 0 <= now - float(entry['timestamp']) < self.ttl:
+                    fresh[project_id] = entry
+            except (KeyError, TypeError, ValueError) as e:
+                LOG.debug('Ignoring invalid project cache entry: %s', e)
+        return fresh
+
+    def _load(self, ids):
+        stored = self._get_fresh(self._read())
+        for project_id in ids:
+            entry = stored.get(project_id)
+            if entry is not None:
+                self._resources[project_id] = Project(
+                    project_id, entry.get('name')
+                )
+
+    def _store(self, ids):
+        timestamp = time.time()
+        # Merge with the entries other invocations may have stored since
+        # the file was read
+        entries = self._read()
+        stored = self._get_fresh(entries)
+        for project_id in ids:
+            project = self._resources.get(project_id)
+            if project is not None:
+                stored[project_id] = {
+                    'timestamp': timestamp,
+                    'name': project.name,
+                }
+        entries[self.scope] = stored
+        cache.write_json(
+            self.path, {'format': CACHE_FORMAT, 'entries': entries}
+        )
+
+    def resolve(self, ids, workers=parallel.DEFAULT_WORKERS):
+        """Fetch the projects that were not looked up yet
+
+        With the on-disk cache enabled, the stored names are used first and
+        the names of the projects fetched are stored.
+
+        :param ids: Iterable of project IDs
+        :param workers: Maximum number of concurrent requests
+        """
+        ids = [i for i in dict.fromkeys(ids) if i and i not in self._resources]
+        if self.ttl <= 0:
+            super().resolve(ids, workers=workers)
+            return
+
+        self._load(ids)
+        missing = [i for i in ids if i not in self._resources]
+        if missing:
+            super().resolve(missing, workers=workers)
+            self._store(missing)
@@ -23,6 +23,8 @@ import sys
 from osc_lib.command import command
 from osc_lib import utils
 
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 from openstackclient.i18n import _
 from openstackclient.network import common
 
@@ -102,6 +104,42 @@ def _xform_get_quota(data, value, keys):
     return res
 
 
+def _list_quotas(project_ids, get_quota, get_default, keys, is_not_found):
+    """Yield the quotas of the projects which are not at the defaults
+
+    The defaults are the same for all the projects, they are fetched once.
+    The quotas of the projects are fetched concurrently and yielded in the
+    order of the projects as soon as they are available.
+
+    :param project_ids: IDs of the projects
+    :param get_quota: Function returning the quotas of a project
+    :param get_default: Function returning the default quotas of a project
+    :param keys: Names of the quotas
+    :param is_not_found: Function telling whether an exception raised by
+        ``get_quota`` means the project does not exist
+    """
+    if not project_ids:
+        return
+    default = _xform_get_quota(get_default(project_ids[0]), None, keys)[0]
+
+    def _get(project_id):
+        try:
+            return get_quota(project_id)
+        except Exception as ex:
+            if is_not_found(ex):
+                # Project not found, move on to next one
+                LOG.warning("Project %s not found: %s" % (project_id, ex))
+                return None
+            raise
+
+    for project_id, data in zip(project_ids, parallel.imap(_get, project_ids)):
+        if data is None:
+            continue
+        result = _xform_get_quota(data, project_id, keys)[0]
+        if dict(result, id=None) != default:
+            yield result
+
+
 def get_project(app, project):
     if project is not None:
         identity_client = app.client_manager.identity
@@ -341,6 +379,11 @@ class ListQuota(command.Lister):
             (utils.get_dict_properties(s, columns) for s in result),
         )
 
+    def produce_output(self, parsed_args, column_names, data):
+        # The quotas of the projects are written as they are fetched
+        self.formatter = streaming.get_formatter(self.formatter)
+        return super().produce_output(parsed_args, column_names, data)
+
     def take_action(self, parsed_args):
         if parsed_args.detail:
             msg = _(
@@ -355,7 +398,6 @@ class ListQuota(command.Lister):
             )
             self.log.warning(msg)
 
-        result = []
         project_ids = []
         if parsed_args.project is None:
             for p in self.app.client_manager.identity.projects.list():
@@ -373,34 +415,17 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             compute_client = self.app.client_manager.compute
-            for p in project_ids:
-                try:
-                    data = compute_client.quotas.get(p)
-                except Exception as ex:
-                    if (
-                        type(ex).__name__ == 'NotFound'
-                        or ex.http_status >= 400
-                        and ex.http_status <= 499
-                    ):
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    COMPUTE_QUOTAS.keys(),
-                )
-                default_data = compute_client.quotas.defaults(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    COMPUTE_QUOTAS.keys(),
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = _list_quotas(
+                project_ids,
+                compute_client.quotas.get,
+                compute_client.quotas.defaults,
+                COMPUTE_QUOTAS.keys(),
+                lambda ex: (
+                    type(ex).__name__ == 'NotFound'
+                    or ex.http_status >= 400
+                    and ex.http_status <= 499
+                ),
+            )
 
             columns = (
                 'id',
@@ -440,30 +465,13 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             volume_client = self.app.client_manager.volume
-            for p in project_ids:
-                try:
-                    data = volume_client.quotas.get(p)
-                except Exception as ex:
-                    if type(ex).__name__ == 'NotFound':
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    VOLUME_QUOTAS.keys(),
-                )
-                default_data = volume_client.quotas.defaults(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    VOLUME_QUOTAS.keys(),
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = _list_quotas(
+                project_ids,
+                volume_client.quotas.get,
+                volume_client.quotas.defaults,
+                VOLUME_QUOTAS.keys(),
+                lambda ex: type(ex).__name__ == 'NotFound',
+            )
 
             columns = (
                 'id',
@@ -494,30 +502,13 @@ class ListQuota(command.Lister):
                 return self._get_detailed_quotas(parsed_args)
 
             client = self.app.client_manager.network
-            for p in project_ids:
-                try:
-                    data = client.get_quota(p)
-                except Exception as ex:
-                    if type(ex).__name__ == 'NotFound':
-                        # Project not found, move on to next one
-                        LOG.warning("Project %s not found: %s" % (p, ex))
-                        continue
-                    else:
-                        raise
-
-                result_data = _xform_get_quota(
-                    data,
-                    p,
-                    NETWORK_KEYS,
-                )
-                default_data = client.get_quota_default(p)
-                result_default = _xform_get_quota(
-                    default_data,
-                    p,
-                    NETWORK_KEYS,
-                )
-                if result_default != result_data:
-                    result += result_data
+            result = _list_quotas(
+                project_ids,
+                client.get_quota,
+                client.get_quota_default,
+                NETWORK_KEYS,
+                lambda ex: type(ex).__name__ == 'NotFound',
+            )
 
             columns = (
                 'id',
@@ -0,0 +1,249 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Cache of the IDs of the resources found by name
+
+Commands turn the names given on the command line into IDs with at least one
+request, often a listing when the name is not an ID.  In batch or interactive
+mode, the same names are resolved by command after command.  A
+:class:`ResolutionCache` remembers the ID found for each name, and the names
+that were not found, for a few seconds.
+
+Only IDs are cached: the resources themselves are fetched again by ID when a
+command needs them, so that they are never outdated.  Names that are UUIDs
+are not cached, they are looked up directly.
+
+The cache is used through the ``find_resource`` and ``find_resource_id``
+methods of the client manager, by the commands resolving servers and
+networks, and by the identity ``find_*`` helpers.
+"""
+
+import logging
+import threading
+import time
+import weakref
+
+from openstack import exceptions as sdk_exceptions
+from oslo_utils import uuidutils
+
+
+LOG = logging.getLogger(__name__)
+
+# Default number of seconds a name is cached
+DEFAULT_TTL = 60
+
+# Caches by session, so that the clients sharing a session share a cache
+_caches = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+# Prefixes of the names of the command classes that create, delete or rename
+# resources, the cache is cleared after they run
+CHANGING_COMMANDS = ('Create', 'Delete', 'Set', 'Unset')
+
+
+class ResolutionCache(object):
+    """IDs of the resources found by name, and the names not found
+
+    The cache is shared by the commands run concurrently in batch mode, it
+    is safe to use from several threads.
+
+    :param ttl: Number of seconds the names are cached, 0 disables the cache
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        # Incremented by clear(), so that the lookups running while the cache
+        # is cleared do not store their outdated result
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, key, find, not_found=()):
+        """Return the ID with the given key, finding it once
+
+        :param key: Hashable key of the resource, usually the service, the
+            resource type, the name and the scope of the name
+        :param find: Function returning the ID of the resource
+        :param not_found: Exception classes raised by ``find`` when there
+            is no such resource, they are cached and raised again
+        :returns: The ID returned by ``find``
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+                generation = self._generation
+        if entry is None:
+            try:
+                entry = (now + self.ttl, True, find())
+            except not_found as e:
+                entry = (now + self.ttl, False, e)
+            if self.ttl > 0:
+                with self._lock:
+                    if self._generation == generation:
+                        self._entries[key] = entry
+        _expires, found, value = entry
+        if not found:
+            raise value
+        return value
+
+    def discard(self, key):
+        """Forget the ID of a resource, when it no longer exists"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Forget all the IDs, after a command changed some resources"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def log_stats(self):
+        """Log the number of cache hits and misses, shown with --debug"""
+        if self.hits or self.misses:
+            LOG.debug(
+                'Name resolution cache: %(hits)d hits, %(misses)d misses',
+                {'hits': self.hits, 'misses': self.misses},
+            )
+
+
+def find_id(cache, key, name_or_id, find, not_found=()):
+    """Return the ID of the resource with the given name or ID
+
+    :param cache: The :class:`ResolutionCache` to use, or ``None``
+    :param key: Hashable key of the name, see :meth:`ResolutionCache.resolve`
+    :param name_or_id: The name or ID of the resource
+    :param find: Function returning the resource with a given name or ID
+    :param not_found: Exception classes raised by ``find`` when there is no
+        such resource
+    """
+    if cache is None or uuidutils.is_uuid_like(name_or_id):
+        return find(name_or_id).id
+    return cache.resolve(key, lambda: find(name_or_id).id, not_found)
+
+
+def find_resource(cache, key, name_or_id, find, get, not_found=()):
+    """Return the resource with the given name or ID
+
+    The resource is always fetched by ID, only the ID found for its name is
+    cached.
+
+    :param cache: The :class:`ResolutionCache` to use, or ``None``
+    :param key: Hashable key of the name, see :meth:`ResolutionCache.resolve`
+    :param name_or_id: The name or ID of the resource
+    :param find: Function returning the resource with a given name or ID
+    :param get: Function returning the resource with a given ID
+    :param not_found: Exception classes raised by ``find`` and ``get`` when
+        there is no such resource
+    """
+    if cache is None or uuidutils.is_uuid_like(name_or_id):
+        return find(name_or_id)
+
+    found = []
+
+    def _find_id():
+        found.append(find(name_or_id))
+        return found[0].id
+
+    resource_id = cache.resolve(key, _find_id, not_found)
+    if found:
+        # The resource was just found, there is no need to fetch it again
+        return found[0]
+    try:
+        return get(resource_id)
+    except not_found:
+        # The resource was deleted since its name was resolved
+        cache.discard(key)
+        return find(name_or_id)
+
+
+def _sdk_key(proxy, resource, name_or_id, attrs):
+    key = (
+        getattr(proxy, 'service_type', None),
+        resource,
+        name_or_id,
+        tuple(sorted(attrs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def find_sdk_resource_id(cache, proxy, resource, name_or_id, **attrs):
+    """Return the ID of a resource found with an openstacksdk proxy
+
+    :param cache: The :class:`ResolutionCache` to use, or ``None``
+    :param proxy: The openstacksdk proxy of the service
+    :param resource: The name of the resource type, the proxy has a
+        ``find_<resource>`` method
+    :param name_or_id: The name or ID of the resource
+    :param attrs: Other arguments of the ``find_<resource>`` method, such as
+        the project of the resource
+    :raises: ``openstack.exceptions.NotFoundException``
+    """
+    key = _sdk_key(proxy, resource, name_or_id, attrs)
+    return find_id(
+        cache if key is not None else None,
+        key,
+        name_or_id,
+        lambda name_or_id: getattr(proxy, 'find_%s' % resource)(
+            name_or_id, ignore_missing=False, **attrs
+        ),
+        not_found=(sdk_exceptions.NotFoundException,),
+    )
+
+
+def find_sdk_resource(cache, proxy, resource, name_or_id, **attrs):
+    """Return a resource found with an openstacksdk proxy
+
+    The resource is fetched again with the ``get_<resource>`` method of the
+    proxy when its name was cached.  The parameters are those of
+    :func:`find_sdk_resource_id`.
+
+    :raises: ``openstack.exceptions.NotFoundException``
+    """
+    key = _sdk_key(proxy, resource, name_or_id, attrs)
+    return find_resource(
+        cache if key is not None else None,
+        key,
+        name_or_id,
+        lambda name_or_id: getattr(proxy, 'find_%s' % resource)(
+            name_or_id, ignore_missing=False, **attrs
+        ),
+        getattr(proxy, 'get_%s' % resource),
+        not_found=(sdk_exceptions.NotFoundException,),
+    )
+
+
+def get_cache(session, ttl=None):
+    """Return the resolution cache of a session
+
+    :param session: The session the resources are found with
+    :param ttl: Number of seconds the names are cached, the default or the
+        current TTL of the cache when ``None``
+    """
+    with _caches_lock:
+        cache = _caches.get(session)
+        if cache is None:
+            cache = _caches[session] = ResolutionCache()
+        if ttl is not None:
+            cache.ttl = ttl
+        return cache
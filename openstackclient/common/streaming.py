@@ -0,0 +1,93 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers to output large listings as they are fetched
+
+A listing command can return its rows from a generator processing the
+resources one page at a time.  The csv and value formatters write each row
+as soon as it is produced, :func:`get_formatter` replaces the json
+formatter, which builds the whole document before writing it, with one
+writing each item as it comes.  The other formatters need all the rows
+before writing anything.
+"""
+
+import itertools
+import json
+
+from cliff import columns
+from cliff.formatters import json_format
+
+
+# Number of resources processed at a time, nova returns up to 1000
+# resources per page by default
+PAGE_SIZE = 1000
+
+
+def pages(iterable, size=None):
+    """Split an iterable in lists of at most ``size`` items
+
+    :param iterable: Iterable of resources, usually a paginated listing
+    :param size: Maximum number of items of a list, defaults to
+        :data:`PAGE_SIZE`
+    :returns: An iterator of lists
+    """
+    size = size or PAGE_SIZE
+    iterator = iter(iterable)
+    while True:
+        page = list(itertools.islice(iterator, size))
+        if not page:
+            return
+        yield page
+
+
+class JSONFormatter(json_format.JSONFormatter):
+    """JSON formatter writing each item as soon as it is available
+
+    The output is the same as the output of the json formatter.
+    """
+
+    def emit_list(self, column_names, data, stdout, parsed_args):
+        indent = None if parsed_args.noindent else 2
+        stdout.write('[')
+        empty = True
+        for row in data:
+            item = {
+                n: (
+                    i.machine_readable()
+                    if isinstance(i, columns.FormattableColumn)
+                    else i
+                )
+                for n, i in zip(column_names, row)
+            }
+            if not empty:
+                stdout.write(', ' if indent is None else ',')
+            # Let json indent the item as an element of a list
+            stdout.write(json.dumps([item], indent=indent)[1:-1].rstrip())
+            empty = False
+        if indent is not None and not empty:
+            stdout.write('\n')
+        stdout.write(']\n')
+
+
+def get_formatter(formatter):
+    """Return a formatter writing the rows of a listing as they come
+
+    :param formatter: The formatter selected for the command
+    :returns: A streaming equivalent of the formatter, or the formatter
+        itself if it needs all the rows or already writes them as they come
+    """
+    if isinstance(formatter, json_format.JSONFormatter) and not isinstance(
+        formatter, JSONFormatter
+    ):
+        return JSONFormatter()
+    return formatter
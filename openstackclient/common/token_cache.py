@@ -0,0 +1,182 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Encrypted on-disk cache of the authentication state
+
+The token and the service catalog returned by Identity are stored so that
+following invocations with the same credentials can skip authentication.
+
+Entries are identified by the cache ID of the authentication plugin, a hash
+of all of its options including the secrets, and are encrypted with a key
+derived from it.  Only someone knowing the credentials can find and decrypt
+an entry.
+"""
+
+import base64
+import contextlib
+import hashlib
+import logging
+import os
+
+from cryptography import fernet
+
+from openstackclient.common import cache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+LOG = logging.getLogger(__name__)
+
+CACHE_SUBDIR = 'tokens'
+
+# Cached tokens expiring within this many seconds are not used
+STALE_DURATION = 300
+
+
+def _derive(cache_id, purpose):
+    return hashlib.sha256(
+        ('%s:%s' % (purpose, cache_id)).encode('utf-8')
+    ).digest()
+
+
+class TokenCache(object):
+    """Cache of the authentication state of a plugin
+
+    :param auth: A keystoneauth identity plugin
+    :param directory: Directory holding the cache entries, defaults to a
+        subdirectory of the client cache directory
+    """
+
+    def __init__(self, auth, directory=None):
+        self.auth = auth
+        self.directory = directory or cache.get_cache_path(CACHE_SUBDIR)
+        self.path = None
+        self._fernet = None
+        self._token = None
+
+        try:
+            cache_id = auth.get_cache_id()
+        except Exception as e:
+            LOG.debug('Unable to get the authentication cache ID: %s', e)
+            cache_id = None
+        if cache_id:
+            self.path = os.path.join(
+                self.directory, _derive(cache_id, 'file').hex()
+            )
+            self._fernet = fernet.Fernet(
+                base64.urlsafe_b64encode(_derive(cache_id, 'key'))
+            )
+
+    @property
+    def enabled(self):
+        """Whether the plugin supports caching"""
+        return self.path is not None
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Hold an exclusive lock on the entry
+
+        Concurrent invocations wait for the first one to authenticate and
+        store the token instead of all authenticating at the same time.
+        """
+        if not self.enabled or fcntl is None:
+            yield
+            return
+
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            lock_file = open(self.path + '.lock', 'a')
+        except OSError as e:
+            LOG.debug('Unable to lock the token cache: %s', e)
+            yield
+            return
+
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self):
+        """Install the cached authentication state in the plugin
+
+        :returns: ``True`` if a valid token was found
+        """
+        if not self.enabled:
+            return False
+
+        data = cache.read_json(self.path)
+        if not data:
+            return False
+        try:
+            state = self._fernet.decrypt(data['state'].encode('ascii'))
+            self.auth.set_auth_state(state.decode('utf-8'))
+        except (
+            fernet.InvalidToken,
+            KeyError,
+            TypeError,
+            ValueError,
+            AttributeError,
+        ) as e:
+            LOG.debug('Ignoring invalid token cache entry: %s', e)
+            self.delete()
+            return False
+
+        auth_ref = self.auth.auth_ref
+        if auth_ref is None or auth_ref.will_expire_soon(STALE_DURATION):
+            LOG.debug('Cached token is about to expire')
+            self.auth.invalidate()
+            return False
+
+        LOG.debug('Using cached token from %s', self.path)
+        self._token = auth_ref.auth_token
+        return True
+
+    def save(self):
+        """Store the authentication state of the plugin
+
+        Nothing is written if the plugin still holds the token that was
+        loaded or saved last.  The entry is removed if the plugin has no
+        token anymore.
+        """
+        if not self.enabled:
+            return
+
+        auth_ref = self.auth.auth_ref
+        if auth_ref is None:
+            if self._token is not None:
+                self.delete()
+            return
+        if auth_ref.auth_token == self._token:
+            return
+
+        state = self.auth.get_auth_state()
+        if not state:
+            return
+        token = self._fernet.encrypt(state.encode('utf-8'))
+        if cache.write_json(self.path, {'state': token.decode('ascii')}):
+            self._token = auth_ref.auth_token
+
+    def delete(self):
+        """Remove the entry"""
+        self._token = None
+        if not self.enabled:
+            return
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -66,6 +66,15 @@ class ShowVersions(command.Lister):
 - EXPERIMENTAL"""
             ),
         )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            default=False,
+            help=_(
+                'Discover the versions again instead of using the cached '
+                'results, and update the cache'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -73,6 +82,9 @@ class ShowVersions(command.Lister):
         if parsed_args.is_all_interfaces:
             interface = None
 
+        if parsed_args.refresh:
+            self.app.client_manager.refresh_discovery_cache()
+
         session = self.app.client_manager.session
         version_data = session.get_all_version_data(
             interface=interface,
@@ -0,0 +1,226 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Wait for several resources at once
+
+These are the multi-resource counterparts of ``wait_for_status`` and
+``wait_for_delete`` from osc-lib.  Commands acting on several resources
+first act on all of them, then poll all the pending resources in a single
+loop instead of waiting for each resource in turn.  Every poll uses a
+single listing request when the caller can provide one, and only fetches
+individually the resources missing from the listing.
+"""
+
+import logging
+import time
+
+from novaclient import exceptions as nova_exceptions
+from openstack import exceptions as sdk_exceptions
+
+from openstackclient.common import parallel
+
+
+LOG = logging.getLogger(__name__)
+
+# Initial and maximum delays between two polls, in seconds.  The delay grows
+# while no resource changes state.
+SLEEP_TIME = 2
+MAX_SLEEP_TIME = 30
+BACKOFF = 1.5
+
+# Exceptions raised when a resource does not exist, by openstacksdk and by
+# novaclient
+NOT_FOUND_EXCEPTIONS = (
+    sdk_exceptions.NotFoundException,
+    nova_exceptions.NotFound,
+)
+
+# Statuses of the resources deleted in the meantime, which some listings
+# still return
+DELETED_STATUS = ('deleted', 'soft_deleted')
+
+
+def _poll(get_resource, list_resources, ids):
+    """Return the current state of the resources
+
+    :returns: A dict of the resources by ID, with ``None`` for the
+        resources which do not exist
+    """
+    resources = {}
+    if list_resources is not None and len(ids) > 1:
+        try:
+            resources = {r.id: r for r in list_resources(ids)}
+        except Exception as e:
+            LOG.debug('Unable to list resources: %s', e)
+        resources = {i: resources[i] for i in ids if i in resources}
+
+    def _get(resource_id):
+        try:
+            return get_resource(resource_id)
+        except NOT_FOUND_EXCEPTIONS:
+            return None
+
+    missing = [i for i in ids if i not in resources]
+    resources.update(zip(missing, parallel.run(_get, missing)))
+    return resources
+
+
+def _wait(
+    ids, get_resource, list_resources, check, sleep_time, timeout, callback
+):
+    """Poll resources until ``check`` returns a result for all of them
+
+    :param check: Function called with a resource, or ``None`` if it does
+        not exist, returning ``True`` on success, ``False`` on failure and
+        ``None`` while the resource is still pending
+    :returns: The list of the IDs of the resources which failed or timed out
+    """
+    sleep_time = sleep_time or SLEEP_TIME
+    deadline = None if timeout is None else time.monotonic() + timeout
+    pending = list(dict.fromkeys(ids))
+    failed = set()
+    delay = sleep_time
+
+    while pending:
+        resources = _poll(get_resource, list_resources, pending)
+        still_pending = []
+        progress = []
+        for resource_id in pending:
+            resource = resources[resource_id]
+            result = check(resource)
+            if result is None:
+                still_pending.append(resource_id)
+                progress.append(getattr(resource, 'progress', None) or 0)
+            elif not result:
+                failed.add(resource_id)
+
+        if len(still_pending) < len(pending):
+            delay = sleep_time
+        else:
+            delay = min(delay * BACKOFF, MAX_SLEEP_TIME)
+        pending = still_pending
+        if not pending:
+            break
+
+        if callback:
+            callback(sum(progress) // len(progress))
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                LOG.debug('Timed out waiting for %s', ', '.join(pending))
+                failed.update(pending)
+                break
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+    return [i for i in dict.fromkeys(ids) if i in failed]
+
+
+def wait_for_status(
+    get_resource,
+    ids,
+    list_resources=None,
+    status_field='status',
+    success_status=('active',),
+    error_status=('error',),
+    sleep_time=None,
+    timeout=None,
+    callback=None,
+):
+    """Wait for several resources to reach a status
+
+    :param get_resource: Function returning the resource with the given ID
+    :param ids: IDs of the resources to watch
+    :param list_resources: Function returning the resources among a list of
+        IDs, it may return other resources as well and miss some of them
+    :param status_field: The status attribute of the resources
+    :param success_status: Statuses of a successful completion
+    :param error_status: Statuses of an error
+    :param sleep_time: Initial delay between two polls, in seconds
+    :param timeout: Maximum time to wait for all the resources, in seconds,
+        no limit by default
+    :param callback: Called after each poll with the average progress of the
+        pending resources, useful to display progress
+    :returns: The list of the IDs of the resources which went into an error
+        state, were deleted or did not reach a success state in time
+    """
+
+    def _check(resource):
+        if resource is None:
+            return False
+        status = (getattr(resource, status_field, None) or '').lower()
+        if status in success_status:
+            return True
+        if status in error_status or status in DELETED_STATUS:
+            return False
+        return None
+
+    return _wait(
+        ids,
+        get_resource,
+        list_resources,
+        _check,
+        sleep_time,
+        timeout,
+        callback,
+    )
+
+
+def wait_for_delete(
+    get_resource,
+    ids,
+    list_resources=None,
+    status_field='status',
+    error_status=('error',),
+    sleep_time=None,
+    timeout=300,
+    callback=None,
+):
+    """Wait for several resources to be deleted
+
+    :param get_resource: Function returning the resource with the given ID,
+        raising one of :data:`NOT_FOUND_EXCEPTIONS` once it is deleted
+    :param ids: IDs of the resources to watch
+    :param list_resources: Function returning the resources among a list of
+        IDs, it may return other resources as well and miss some of them
+    :param status_field: The status attribute of the resources, used to
+        check for error states while they are being deleted
+    :param error_status: Statuses of an error
+    :param sleep_time: Initial delay between two polls, in seconds
+    :param timeout: Maximum time to wait for all the resources, in seconds
+    :param callback: Called after each poll with the average progress of the
+        pending resources, useful to display progress
+    :returns: The list of the IDs of the resources which went into an error
+        state or were not deleted in time
+    """
+
+    def _check(resource):
+        if resource is None:
+            return True
+        status = (getattr(resource, status_field, None) or '').lower()
+        if status in DELETED_STATUS:
+            return True
+        if status in error_status:
+            return False
+        return None
+
+    return _wait(
+        ids,
+        get_resource,
+        list_resources,
+        _check,
+        sleep_time,
+        timeout,
+        callback,
+    )
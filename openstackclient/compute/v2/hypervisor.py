@@ -16,18 +16,96 @@
 """Hypervisor action implementations"""
 
 import json
+import logging
 import re
 
 from novaclient import exceptions as nova_exceptions
+from openstack import exceptions as sdk_exceptions
 from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import parallel
 from openstackclient.i18n import _
 
 
+LOG = logging.getLogger(__name__)
+
+
+def _get_aggregate_index(aggregates):
+    """Index the names of the host aggregates by host"""
+    index = {}
+    for aggregate in aggregates:
+        for host in aggregate.hosts or []:
+            index.setdefault(host, []).append(aggregate.name)
+    return index
+
+
+def _get_host_aggregates(index, host):
+    """Return the names of the host aggregates a compute service host is in"""
+    if not host:
+        return []
+
+    # Hypervisors in nova cells are prefixed by "<cell>@"
+    if "@" in host:
+        cell, service_host = host.split('@', 1)
+    else:
+        cell = None
+        service_host = host
+
+    member_of = index.get(service_host, [])
+    if cell:
+        # The host aggregates are also prefixed by "<cell>@"
+        member_of = [name for name in member_of if cell in name]
+    return list(member_of)
+
+
+def _get_hypervisor_uptime(compute_client, hypervisor_id):
+    """Return the uptime of a hypervisor, or None if it is not available
+
+    Before microversion 2.88, the uptime is not included in the hypervisor
+    details and each hypervisor is asked for it.
+    """
+    try:
+        return compute_client.get_hypervisor_uptime(hypervisor_id)['uptime']
+    except (
+        nova_exceptions.HTTPNotImplemented,
+        sdk_exceptions.NotFoundException,
+    ):
+        return None
+    except sdk_exceptions.HttpException as e:
+        # The virt driver of the hypervisor does not report its uptime
+        if e.status_code == 501:
+            return None
+        LOG.debug(
+            'Unable to get the uptime of hypervisor %(id)s: %(e)s',
+            {'id': hypervisor_id, 'e': e},
+        )
+        raise
+
+
+def _parse_uptime(uptime):
+    """Extract the details of a hypervisor uptime value
+
+    The value has the format of the uptime command, for example
+    "17:37:14 up  2:33,  3 users,  load average: 0.33, 0.36, 0.34".
+    """
+    m = re.match(
+        r"\s*(.+)\sup\s+(.+),\s+(.+)\susers?,\s+load average:\s(.+)",
+        uptime or '',
+    )
+    if not m:
+        return {}
+    return {
+        'host_time': m.group(1),
+        'uptime': m.group(2),
+        'users': m.group(3),
+        'load_average': m.group(4),
+    }
+
+
 def _get_hypervisor_columns(item, client):
     column_map = {'name': 'hypervisor_hostname'}
     hidden_columns = ['location', 'servers']
@@ -106,6 +184,23 @@ class ListHypervisor(command.Lister):
             action='store_true',
             help=_("List additional fields in output"),
         )
+        parser.add_argument(
+            '--aggregates',
+            action='store_true',
+            help=_(
+                "List the host aggregates of the hypervisors "
+                "(the aggregates are fetched once for all the hypervisors)"
+            ),
+        )
+        parser.add_argument(
+            '--uptime',
+            action='store_true',
+            help=_(
+                "List the uptime and load average of the hypervisors "
+                "(fetched concurrently with --os-compute-api-version 2.87 "
+                "or below)"
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -164,9 +259,47 @@ class ListHypervisor(command.Lister):
 
         data = compute_client.hypervisors(**list_opts, details=True)
 
+        if not parsed_args.aggregates and not parsed_args.uptime:
+            return (
+                column_headers,
+                (utils.get_item_properties(s, columns) for s in data),
+            )
+
+        data = list(data)
+        details = [{} for _ in data]
+        detail_columns = ()
+
+        if parsed_args.aggregates:
+            column_headers += ('Aggregates',)
+            detail_columns += ('aggregates',)
+            index = _get_aggregate_index(compute_client.aggregates())
+            for s, detail in zip(data, details):
+                detail['aggregates'] = format_columns.ListColumn(
+                    _get_host_aggregates(
+                        index, (s.service_details or {}).get('host')
+                    )
+                )
+
+        if parsed_args.uptime:
+            column_headers += ('Uptime', 'Load Average')
+            detail_columns += ('uptime', 'load_average')
+            if sdk_utils.supports_microversion(compute_client, '2.88'):
+                uptimes = [s.uptime for s in data]
+            else:
+                uptimes = parallel.run(
+                    lambda s: _get_hypervisor_uptime(compute_client, s.id),
+                    data,
+                )
+            for detail, uptime in zip(details, uptimes):
+                detail.update(_parse_uptime(uptime))
+
         return (
             column_headers,
-            (utils.get_item_properties(s, columns) for s in data),
+            (
+                utils.get_item_properties(s, columns)
+                + tuple(detail.get(c, '') for c in detail_columns)
+                for s, detail in zip(data, details)
+            ),
         )
 
 
@@ -192,33 +325,11 @@ class ShowHypervisor(command.ShowOne):
         # before they get reported to the user. We spend this section
         # extracting the relevant details to be reported by modifying our
         # copy of the hypervisor object.
-        aggregates = compute_client.aggregates()
-        hypervisor['aggregates'] = list()
         service_details = hypervisor['service_details']
-
-        if aggregates:
-            # Hypervisors in nova cells are prefixed by "<cell>@"
-            if "@" in service_details['host']:
-                cell, service_host = service_details['host'].split('@', 1)
-            else:
-                cell = None
-                service_host = service_details['host']
-
-            if cell:
-                # The host aggregates are also prefixed by "<cell>@"
-                member_of = [
-                    aggregate.name
-                    for aggregate in aggregates
-                    if cell in aggregate.name
-                    and service_host in aggregate.hosts
-                ]
-            else:
-                member_of = [
-                    aggregate.name
-                    for aggregate in aggregates
-                    if service_host in aggregate.hosts
-                ]
-            hypervisor['aggregates'] = member_of
+        hypervisor['aggregates'] = _get_host_aggregates(
+            _get_aggregate_index(compute_client.aggregates()),
+            service_details['host'],
+        )
 
         try:
             if sdk_utils.supports_microversion(compute_client, '2.88'):
@@ -229,19 +340,7 @@ class ShowHypervisor(command.ShowOne):
                 uptime = compute_client.get_hypervisor_uptime(
                     hypervisor['id']
                 )['uptime']
-            # Extract data from uptime value
-            # format: 0 up 0,  0 users,  load average: 0, 0, 0
-            # example: 17:37:14 up  2:33,  3 users,
-            #          load average: 0.33, 0.36, 0.34
-            m = re.match(
-                r"\s*(.+)\sup\s+(.+),\s+(.+)\susers?,\s+load average:\s(.+)",
-                uptime,
-            )
-            if m:
-                hypervisor['host_time'] = m.group(1)
-                hypervisor['uptime'] = m.group(2)
-                hypervisor['users'] = m.group(3)
-                hypervisor['load_average'] = m.group(4)
+            hypervisor.update(_parse_uptime(uptime))
         except nova_exceptions.HTTPNotImplemented:
             pass
 
@@ -27,6 +27,8 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
@@ -307,6 +309,12 @@ class ListKeypair(command.Lister):
         )
         return parser
 
+    def produce_output(self, parsed_args, column_names, data):
+        if parsed_args.project:
+            # The keypairs are written as the users are processed
+            self.formatter = streaming.get_formatter(self.formatter)
+        return super().produce_output(parsed_args, column_names, data)
+
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         identity_client = self.app.client_manager.identity
@@ -348,8 +356,8 @@ class ListKeypair(command.Lister):
                 msg = _('--project is not compatible with --marker')
 
             # NOTE(stephenfin): This is done client side because nova doesn't
-            # currently support doing so server-side. If this is slow, we can
-            # think about spinning up a threadpool or similar.
+            # currently support doing so server-side. The keypairs of the
+            # users are listed concurrently and returned user by user.
             project = identity_common.find_project(
                 identity_client,
                 parsed_args.project,
@@ -357,10 +365,13 @@ class ListKeypair(command.Lister):
             ).id
             users = identity_client.users.list(tenant_id=project)
 
-            data = []
-            for user in users:
-                kwargs['user_id'] = user.id
-                data.extend(compute_client.keypairs(**kwargs))
+            data = parallel.chain(
+                [
+                    compute_client.keypairs(user_id=user.id, **kwargs)
+                    for user in users
+                ],
+                buffer_size=streaming.PAGE_SIZE,
+            )
         elif parsed_args.user:
             if not sdk_utils.supports_microversion(compute_client, '2.10'):
                 msg = _(
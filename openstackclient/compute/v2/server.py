@@ -16,6 +16,7 @@
 """Compute v2 Server action implementations"""
 
 import argparse
+import datetime
 import getpass
 import io
 import json
@@ -33,6 +34,10 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import bulk
+from openstackclient.common import lookup
+from openstackclient.common import streaming
+from openstackclient.common import wait
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common as network_common
@@ -313,6 +318,43 @@ def boolenv(*vars, default=False):
     return default
 
 
+def _changes_since():
+    """Return a changes-since filter covering the actions about to be made
+
+    Listing only the servers changed since then is enough to wait for the
+    servers the command acts on.  The filter is set a few minutes in the past
+    to allow for a clock skew with the server, the servers missing from the
+    listing are looked up individually anyway.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (now - datetime.timedelta(minutes=5)).isoformat()
+
+
+def _list_changed_servers(compute_client, since, project_ids):
+    """List the servers changed since a time, except the deleted ones
+
+    The servers deleted in the meantime are listed with a deleted status, they
+    are left out so that they are looked up individually and found missing.
+
+    :param compute_client: The openstacksdk compute proxy
+    :param since: The changes-since filter, see :func:`_changes_since`
+    :param project_ids: The projects of the servers waited for, the servers
+        of all projects are listed if some are not in the current project
+    """
+    all_projects = any(
+        project_id != compute_client.get_project_id()
+        for project_id in project_ids
+    )
+    servers = compute_client.servers(
+        changes_since=since, all_projects=all_projects
+    )
+    return [
+        s
+        for s in servers
+        if (s.status or '').lower() not in ('deleted', 'soft_deleted')
+    ]
+
+
 class AddFixedIP(command.ShowOne):
     _description = _("Add fixed IP address to server")
 
@@ -361,9 +403,9 @@ class AddFixedIP(command.ShowOne):
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
-            ).id
+            net_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
+            )
         else:
             net_id = parsed_args.network
 
@@ -594,9 +636,9 @@ class AddNetwork(command.Command):
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
-            ).id
+            net_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
+            )
         else:
             net_id = parsed_args.network
 
@@ -1443,59 +1485,19 @@ class CreateServer(command.ShowOne):
             )
 
         if not image and parsed_args.image_properties:
-
-            def emit_duplicated_warning(img):
-                img_uuid_list = [str(image.id) for image in img]
+            image_ids, image = self.app.client_manager.get_image_index().find(
+                parsed_args.image_properties
+            )
+            if len(image_ids) > 1:
                 LOG.warning(
                     'Multiple matching images: %(img_uuid_list)s\n'
                     'Using image: %(chosen_one)s',
                     {
-                        'img_uuid_list': img_uuid_list,
-                        'chosen_one': img_uuid_list[0],
+                        'img_uuid_list': image_ids,
+                        'chosen_one': image_ids[0],
                     },
                 )
-
-            def _match_image(image_api, wanted_properties):
-                image_list = image_api.images()
-                images_matched = []
-                for img in image_list:
-                    img_dict = {}
-
-                    # exclude any unhashable entries
-                    img_dict_items = list(img.items())
-                    if img.properties:
-                        img_dict_items.extend(list(img.properties.items()))
-                    for key, value in img_dict_items:
-                        try:
-                            set([key, value])
-                        except TypeError:
-                            if key != 'properties':
-                                LOG.debug(
-                                    'Skipped the \'%s\' attribute. '
-                                    'That cannot be compared. '
-                                    '(image: %s, value: %s)',
-                                    key,
-                                    img.id,
-                                    value,
-                                )
-                            pass
-                        else:
-                            img_dict[key] = value
-
-                    if all(
-                        k in img_dict and img_dict[k] == v
-                        for k, v in wanted_properties.items()
-                    ):
-                        images_matched.append(img)
-
-                return images_matched
-
-            images = _match_image(image_client, parsed_args.image_properties)
-            if len(images) > 1:
-                emit_duplicated_warning(images, parsed_args.image_properties)
-            if images:
-                image = images[0]
-            else:
+            if image is None:
                 msg = _(
                     'No images match the property expected by '
                     '--image-property'
@@ -1798,11 +1800,10 @@ class CreateServer(command.ShowOne):
                     network_client = self.app.client_manager.network
 
                     if nic['net-id']:
-                        net = network_client.find_network(
-                            nic['net-id'],
-                            ignore_missing=False,
+                        net_id = self.app.client_manager.find_resource_id(
+                            network_client, 'network', nic['net-id']
                         )
-                        nic['net-id'] = net.id
+                        nic['net-id'] = net_id
 
                     if nic['port-id']:
                         port = network_client.find_port(
@@ -2047,6 +2048,7 @@ class DeleteServer(command.Command):
             action='store_true',
             help=_('Wait for delete to complete'),
         )
+        bulk.add_parallel_option(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -2056,7 +2058,9 @@ class DeleteServer(command.Command):
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.compute
-        for server in parsed_args.server:
+        since = _changes_since()
+
+        def _delete(server):
             server_obj = utils.find_resource(
                 compute_client.servers,
                 server,
@@ -2067,17 +2071,41 @@ class DeleteServer(command.Command):
                 compute_client.servers.force_delete(server_obj.id)
             else:
                 compute_client.servers.delete(server_obj.id)
+            return server_obj.id
 
-            if parsed_args.wait:
-                if not utils.wait_for_delete(
-                    compute_client.servers,
-                    server_obj.id,
-                    callback=_show_progress,
-                ):
-                    msg = _('Error deleting server: %s')
-                    LOG.error(msg, server_obj.id)
-                    self.app.stdout.write(_('Error deleting server\n'))
-                    raise SystemExit
+        server_ids = bulk.run(
+            _delete,
+            parsed_args.server,
+            'server',
+            workers=parsed_args.parallel,
+        )
+
+        if not parsed_args.wait or not server_ids:
+            bulk.check(parsed_args.server, server_ids, 'server')
+            return
+
+        def _list_servers(ids):
+            servers = compute_client.servers.list(
+                search_opts={
+                    'all_tenants': parsed_args.all_projects,
+                    'changes-since': since,
+                },
+            )
+            return [s for s in servers if s.status.lower() != 'deleted']
+
+        failed = wait.wait_for_delete(
+            compute_client.servers.get,
+            server_ids,
+            list_resources=_list_servers,
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
+                LOG.error(_('Error deleting server: %s'), server_id)
+            self.app.stdout.write(_('Error deleting server\n'))
+            raise SystemExit
+
+        bulk.check(parsed_args.server, server_ids, 'server')
 
 
 def percent_type(x):
@@ -2364,6 +2392,18 @@ class ListServer(command.Lister):
                 'Mutually exclusive with "--no-name-lookup|-n" option.'
             ),
         )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            default=False,
+            help=_(
+                'Process and display the servers one page at a time as they '
+                'are fetched instead of all at once, to reduce the memory '
+                'used by large listings. Only the csv, json and value '
+                'formats output the servers before the listing completes. '
+                'The "Host Status" column is always included with --long.'
+            ),
+        )
         parser.add_argument(
             '--marker',
             metavar='<server>',
@@ -2453,6 +2493,101 @@ class ListServer(command.Lister):
         )
         return parser
 
+    def _populate_servers(
+        self, compute_client, data, images, flavors, name_lookup
+    ):
+        """Add the attributes displayed in the listing to the servers
+
+        :param data: List of servers
+        :param images: Image lookup, see :class:`lookup.ResourceLookup`
+        :param flavors: Flavor lookup
+        :param name_lookup: Whether to look up the image and flavor names
+        """
+        if data and name_lookup:
+            # partial responses from down cells will not have an image
+            # attribute so we use getattr. Note that 'image.id' can be empty
+            # for BFV instances and 'image' can be missing entirely if there
+            # are infra failures
+            image_ids = {
+                s.image['id']
+                for s in data
+                if getattr(s, 'image', None) and s.image.get('id')
+            }
+            # Note that 'flavor.id' is not present on microversion 2.47 or
+            # later and 'flavor' won't be present if there are infra failures
+            flavor_ids = {
+                s.flavor['id']
+                for s in data
+                if getattr(s, 'flavor', None) and s.flavor.get('id')
+            }
+
+            # "Image Name" and "Flavor Name" are not crucial, so lookup
+            # failures are ignored
+            lookup.resolve([(images, image_ids), (flavors, flavor_ids)])
+
+        # Populate image_name, image_id, flavor_name and flavor_id attributes
+        # of server objects so that we can display those columns.
+        supports_2_69 = sdk_utils.supports_microversion(compute_client, '2.69')
+        supports_2_47 = sdk_utils.supports_microversion(compute_client, '2.47')
+        for s in data:
+            if supports_2_69:
+                # NOTE(tssurya): From 2.69, we will have the keys 'flavor'
+                # and 'image' missing in the server response during
+                # infrastructure failure situations.
+                # For those servers with partial constructs we just skip the
+                # processing of the image and flavor information.
+                if not hasattr(s, 'image') or not hasattr(s, 'flavor'):
+                    continue
+
+            if 'id' in s.image and s.image.id is not None:
+                image = images.get(s.image['id'])
+                if image:
+                    s.image_name = image.name
+                s.image_id = s.image['id']
+            else:
+                # NOTE(melwitt): An server booted from a volume will have no
+                # image associated with it. We fill in the Image Name and ID
+                # with "N/A (booted from volume)" to help users who want to be
+                # able to grep for boot-from-volume servers when using the CLI.
+                s.image_name = IMAGE_STRING_FOR_BFV
+                s.image_id = IMAGE_STRING_FOR_BFV
+
+            if not supports_2_47:
+                flavor = flavors.get(s.flavor['id'])
+                if flavor:
+                    s.flavor_name = flavor.name
+                s.flavor_id = s.flavor['id']
+            else:
+                s.flavor_name = s.flavor['original_name']
+
+        # Add a list with security group name as attribute
+        for s in data:
+            if hasattr(s, 'security_groups') and s.security_groups is not None:
+                s.security_groups_name = [x["name"] for x in s.security_groups]
+            else:
+                s.security_groups_name = []
+
+    def _stream_servers(
+        self, compute_client, servers, images, flavors, name_lookup
+    ):
+        """Populate the servers one page at a time as they are fetched
+
+        The image and flavor names are looked up for each page, the lookups
+        remember the names already found.
+        """
+        for page in streaming.pages(servers):
+            self._populate_servers(
+                compute_client, page, images, flavors, name_lookup
+            )
+            yield from page
+
+    def produce_output(self, parsed_args, column_names, data):
+        if parsed_args.stream:
+            self.formatter = streaming.get_formatter(self.formatter)
+        return super(ListServer, self).produce_output(
+            parsed_args, column_names, data
+        )
+
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         identity_client = self.app.client_manager.identity
@@ -2738,113 +2873,30 @@ class ListServer(command.Lister):
                 marker_id = compute_client.find_server(parsed_args.marker).id
             search_opts['marker'] = marker_id
 
-        data = list(compute_client.servers(**search_opts))
-
-        images = {}
-        flavors = {}
-        if data and not parsed_args.no_name_lookup:
-            # partial responses from down cells will not have an image
-            # attribute so we use getattr
-            image_ids = {
-                s.image['id']
-                for s in data
-                if getattr(s, 'image', None) and s.image.get('id')
-            }
-
-            # create a dict that maps image_id to image object, which is used
-            # to display the "Image Name" column. Note that 'image.id' can be
-            # empty for BFV instances and 'image' can be missing entirely if
-            # there are infra failures
-            if parsed_args.name_lookup_one_by_one or image_id:
-                for image_id in image_ids:
-                    # "Image Name" is not crucial, so we swallow any exceptions
-                    try:
-                        images[image_id] = image_client.get_image(image_id)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    # some deployments can have *loads* of images so we only
-                    # want to list the ones we care about. It would be better
-                    # to only retrun the *fields* we care about (name) but
-                    # glance doesn't support that
-                    # NOTE(stephenfin): This could result in super long URLs
-                    # but it seems unlikely to cause issues. Apache supports
-                    # URL lengths of up to 8190 characters by default, which
-                    # should allow for more than 220 unique image ID (different
-                    # servers are likely use the same image ID) in the filter.
-                    # Who'd need more than that in a single command?
-                    images_list = image_client.images(
-                        id=f"in:{','.join(image_ids)}"
-                    )
-                    for i in images_list:
-                        images[i.id] = i
-                except Exception:
-                    pass
-
-            # create a dict that maps flavor_id to flavor object, which is used
-            # to display the "Flavor Name" column. Note that 'flavor.id' is not
-            # present on microversion 2.47 or later and 'flavor' won't be
-            # present if there are infra failures
-            if parsed_args.name_lookup_one_by_one or flavor_id:
-                for f_id in set(
-                    s.flavor['id']
-                    for s in data
-                    if s.flavor and s.flavor.get('id')
-                ):
-                    # "Flavor Name" is not crucial, so we swallow any
-                    # exceptions
-                    try:
-                        flavors[f_id] = compute_client.find_flavor(f_id)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    flavors_list = compute_client.flavors(is_public=None)
-                    for i in flavors_list:
-                        flavors[i.id] = i
-                except Exception:
-                    pass
-
-        # Populate image_name, image_id, flavor_name and flavor_id attributes
-        # of server objects so that we can display those columns.
-        for s in data:
-            if sdk_utils.supports_microversion(compute_client, '2.69'):
-                # NOTE(tssurya): From 2.69, we will have the keys 'flavor'
-                # and 'image' missing in the server response during
-                # infrastructure failure situations.
-                # For those servers with partial constructs we just skip the
-                # processing of the image and flavor information.
-                if not hasattr(s, 'image') or not hasattr(s, 'flavor'):
-                    continue
-
-            if 'id' in s.image and s.image.id is not None:
-                image = images.get(s.image['id'])
-                if image:
-                    s.image_name = image.name
-                s.image_id = s.image['id']
-            else:
-                # NOTE(melwitt): An server booted from a volume will have no
-                # image associated with it. We fill in the Image Name and ID
-                # with "N/A (booted from volume)" to help users who want to be
-                # able to grep for boot-from-volume servers when using the CLI.
-                s.image_name = IMAGE_STRING_FOR_BFV
-                s.image_id = IMAGE_STRING_FOR_BFV
-
-            if not sdk_utils.supports_microversion(compute_client, '2.47'):
-                flavor = flavors.get(s.flavor['id'])
-                if flavor:
-                    s.flavor_name = flavor.name
-                s.flavor_id = s.flavor['id']
-            else:
-                s.flavor_name = s.flavor['original_name']
-
-        # Add a list with security group name as attribute
-        for s in data:
-            if hasattr(s, 'security_groups') and s.security_groups is not None:
-                s.security_groups_name = [x["name"] for x in s.security_groups]
-            else:
-                s.security_groups_name = []
+        servers = compute_client.servers(**search_opts)
+
+        # create lookups mapping image and flavor IDs to image and flavor
+        # objects, which are used to display the "Image Name" and "Flavor
+        # Name" columns
+        images = lookup.ResourceLookup(
+            get_resource=image_client.get_image,
+            # some deployments can have *loads* of images so we only want to
+            # list the ones we care about. It would be better to only return
+            # the *fields* we care about (name) but glance doesn't support
+            # that
+            list_resources=lambda ids: image_client.images(
+                id=lookup.in_filter(ids)
+            ),
+        )
+        flavors = lookup.ResourceLookup(
+            get_resource=compute_client.find_flavor,
+            list_resources=lambda ids: compute_client.flavors(is_public=None),
+            chunked=False,
+        )
+        if parsed_args.name_lookup_one_by_one or image_id:
+            images.list_resources = None
+        if parsed_args.name_lookup_one_by_one or flavor_id:
+            flavors.list_resources = None
 
         # The host_status field contains the status of the compute host the
         # server is on. It is only returned by the API when the nova-api
@@ -2853,11 +2905,35 @@ class ListServer(command.Lister):
         # host_status field can indicate a possible problem on the host
         # it's on, providing useful information to a user in this
         # situation.
-        if (
+        show_host_status = (
             sdk_utils.supports_microversion(compute_client, '2.16')
             and parsed_args.long
-        ):
-            if any([s.host_status is not None for s in data]):
+        )
+
+        if parsed_args.stream:
+            # The columns are needed before the first server is seen
+            if show_host_status:
+                columns += ('Host Status',)
+                column_headers += ('Host Status',)
+            data = self._stream_servers(
+                compute_client,
+                servers,
+                images,
+                flavors,
+                not parsed_args.no_name_lookup,
+            )
+        else:
+            data = list(servers)
+            self._populate_servers(
+                compute_client,
+                data,
+                images,
+                flavors,
+                not parsed_args.no_name_lookup,
+            )
+            if show_host_status and any(
+                [s.host_status is not None for s in data]
+            ):
                 columns += ('Host Status',)
                 column_headers += ('Host Status',)
 
@@ -2928,9 +3004,9 @@ A non-admin user will not be able to execute actions."""
             kwargs['locked_reason'] = parsed_args.reason
 
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server, ignore_missing=False
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.lock_server(server_id, **kwargs)
 
 
@@ -3146,10 +3222,9 @@ class PauseServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.pause_server(server_id)
 
 
@@ -3194,10 +3269,9 @@ class RebootServer(command.Command):
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.sdk_connection.compute
-        server_id = compute_client.find_server(
-            parsed_args.server,
-            ignore_missing=False,
-        ).id
+        server_id = self.app.client_manager.find_resource_id(
+            compute_client, 'server', parsed_args.server
+        )
         compute_client.reboot_server(server_id, parsed_args.reboot_type)
 
         if parsed_args.wait:
@@ -3841,9 +3915,9 @@ class RemoveNetwork(command.Command):
 
         if self.app.client_manager.is_network_endpoint_enabled():
             network_client = self.app.client_manager.network
-            net_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
-            ).id
+            net_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
+            )
         else:
             net_id = parsed_args.network
 
@@ -4191,10 +4265,9 @@ class RestoreServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.restore_server(server_id)
 
 
@@ -4214,10 +4287,9 @@ class ResumeServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.resume_server(server_id)
 
 
@@ -4431,12 +4503,17 @@ class ShelveServer(command.Command):
                 self.app.stdout.flush()
 
         compute_client = self.app.client_manager.sdk_connection.compute
+        since = _changes_since()
 
+        server_ids = []
+        project_ids = set()
         for server in parsed_args.servers:
             server_obj = compute_client.find_server(
                 server,
                 ignore_missing=False,
             )
+            server_ids.append(server_obj.id)
+            project_ids.add(server_obj.project_id)
             if server_obj.status.lower() in ('shelved', 'shelved_offloaded'):
                 continue
 
@@ -4447,56 +4524,51 @@ class ShelveServer(command.Command):
         if not parsed_args.wait and not parsed_args.offload:
             return
 
-        for server in parsed_args.servers:
-            # We use osc-lib's wait_for_status since that allows for a callback
-            # TODO(stephenfin): We should wait for these in parallel using e.g.
-            # https://review.opendev.org/c/openstack/osc-lib/+/762503/
-            if not utils.wait_for_status(
-                compute_client.get_server,
-                server_obj.id,
-                success_status=('shelved', 'shelved_offloaded'),
-                callback=_show_progress,
-            ):
-                LOG.error(_('Error shelving server: %s'), server_obj.id)
+        def _list_servers(ids):
+            return _list_changed_servers(compute_client, since, project_ids)
+
+        failed = wait.wait_for_status(
+            compute_client.get_server,
+            server_ids,
+            list_resources=_list_servers,
+            success_status=('shelved', 'shelved_offloaded'),
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
+                LOG.error(_('Error shelving server: %s'), server_id)
                 self.app.stdout.write(
-                    _('Error shelving server: %s\n') % server_obj.id
+                    _('Error shelving server: %s\n') % server_id
                 )
-                raise SystemExit
+            raise SystemExit
 
         if not parsed_args.offload:
             return
 
-        for server in parsed_args.servers:
-            server_obj = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            )
+        for server_id in server_ids:
+            server_obj = compute_client.get_server(server_id)
             if server_obj.status.lower() == 'shelved_offloaded':
                 continue
 
-            compute_client.shelve_offload_server(server_obj.id)
+            compute_client.shelve_offload_server(server_id)
 
         if not parsed_args.wait:
             return
 
-        for server in parsed_args.servers:
-            # We use osc-lib's wait_for_status since that allows for a callback
-            # TODO(stephenfin): We should wait for these in parallel using e.g.
-            # https://review.opendev.org/c/openstack/osc-lib/+/762503/
-            if not utils.wait_for_status(
-                compute_client.get_server,
-                server_obj.id,
-                success_status=('shelved_offloaded',),
-                callback=_show_progress,
-            ):
-                LOG.error(
-                    _('Error offloading shelved server %s'),
-                    server_obj.id,
-                )
+        failed = wait.wait_for_status(
+            compute_client.get_server,
+            server_ids,
+            list_resources=_list_servers,
+            success_status=('shelved_offloaded',),
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
+                LOG.error(_('Error offloading shelved server %s'), server_id)
                 self.app.stdout.write(
-                    _('Error offloading shelved server: %s\n') % server_obj.id
+                    _('Error offloading shelved server: %s\n') % server_id
                 )
-                raise SystemExit
+            raise SystemExit
 
 
 class ShowServer(command.ShowOne):
@@ -4758,12 +4830,13 @@ class StartServer(command.Command):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
             try:
-                server_id = compute_client.find_server(
+                server_id = self.app.client_manager.find_resource_id(
+                    compute_client,
+                    'server',
                     server,
-                    ignore_missing=False,
                     details=False,
                     all_projects=parsed_args.all_projects,
-                ).id
+                )
             except sdk_exceptions.HttpException as exc:
                 if exc.status_code == 403:
                     msg = _("Policy doesn't allow passing all-projects")
@@ -4798,12 +4871,13 @@ class StopServer(command.Command):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
             try:
-                server_id = compute_client.find_server(
+                server_id = self.app.client_manager.find_resource_id(
+                    compute_client,
+                    'server',
                     server,
-                    ignore_missing=False,
                     details=False,
                     all_projects=parsed_args.all_projects,
-                ).id
+                )
             except sdk_exceptions.HttpException as exc:
                 if exc.status_code == 403:
                     msg = _("Policy doesn't allow passing all-projects")
@@ -4828,10 +4902,9 @@ class SuspendServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.suspend_server(server_id)
 
 
@@ -4851,10 +4924,9 @@ class UnlockServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.unlock_server(server_id)
 
 
@@ -4874,10 +4946,9 @@ class UnpauseServer(command.Command):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
         for server in parsed_args.server:
-            server_id = compute_client.find_server(
-                server,
-                ignore_missing=False,
-            ).id
+            server_id = self.app.client_manager.find_resource_id(
+                compute_client, 'server', server
+            )
             compute_client.unpause_server(server_id)
 
 
@@ -5067,6 +5138,9 @@ class UnshelveServer(command.Command):
 
             kwargs['availability_zone'] = None
 
+        since = _changes_since()
+        server_ids = []
+        project_ids = set()
         for server in parsed_args.server:
             server_obj = compute_client.find_server(
                 server,
@@ -5080,16 +5154,25 @@ class UnshelveServer(command.Command):
                 continue
 
             compute_client.unshelve_server(server_obj.id, **kwargs)
+            server_ids.append(server_obj.id)
+            project_ids.add(server_obj.project_id)
 
-            if parsed_args.wait:
-                if not utils.wait_for_status(
-                    compute_client.get_server,
-                    server_obj.id,
-                    success_status=('active', 'shutoff'),
-                    callback=_show_progress,
-                ):
-                    LOG.error(_('Error unshelving server %s'), server_obj.id)
-                    self.app.stdout.write(
-                        _('Error unshelving server: %s\n') % server_obj.id
-                    )
-                    raise SystemExit
+        if not parsed_args.wait:
+            return
+
+        failed = wait.wait_for_status(
+            compute_client.get_server,
+            server_ids,
+            list_resources=lambda ids: _list_changed_servers(
+                compute_client, since, project_ids
+            ),
+            success_status=('active', 'shutoff'),
+            callback=_show_progress,
+        )
+        if failed:
+            for server_id in failed:
+                LOG.error(_('Error unshelving server %s'), server_id)
+                self.app.stdout.write(
+                    _('Error unshelving server: %s\n') % server_id
+                )
+            raise SystemExit
@@ -15,6 +15,7 @@
 
 """Compute v2 Server operation event implementations"""
 
+import itertools
 import logging
 import uuid
 
@@ -26,6 +27,8 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 from openstackclient.i18n import _
 
 LOG = logging.getLogger(__name__)
@@ -101,10 +104,23 @@ def _get_server_event_columns(item, client):
     )
 
 
+def _find_server_id(compute_client, server):
+    try:
+        return compute_client.find_server(server, ignore_missing=False).id
+    except sdk_exceptions.ResourceNotFound:
+        # If we fail to find the resource, it is possible the server is
+        # deleted. Try once more using the <server> arg directly if it is a
+        # UUID.
+        if is_uuid_like(server):
+            return server
+        raise
+
+
 class ListServerEvent(command.Lister):
-    """List recent events of a server.
+    """List recent events of one or more servers.
 
-    Specify ``--os-compute-api-version 2.21`` or higher to show events for a
+    The events of several servers are merged, most recent first. Specify
+    ``--os-compute-api-version 2.21`` or higher to show events for a
     deleted server, specified by ID only.
     """
 
@@ -113,7 +129,16 @@ class ListServerEvent(command.Lister):
         parser.add_argument(
             'server',
             metavar='<server>',
-            help=_('Server to list events (name or ID)'),
+            nargs='*',
+            help=_('Server(s) to list events (name or ID)'),
+        )
+        parser.add_argument(
+            '--host',
+            metavar='<hostname>',
+            help=_(
+                'List the events of the servers on this host, of all '
+                'projects (admin only)'
+            ),
         )
         parser.add_argument(
             '--long',
@@ -121,6 +146,15 @@ class ListServerEvent(command.Lister):
             default=False,
             help=_("List additional fields in output"),
         )
+        parser.add_argument(
+            '--details',
+            action='store_true',
+            default=False,
+            help=_(
+                "Fetch the details of each event, including the steps of "
+                "the action, like 'server event show'"
+            ),
+        )
         parser.add_argument(
             '--changes-since',
             dest='changes_since',
@@ -160,9 +194,19 @@ class ListServerEvent(command.Lister):
         )
         return parser
 
+    def produce_output(self, parsed_args, column_names, data):
+        if parsed_args.details:
+            # The events are written as their details are fetched
+            self.formatter = streaming.get_formatter(self.formatter)
+        return super().produce_output(parsed_args, column_names, data)
+
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
+        if not parsed_args.server and not parsed_args.host:
+            msg = _('At least one server or --host is required')
+            raise exceptions.CommandError(msg)
+
         kwargs = {}
 
         if parsed_args.marker:
@@ -218,20 +262,41 @@ class ListServerEvent(command.Lister):
 
             kwargs['changes_before'] = parsed_args.changes_before
 
-        try:
-            server_id = compute_client.find_server(
-                parsed_args.server, ignore_missing=False
-            ).id
-        except sdk_exceptions.ResourceNotFound:
-            # If we fail to find the resource, it is possible the server is
-            # deleted. Try once more using the <server> arg directly if it is a
-            # UUID.
-            if is_uuid_like(parsed_args.server):
-                server_id = parsed_args.server
-            else:
-                raise
-
-        data = compute_client.server_actions(server_id, **kwargs)
+        server_ids = parallel.run(
+            lambda server: _find_server_id(compute_client, server),
+            parsed_args.server,
+        )
+        if parsed_args.host:
+            server_ids.extend(
+                server.id
+                for server in compute_client.servers(
+                    host=parsed_args.host, all_projects=True
+                )
+            )
+        server_ids = list(dict.fromkeys(server_ids))
+
+        if parsed_args.marker and len(server_ids) > 1:
+            msg = _('--marker is only supported with a single server')
+            raise exceptions.CommandError(msg)
+
+        if len(server_ids) == 1:
+            data = compute_client.server_actions(server_ids[0], **kwargs)
+        else:
+            actions = parallel.run(
+                lambda server_id: list(
+                    compute_client.server_actions(server_id, **kwargs)
+                ),
+                server_ids,
+            )
+            # Merge the events of the servers, most recent first like the
+            # events of a server
+            data = sorted(
+                itertools.chain.from_iterable(actions),
+                key=lambda action: action.start_time or '',
+                reverse=True,
+            )
+            if parsed_args.limit:
+                data = data[: parsed_args.limit]
 
         columns = (
             'request_id',
@@ -258,9 +323,27 @@ class ListServerEvent(command.Lister):
                 'User ID',
             )
 
+        if parsed_args.details:
+            data = parallel.imap(
+                lambda action: compute_client.get_server_action(
+                    action.request_id,
+                    action.server_id,
+                ),
+                data,
+            )
+            columns += ('events',)
+            column_headers += ('Events',)
+
         return (
             column_headers,
-            (utils.get_item_properties(s, columns) for s in data),
+            (
+                utils.get_item_properties(
+                    s,
+                    columns,
+                    formatters={'events': ServerActionEventColumn},
+                )
+                for s in data
+            ),
         )
 
 
@@ -290,19 +373,7 @@ class ShowServerEvent(command.ShowOne):
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.sdk_connection.compute
 
-        try:
-            server_id = compute_client.find_server(
-                parsed_args.server,
-                ignore_missing=False,
-            ).id
-        except sdk_exceptions.ResourceNotFound:
-            # If we fail to find the resource, it is possible the server is
-            # deleted. Try once more using the <server> arg directly if it is a
-            # UUID.
-            if is_uuid_like(parsed_args.server):
-                server_id = parsed_args.server
-            else:
-                raise
+        server_id = _find_server_id(compute_client, parsed_args.server)
 
         server_action = compute_client.get_server_action(
             parsed_args.request_id,
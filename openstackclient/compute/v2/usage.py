@@ -47,8 +47,9 @@ class ProjectColumn(cliff_columns.FormattableColumn):
         if not project:
             return ''
 
-        if project in self.project_cache.keys():
-            return self.project_cache[project].name
+        cached = self.project_cache.get(project)
+        if cached is not None:
+            return cached.name
 
         return project
 
@@ -128,14 +129,6 @@ class ListUsage(command.Lister):
         return parser
 
     def take_action(self, parsed_args):
-        def _format_project(project):
-            if not project:
-                return ""
-            if project in project_cache.keys():
-                return project_cache[project].name
-            else:
-                return project
-
         compute_client = self.app.client_manager.sdk_connection.compute
         columns = (
             "project_id",
@@ -176,14 +169,10 @@ class ListUsage(command.Lister):
             )
         )
 
-        # Cache the project list
-        project_cache = {}
-        try:
-            for p in self.app.client_manager.identity.projects.list():
-                project_cache[p.id] = p
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        # The project names are only fetched when they are displayed, and
+        # only for the projects with usage
+        project_cache = self.app.client_manager.get_project_lookup()
+        project_cache.defer(u.project_id for u in usage_list)
 
         if parsed_args.formatter == 'table' and len(usage_list) > 0:
             self.app.stdout.write(
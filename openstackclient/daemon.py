@@ -0,0 +1,405 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Resident command server and its thin client
+
+``openstack-daemon`` keeps an initialized :class:`OpenStackShell`, and with
+it the authenticated session, the service catalog and the SDK connection,
+for the cloud described by the ``OS_*`` environment variables.  It listens
+on a per-user Unix socket whose name is derived from that environment.
+
+``openstack-client`` sends its command line and current directory to the
+daemon serving its environment, together with its standard input, output
+and error file descriptors, so the command reads and writes them directly.
+The client then exits with the status of the command.  When no daemon is
+available it runs the command in-process exactly like ``openstack``.  The
+client only depends on the standard library so that it starts quickly.
+
+Messages are JSON documents terminated by a newline.  The client sends a
+single request, with the file descriptors attached, and the daemon answers
+with a single status message.
+"""
+
+import argparse
+import array
+import hashlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+
+# Seconds without a request before the daemon exits
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Re-authenticate when the token expires within this many seconds
+TOKEN_STALE_DURATION = 120
+
+# Exit status of a command whose response was lost, after it was sent to the
+# daemon
+LOST_RESPONSE_STATUS = 1
+
+
+def get_environment():
+    """Return the environment variables describing the cloud"""
+    return dict(
+        (key, value)
+        for key, value in os.environ.items()
+        if key.startswith('OS_')
+    )
+
+
+def get_environment_hash(environ=None):
+    """Return a digest of the environment variables describing the cloud"""
+    if environ is None:
+        environ = get_environment()
+    digest = hashlib.sha256()
+    for key in sorted(environ):
+        digest.update(('%s=%s\n' % (key, environ[key])).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get_socket_path(environ=None):
+    """Return the socket of the daemon serving an environment
+
+    The socket lives in a private per-user directory and its name is
+    derived from the ``OS_*`` variables, so each cloud, and each set of
+    credentials, gets its own daemon.
+    """
+    base = (
+        os.environ.get('XDG_RUNTIME_DIR')
+        or os.environ.get('XDG_CACHE_HOME')
+        or os.path.join(os.path.expanduser('~'), '.cache')
+    )
+    return os.path.join(
+        base,
+        'openstackclient',
+        'daemon-%s.sock' % get_environment_hash(environ)[:16],
+    )
+
+
+def _send(sock, message, fds=None):
+    data = json.dumps(message).encode('utf-8') + b'\n'
+    if fds:
+        sock.sendmsg(
+            [data],
+            [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))],
+        )
+    else:
+        sock.sendall(data)
+
+
+def _recv(sock, max_fds=0):
+    """Read a message and the file descriptors sent along with it"""
+    data = b''
+    fds = array.array('i')
+    ancbufsize = socket.CMSG_SPACE(max_fds * fds.itemsize) if max_fds else 0
+    while not data.endswith(b'\n'):
+        chunk, ancdata, flags, addr = sock.recvmsg(4096, ancbufsize)
+        for level, type_, cmsg_data in ancdata:
+            if level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS:
+                cmsg_data = cmsg_data[
+                    : len(cmsg_data) - (len(cmsg_data) % fds.itemsize)
+                ]
+                fds.frombytes(cmsg_data)
+        if not chunk:
+            break
+        data += chunk
+    if not data:
+        return None, list(fds)
+    return json.loads(data), list(fds)
+
+
+# Server
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            request, fds = _recv(self.request, max_fds=3)
+        except (OSError, ValueError) as e:
+            LOG.debug('Invalid request: %s', e)
+            return
+
+        streams = [
+            os.fdopen(fd, mode, closefd=True)
+            for fd, mode in zip(fds, ('r', 'w', 'w'))
+        ]
+        try:
+            self.server.last_request = time.monotonic()
+            _send(self.request, self._process(request, streams))
+        finally:
+            for stream in streams:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+    def _process(self, request, streams):
+        if request is None or len(streams) != 3:
+            return {'retry': 'invalid request'}
+        if request.get('version') != PROTOCOL_VERSION:
+            return {'retry': 'protocol version mismatch'}
+        if request.get('environment') != self.server.environment_hash:
+            return {'retry': 'environment mismatch'}
+        if not self.server.refresh_auth():
+            self.server.stopped = True
+            return {'retry': 'token expired'}
+
+        rc = self.server.run_command(
+            request['argv'], request.get('cwd'), *streams
+        )
+        return {'rc': rc}
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serve commands with a single, long-lived :class:`OpenStackShell`
+
+    Requests are handled one at a time since the shell and the process-wide
+    standard streams are redirected while a command runs.
+
+    :param path: Path of the Unix socket to listen on
+    :param app: An initialized :class:`openstackclient.shell.OpenStackShell`
+    :param idle_timeout: Seconds without a request before the server stops
+    """
+
+    def __init__(self, path, app, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.app = app
+        self.environment_hash = get_environment_hash()
+        self.idle_timeout = idle_timeout
+        self.last_request = time.monotonic()
+        self.stopped = False
+        self.timeout = idle_timeout or None
+        self._log_stream = sys.stderr
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.stat(directory).st_uid != os.getuid():
+            raise RuntimeError(
+                'Socket directory %s is not owned by the current user'
+                % directory
+            )
+        if os.path.exists(path):
+            os.unlink(path)
+        socketserver.UnixStreamServer.__init__(self, path, _RequestHandler)
+        os.chmod(path, 0o600)
+
+    def handle_timeout(self):
+        if time.monotonic() - self.last_request >= self.idle_timeout:
+            LOG.debug('No request for %s seconds, exiting', self.idle_timeout)
+            self.stopped = True
+
+    def serve(self):
+        try:
+            while not self.stopped:
+                self.handle_request()
+        finally:
+            self.server_close()
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+
+    def refresh_auth(self):
+        """Drop the cached token when it is about to expire
+
+        The authentication plugin fetches a new token on the next request.
+        Returns ``False`` if the plugin cannot re-authenticate, as is the
+        case when a token was given on the command line.
+        """
+        client_manager = self.app.client_manager
+        auth_ref = getattr(client_manager, '_auth_ref', None)
+        if auth_ref is None or not auth_ref.will_expire_soon(
+            TOKEN_STALE_DURATION
+        ):
+            return True
+
+        LOG.debug('Token is about to expire, re-authenticating')
+        client_manager._auth_ref = None
+        if not client_manager.auth.invalidate():
+            return False
+        return True
+
+    def _redirect_logging(self, stream):
+        for handler in logging.getLogger('').handlers:
+            if (
+                isinstance(handler, logging.StreamHandler)
+                and handler.stream is self._log_stream
+            ):
+                handler.setStream(stream)
+        self._log_stream = stream
+
+    def run_command(self, argv, cwd, stdin, stdout, stderr):
+        """Run a command with the given streams
+
+        :returns: the exit status of the command
+        """
+        saved = (sys.stdin, sys.stdout, sys.stderr, os.getcwd())
+        log_stream = self._log_stream
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        self.app.stdin, self.app.stdout, self.app.stderr = (
+            stdin,
+            stdout,
+            stderr,
+        )
+        self._redirect_logging(stderr)
+        try:
+            if cwd:
+                os.chdir(cwd)
+            self.app.command_options = argv
+            return self.app.run_subcommand(argv)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            LOG.error(e)
+            return 1
+        finally:
+            try:
+                stdout.flush()
+                stderr.flush()
+            except OSError:
+                pass
+            self._redirect_logging(log_stream)
+            sys.stdin, sys.stdout, sys.stderr = saved[:3]
+            self.app.stdin, self.app.stdout, self.app.stderr = saved[:3]
+            os.chdir(saved[3])
+
+
+def make_app(argv):
+    """Create and initialize the shell shared by all requests
+
+    :param argv: Global options, as accepted by ``openstack``
+    """
+    from openstackclient import shell
+
+    app = shell.OpenStackShell()
+    app.options, remainder = app.parser.parse_known_args(argv)
+    app.configure_logging()
+    app.interactive_mode = False
+    app.initialize_app(remainder)
+    return app
+
+
+def server_main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog='openstack-daemon',
+        description='Serve openstack commands for openstack-client',
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        metavar='<seconds>',
+        type=int,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help='Exit after this many seconds without a request, 0 to never '
+        'exit (default: %d)' % DEFAULT_IDLE_TIMEOUT,
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Log the handled commands',
+    )
+    args = parser.parse_args(argv)
+
+    app = make_app(['--debug'] if args.debug else [])
+    path = get_socket_path()
+    server = DaemonServer(path, app, idle_timeout=args.idle_timeout)
+    sys.stderr.write('Listening on %s\n' % path)
+    server.serve()
+    return 0
+
+
+# Client
+
+
+def _run_local(argv):
+    from openstackclient import shell
+
+    return shell.main(argv)
+
+
+def run_remote(argv, path=None):
+    """Run a command through the daemon
+
+    The command only runs locally when no daemon is listening or the daemon
+    asks for it.  Once the request is sent, the daemon may have run the
+    command, so a lost response is an error rather than a reason to run the
+    command again.
+
+    :param argv: The command and its arguments
+    :param path: Socket of the daemon, by default the one serving the
+        current environment
+    :returns: the exit status of the command, or ``None`` if no daemon
+        could run it
+    """
+    path = path or get_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return None
+        try:
+            _send(
+                sock,
+                {
+                    'version': PROTOCOL_VERSION,
+                    'argv': argv,
+                    'cwd': os.getcwd(),
+                    'environment': get_environment_hash(),
+                },
+                fds=[
+                    sys.stdin.fileno(),
+                    sys.stdout.fileno(),
+                    sys.stderr.fileno(),
+                ],
+            )
+            response, _ = _recv(sock)
+        except (OSError, ValueError):
+            response = None
+    if response and 'retry' in response:
+        return None
+    if not response or 'rc' not in response:
+        sys.stderr.write(
+            'Lost the response of the openstack daemon, the command may '
+            'have run\n'
+        )
+        return LOST_RESPONSE_STATUS
+    return response['rc']
+
+
+def client_main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Global options would need a differently configured shell, and no
+    # arguments means interactive mode
+    if argv and not argv[0].startswith('-'):
+        sys.stdout.flush()
+        rc = run_remote(argv)
+        if rc is not None:
+            return rc
+    return _run_local(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(server_main())
@@ -23,6 +23,7 @@ from keystoneclient.v3 import users
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import resolution_cache
 from openstackclient.i18n import _
 
 
@@ -231,18 +232,39 @@ def _find_identity_resource(
     :returns: the resource in question
     :rtype: `keystoneclient.base.Resource`
 
+    The IDs of the resources found by name, and the names not found, are
+    cached with the session of the client, the resources are fetched again
+    by ID.
     """
 
-    try:
-        identity_resource = utils.find_resource(
-            identity_client_manager, name_or_id, **kwargs
-        )
-        if identity_resource is not None:
-            return identity_resource
-    except (exceptions.Forbidden, identity_exc.Forbidden):
-        pass
+    def _find(name_or_id):
+        try:
+            identity_resource = utils.find_resource(
+                identity_client_manager, name_or_id, **kwargs
+            )
+            if identity_resource is not None:
+                return identity_resource
+        except (exceptions.Forbidden, identity_exc.Forbidden):
+            pass
+
+        return resource_type(None, {'id': name_or_id, 'name': name_or_id})
 
-    return resource_type(None, {'id': name_or_id, 'name': name_or_id})
+    session = getattr(
+        getattr(identity_client_manager, 'client', None), 'session', None
+    )
+    return resolution_cache.find_resource(
+        resolution_cache.get_cache(session) if session is not None else None,
+        (
+            'identity',
+            resource_type.__name__,
+            name_or_id,
+            tuple(sorted(kwargs.items())),
+        ),
+        name_or_id,
+        _find,
+        _find,
+        not_found=(exceptions.CommandError,),
+    )
 
 
 def get_immutable_options(parsed_args):
@@ -49,8 +49,9 @@ class ProjectColumn(cliff_columns.FormattableColumn):
         project = self._value
         if not project:
             return ""
-        if project in self.project_cache.keys():
-            return self.project_cache[project].name
+        cached = self.project_cache.get(project)
+        if cached is not None:
+            return cached.name
         else:
             return project
 
@@ -245,14 +246,8 @@ class ListUser(command.Lister):
                 'Email',
                 'Enabled',
             )
-            # Cache the project list
-            project_cache = {}
-            try:
-                for p in identity_client.tenants.list():
-                    project_cache[p.id] = p
-            except Exception:
-                # Just forget it if there's any trouble
-                pass
+            # The project names are only fetched when they are displayed
+            project_cache = self.app.client_manager.get_project_lookup()
             formatters['tenantId'] = functools.partial(
                 ProjectColumn, project_cache=project_cache
             )
@@ -275,6 +270,7 @@ class ListUser(command.Lister):
                 if 'tenant_id' in d._info:
                     d._info['tenantId'] = d._info.pop('tenant_id')
                     d._add_details(d._info)
+            project_cache.defer(d._info.get('tenantId') for d in data)
 
         return (
             column_headers,
@@ -13,13 +13,22 @@
 
 """Identity v3 Assignment action implementations"""
 
+import collections
+import logging
+
 from osc_lib.command import command
 from osc_lib import utils
 
+from openstackclient.common import lookup
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 from openstackclient.i18n import _
 from openstackclient.identity import common
 
 
+LOG = logging.getLogger(__name__)
+
+
 class ListRoleAssignment(command.Lister):
     _description = _("List role assignments")
 
@@ -88,6 +97,167 @@ class ListRoleAssignment(command.Lister):
         )
         return parser
 
+    @staticmethod
+    def _get_lookup(manager):
+        """Return a lookup of the resources of a manager, listed in bulk
+
+        keystone cannot filter its listings by ID, so all the resources are
+        listed the first time some are looked up.  The resources missing
+        from the listing, such as domain specific roles, or all of them when
+        the caller cannot list them, are fetched one by one.
+        """
+        listed = []
+
+        def _get(resource_id):
+            try:
+                return manager.get(resource_id)
+            except Exception as e:
+                LOG.debug('Unable to get resource %s: %s', resource_id, e)
+                return None
+
+        def _list(ids):
+            resources = []
+            if not listed:
+                listed.append(True)
+                resources = list(manager.list())
+            found = set(resource.id for resource in resources)
+            missing = [i for i in ids if i not in found]
+            resources.extend(
+                r for r in parallel.run(_get, missing) if r is not None
+            )
+            return resources
+
+        return lookup.ResourceLookup(
+            get_resource=manager.get, list_resources=_list, chunked=False
+        )
+
+    def _get_lookups(self, identity_client):
+        return {
+            kind: self._get_lookup(getattr(identity_client, kind + 's'))
+            for kind in ('role', 'user', 'group', 'project', 'domain')
+        }
+
+    @staticmethod
+    def _resolve_names(assignments, lookups):
+        """Look up the resources referenced by assignments"""
+        ids = collections.defaultdict(list)
+        for assignment in assignments:
+            for kind in ('role', 'user', 'group'):
+                ref = getattr(assignment, kind, None)
+                if ref:
+                    ids[kind].append(ref['id'])
+            for kind in ('project', 'domain'):
+                ref = assignment.scope.get(kind)
+                if ref:
+                    ids[kind].append(ref['id'])
+
+        lookup.resolve(
+            [
+                (lookups[kind], ids[kind])
+                for kind in ('role', 'user', 'group', 'project')
+            ]
+        )
+
+        # The names of the users, groups and projects include their domain
+        for kind in ('user', 'group', 'project'):
+            for resource_id in ids[kind]:
+                domain_id = getattr(
+                    lookups[kind].get(resource_id), 'domain_id', None
+                )
+                if domain_id:
+                    ids['domain'].append(domain_id)
+        lookups['domain'].resolve(ids['domain'])
+
+    @staticmethod
+    def _get_name(lookups, kind, resource_id):
+        """Return the name of a resource, or its ID if it was not found
+
+        The users, groups and projects are named after their domain too, the
+        name alone is returned when their domain was not found.
+        """
+        resource = lookups[kind].get(resource_id)
+        if resource is None:
+            return resource_id
+        name = getattr(resource, 'name', None) or resource_id
+        if kind in ('role', 'domain'):
+            return name
+        domain = lookups['domain'].get(getattr(resource, 'domain_id', None))
+        domain_name = getattr(domain, 'name', None)
+        if domain_name:
+            return '@'.join([name, domain_name])
+        return name
+
+    def _iter_assignments(self, assignments, lookups):
+        """Yield the rows of the assignments, one page at a time
+
+        :param assignments: Iterable of the assignments
+        :param lookups: Lookups of the resources by type, to display their
+            names, or ``None`` to display the IDs
+        """
+        for page in streaming.pages(assignments):
+            if lookups is not None:
+                self._resolve_names(page, lookups)
+            for assignment in page:
+                yield self._as_tuple(self._flatten(assignment, lookups))
+
+    def _flatten(self, assignment, lookups):
+        def _name(kind, ref):
+            if lookups is None:
+                return ref['id']
+            return self._get_name(lookups, kind, ref['id'])
+
+        # Removing the extra "scope" layer in the assignment json
+        scope = assignment.scope
+        if 'project' in scope:
+            assignment.project = _name('project', scope['project'])
+            assignment.domain = ''
+            assignment.system = ''
+        elif 'domain' in scope:
+            assignment.domain = _name('domain', scope['domain'])
+            assignment.project = ''
+            assignment.system = ''
+        elif 'system' in scope:
+            # NOTE(lbragstad): If, or when, keystone supports role
+            # assignments on subsets of a system, this will have to evolve
+            # to handle that case instead of hardcoding to the entire
+            # system.
+            assignment.system = 'all'
+            assignment.domain = ''
+            assignment.project = ''
+        else:
+            assignment.system = ''
+            assignment.domain = ''
+            assignment.project = ''
+
+        inherited = scope.get('OS-INHERIT:inherited_to') == 'projects'
+        assignment.inherited = inherited
+
+        del assignment.scope
+
+        if hasattr(assignment, 'user'):
+            assignment.user = _name('user', assignment.user)
+            assignment.group = ''
+        elif hasattr(assignment, 'group'):
+            assignment.group = _name('group', assignment.group)
+            assignment.user = ''
+        else:
+            assignment.user = ''
+            assignment.group = ''
+
+        if hasattr(assignment, 'role'):
+            # TODO(henry-nash): If this is a domain specific role it would be
+            # good show this as role@domain.
+            assignment.role = _name('role', assignment.role)
+        else:
+            assignment.role = ''
+
+        return assignment
+
+    def produce_output(self, parsed_args, column_names, data):
+        # The assignments are written as they are processed
+        self.formatter = streaming.get_formatter(self.formatter)
+        return super().produce_output(parsed_args, column_names, data)
+
     def _as_tuple(self, assignment):
         return (
             assignment.role,
@@ -161,7 +331,6 @@ class ListRoleAssignment(command.Lister):
                 parsed_args.group_domain,
             )
 
-        include_names = True if parsed_args.names else False
         effective = True if parsed_args.effective else False
         columns = (
             'Role',
@@ -174,6 +343,8 @@ class ListRoleAssignment(command.Lister):
         )
 
         inherited_to = 'projects' if parsed_args.inherited else None
+        # keystone joins the names of the resources to every assignment when
+        # asked to include them, they are listed once instead
         data = identity_client.role_assignments.list(
             domain=domain,
             user=user,
@@ -183,95 +354,10 @@ class ListRoleAssignment(command.Lister):
             role=role,
             effective=effective,
             os_inherit_extension_inherited_to=inherited_to,
-            include_names=include_names,
+            include_names=False,
         )
 
-        data_parsed = []
-        for assignment in data:
-            # Removing the extra "scope" layer in the assignment json
-            scope = assignment.scope
-            if 'project' in scope:
-                if include_names:
-                    prj = '@'.join(
-                        [
-                            scope['project']['name'],
-                            scope['project']['domain']['name'],
-                        ]
-                    )
-                    setattr(assignment, 'project', prj)
-                else:
-                    setattr(assignment, 'project', scope['project']['id'])
-                assignment.domain = ''
-                assignment.system = ''
-            elif 'domain' in scope:
-                if include_names:
-                    setattr(assignment, 'domain', scope['domain']['name'])
-                else:
-                    setattr(assignment, 'domain', scope['domain']['id'])
-                assignment.project = ''
-                assignment.system = ''
-            elif 'system' in scope:
-                # NOTE(lbragstad): If, or when, keystone supports role
-                # assignments on subsets of a system, this will have to evolve
-                # to handle that case instead of hardcoding to the entire
-                # system.
-                setattr(assignment, 'system', 'all')
-                assignment.domain = ''
-                assignment.project = ''
-            else:
-                assignment.system = ''
-                assignment.domain = ''
-                assignment.project = ''
-
-            inherited = scope.get('OS-INHERIT:inherited_to') == 'projects'
-            assignment.inherited = inherited
-
-            del assignment.scope
-
-            if hasattr(assignment, 'user'):
-                if include_names:
-                    usr = '@'.join(
-                        [
-                            assignment.user['name'],
-                            assignment.user['domain']['name'],
-                        ]
-                    )
-                    setattr(assignment, 'user', usr)
-                else:
-                    setattr(assignment, 'user', assignment.user['id'])
-                assignment.group = ''
-            elif hasattr(assignment, 'group'):
-                if include_names:
-                    grp = '@'.join(
-                        [
-                            assignment.group['name'],
-                            assignment.group['domain']['name'],
-                        ]
-                    )
-                    setattr(assignment, 'group', grp)
-                else:
-                    setattr(assignment, 'group', assignment.group['id'])
-                assignment.user = ''
-            else:
-                assignment.user = ''
-                assignment.group = ''
-
-            if hasattr(assignment, 'role'):
-                if include_names:
-                    # TODO(henry-nash): If this is a domain specific role it
-                    # would be good show this as role@domain, although this
-                    # domain info is not yet included in the response from the
-                    # server. Although we could get it by re-reading the role
-                    # from the ID, let's wait until the server does the right
-                    # thing.
-                    setattr(assignment, 'role', assignment.role['name'])
-                else:
-                    setattr(assignment, 'role', assignment.role['id'])
-            else:
-                assignment.role = ''
-
-            # Creating a tuple from data object fields
-            # (including the blank ones)
-            data_parsed.append(self._as_tuple(assignment))
-
-        return columns, tuple(data_parsed)
+        lookups = None
+        if parsed_args.names:
+            lookups = self._get_lookups(identity_client)
+        return columns, self._iter_assignments(data, lookups)
@@ -17,6 +17,7 @@
 
 import argparse
 from base64 import b64encode
+import hashlib
 import logging
 import os
 import sys
@@ -31,6 +32,9 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import bulk
+from openstackclient.common import cache
+from openstackclient.common import parallel
 from openstackclient.common import progressbar
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
@@ -58,6 +62,13 @@ DISK_CHOICES = [
     "ploop",
 ]
 MEMBER_STATUS_CHOICES = ["accepted", "pending", "rejected", "all"]
+# Size of the buffer image files are read through, so that large images are
+# uploaded with few system calls
+UPLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+# Size of the byte ranges fetched concurrently by ``image save --parallel``
+DOWNLOAD_RANGE_SIZE = 64 * 1024 * 1024
+# Size of the chunks read from a response and written to an image file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 LOG = logging.getLogger(__name__)
@@ -134,6 +145,168 @@ def _get_member_columns(item):
     )
 
 
+class _HashingFileWrapper(object):
+    """A file wrapper hashing the data read from the wrapped file
+
+    :param wrapped: File to read the data from
+    :param algorithms: Names of the hash algorithms to compute
+    """
+
+    def __init__(self, wrapped, algorithms=('md5',)):
+        self._wrapped = wrapped
+        self._hashes = {}
+        for name in algorithms:
+            try:
+                self._hashes[name] = hashlib.new(name, usedforsecurity=False)
+            except TypeError:
+                # Python < 3.9
+                self._hashes[name] = hashlib.new(name)
+
+    def hexdigest(self, name):
+        return self._hashes[name].hexdigest()
+
+    def read(self, *args, **kwargs):
+        data = self._wrapped.read(*args, **kwargs)
+        for value in self._hashes.values():
+            value.update(data)
+        return data
+
+    def __getattr__(self, attr):
+        # Forward other attribute access to the wrapped object.
+        return getattr(self._wrapped, attr)
+
+
+def _open_image_file(filename):
+    try:
+        return open(filename, 'rb', buffering=UPLOAD_BUFFER_SIZE)
+    except FileNotFoundError:
+        raise exceptions.CommandError(
+            '%r is not a valid file' % filename,
+        )
+
+
+class _RangesNotSupported(Exception):
+    """The Image service ignored the range of an image data request"""
+
+
+def _get_image_hasher(image):
+    # Same precedence as the SDK when it checks downloaded image data
+    if image.hash_algo and image.hash_value:
+        try:
+            return hashlib.new(image.hash_algo), image.hash_value
+        except ValueError:
+            LOG.debug('Unsupported hash algorithm %s', image.hash_algo)
+    if image.checksum:
+        try:
+            return hashlib.new('md5', usedforsecurity=False), image.checksum
+        except TypeError:
+            # Python < 3.9
+            return hashlib.new('md5'), image.checksum
+    return None, None
+
+
+def _download_image_ranges(image_client, image, filename, workers):
+    """Download the data of an image in byte ranges fetched concurrently
+
+    The ranges are written at their offset in a file of the size of the
+    image, and hashed in order while the following ones are fetched.  The
+    ranges downloaded are recorded in a state file next to the image file so
+    that an interrupted download only fetches the missing ranges when run
+    again.
+
+    :param image_client: Image client
+    :param image: Image to download
+    :param filename: Path of the file to write the image data to
+    :param workers: Maximum number of concurrent requests
+    :returns: ``False`` if the Image service does not support range
+        requests, the image must then be downloaded sequentially
+    """
+    url = '/images/%s/file' % image.id
+    state_path = filename + '.ranges'
+    state = {
+        'image': image.id,
+        'size': image.size,
+        'checksum': image.checksum,
+        'range_size': DOWNLOAD_RANGE_SIZE,
+        'ranges': [],
+    }
+    stored = cache.read_json(state_path)
+    if (
+        isinstance(stored, dict)
+        and all(stored.get(k) == v for k, v in state.items() if k != 'ranges')
+        and os.path.exists(filename)
+    ):
+        state['ranges'] = stored.get('ranges') or []
+    done = set(state['ranges'])
+
+    def _download(offset):
+        end = min(offset + DOWNLOAD_RANGE_SIZE, image.size) - 1
+        response = image_client.get(
+            url,
+            headers={'Range': 'bytes=%d-%d' % (offset, end)},
+            stream=True,
+        )
+        try:
+            if response.status_code != 206:
+                raise _RangesNotSupported()
+            position = offset
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, position)
+                    view = view[written:]
+                    position += written
+        finally:
+            response.close()
+        if position != end + 1:
+            msg = _("Incomplete data received for the range %(start)d-%(end)d")
+            raise exceptions.CommandError(msg % {'start': offset, 'end': end})
+
+    offsets = range(0, image.size, DOWNLOAD_RANGE_SIZE)
+    hasher, expected = _get_image_hasher(image)
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o644)
+    results = parallel.imap(
+        _download, [o for o in offsets if o not in done], workers
+    )
+    try:
+        os.ftruncate(fd, image.size)
+        for offset in offsets:
+            if offset not in done:
+                next(results)
+                state['ranges'].append(offset)
+                cache.write_json(state_path, state)
+            if hasher is None:
+                continue
+            end = min(offset + DOWNLOAD_RANGE_SIZE, image.size)
+            for position in range(offset, end, DOWNLOAD_CHUNK_SIZE):
+                hasher.update(
+                    os.pread(
+                        fd, min(DOWNLOAD_CHUNK_SIZE, end - position), position
+                    )
+                )
+    except _RangesNotSupported:
+        return False
+    finally:
+        results.close()
+        os.close(fd)
+
+    # The data is checked once whole, a new download is needed if it does
+    # not match
+    try:
+        os.remove(state_path)
+    except FileNotFoundError:
+        pass
+    if hasher is None:
+        LOG.warning(
+            "Unable to verify the integrity of image %s - no hash available",
+            image.id,
+        )
+    elif hasher.hexdigest() != expected:
+        msg = _("Checksum of the data of image %(image)s does not match")
+        raise exceptions.CommandError(msg % {'image': image.id})
+    return True
+
+
 def get_data_from_stdin():
     # distinguish cases where:
     # (1) stdin is not valid (as in cron jobs):
@@ -464,12 +637,7 @@ class CreateImage(command.ShowOne):
         # image is created. Get the file name (if it is file, and not stdin)
         # for easier further handling.
         if parsed_args.filename:
-            try:
-                fp = open(parsed_args.filename, 'rb')
-            except FileNotFoundError:
-                raise exceptions.CommandError(
-                    '%r is not a valid file' % parsed_args.filename,
-                )
+            fp = _open_image_file(parsed_args.filename)
         else:
             fp = get_data_from_stdin()
 
@@ -480,20 +648,7 @@ class CreateImage(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        if parsed_args.progress and parsed_args.filename:
-            # NOTE(stephenfin): we only show a progress bar if the user
-            # requested it *and* we're reading from a file (not stdin)
-            filesize = os.path.getsize(parsed_args.filename)
-            if filesize is not None:
-                kwargs['validate_checksum'] = False
-                kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-            else:
-                kwargs['data'] = fp
-        elif parsed_args.filename:
-            kwargs['filename'] = parsed_args.filename
-        elif fp:
-            kwargs['validate_checksum'] = False
-            kwargs['data'] = fp
+        checksums = None
 
         # sign an image using a given local private key file
         if parsed_args.sign_key_path or parsed_args.sign_cert_id:
@@ -543,18 +698,55 @@ class CreateImage(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-            signature = signer.generate_signature(fp)
+            # NOTE: the signature must be set when the image is created,
+            # the checksums are computed while the file is read to sign it
+            checksums = _HashingFileWrapper(fp, ('md5', 'sha256'))
+            signature = signer.generate_signature(checksums)
             signature_b64 = b64encode(signature)
+            kwargs['md5'] = checksums.hexdigest('md5')
+            kwargs['sha256'] = checksums.hexdigest('sha256')
             kwargs['img_signature'] = signature_b64
             kwargs['img_signature_certificate_uuid'] = sign_cert_id
             kwargs['img_signature_hash_method'] = signer.hash_method
             if signer.padding_method:
                 kwargs['img_signature_key_type'] = signer.padding_method
 
-        image = image_client.create_image(**kwargs)
+        if fp is not None:
+            # NOTE: the data is hashed while it is uploaded rather than read
+            # beforehand by the SDK, the checksum is then compared with the
+            # one computed by the server
+            data = fp
+            if checksums is None:
+                data = checksums = _HashingFileWrapper(fp)
+            if parsed_args.progress and parsed_args.filename:
+                # NOTE(stephenfin): we only show a progress bar if the user
+                # requested it *and* we're reading from a file (not stdin)
+                filesize = os.path.getsize(parsed_args.filename)
+                data = progressbar.VerboseFileWrapper(data, filesize)
+            kwargs['validate_checksum'] = False
+            kwargs['data'] = data
 
-        if parsed_args.filename:
-            fp.close()
+        try:
+            image = image_client.create_image(**kwargs)
+        finally:
+            if parsed_args.filename:
+                fp.close()
+
+        if checksums is not None:
+            image = image_client.get_image(image.id)
+            checksum = checksums.hexdigest('md5')
+            # NOTE: the checksum is only known once the data is imported
+            # when the interoperable image import process is used
+            if image.checksum and image.checksum != checksum:
+                msg = _(
+                    "Checksum of image %(image)s is %(actual)s, "
+                    "expected %(expected)s"
+                ) % {
+                    'image': image.id,
+                    'actual': image.checksum,
+                    'expected': checksum,
+                }
+                raise exceptions.CommandError(msg)
 
         return _format_image(image)
 
@@ -660,12 +852,13 @@ class DeleteImage(command.Command):
             dest='store',
             help=_('Store to delete image(s) from.'),
         )
+        bulk.add_parallel_option(parser)
         return parser
 
     def take_action(self, parsed_args):
-        del_result = 0
         image_client = self.app.client_manager.image
-        for image in parsed_args.images:
+
+        def _delete(image):
             try:
                 image_obj = image_client.find_image(
                     image,
@@ -683,15 +876,17 @@ class DeleteImage(command.Command):
             except sdk_exceptions.ResourceNotFound:
                 msg = _("Multi Backend support not enabled.")
                 raise exceptions.CommandError(msg)
-            except Exception as e:
-                del_result += 1
-                msg = _(
-                    "Failed to delete image with name or "
-                    "ID '%(image)s': %(e)s"
-                )
-                LOG.error(msg, {'image': image, 'e': e})
+
+        results = bulk.run(
+            _delete,
+            parsed_args.images,
+            'image',
+            workers=parsed_args.parallel,
+            fatal=(exceptions.CommandError,),
+        )
 
         total = len(parsed_args.images)
+        del_result = total - len(results)
         if del_result > 0:
             msg = _("Failed to delete %(dresult)s of %(total)s images.") % {
                 'dresult': del_result,
@@ -1017,6 +1212,18 @@ class SaveImage(command.Command):
             dest="filename",
             help=_("Downloaded image save filename (default: stdout)"),
         )
+        parser.add_argument(
+            "--parallel",
+            metavar="<count>",
+            type=int,
+            default=1,
+            help=_(
+                "Download the image in byte ranges with up to <count> "
+                "concurrent requests when the Image service supports range "
+                "requests, requires --file. An interrupted download is "
+                "resumed when run again with the same file (default: 1)"
+            ),
+        )
         parser.add_argument(
             "image",
             metavar="<image>",
@@ -1031,6 +1238,25 @@ class SaveImage(command.Command):
             ignore_missing=False,
         )
 
+        if parsed_args.parallel < 1:
+            msg = _("--parallel must be a positive number")
+            raise exceptions.CommandError(msg)
+        if parsed_args.parallel > 1:
+            if not parsed_args.filename:
+                msg = _("--parallel requires --file")
+                raise exceptions.CommandError(msg)
+            if not hasattr(os, 'pwrite'):
+                LOG.warning(
+                    _("Parallel downloads are not supported on this platform")
+                )
+            elif image.size and _download_image_ranges(
+                image_client,
+                image,
+                parsed_args.filename,
+                parsed_args.parallel,
+            ):
+                return
+
         output_file = parsed_args.filename
         if output_file is None:
             output_file = getattr(sys.stdout, "buffer", sys.stdout)
@@ -1569,12 +1795,7 @@ class StageImage(command.Command):
         # image is created. Get the file name (if it is file, and not stdin)
         # for easier further handling.
         if parsed_args.filename:
-            try:
-                fp = open(parsed_args.filename, 'rb')
-            except FileNotFoundError:
-                raise exceptions.CommandError(
-                    '%r is not a valid file' % parsed_args.filename,
-                )
+            fp = _open_image_file(parsed_args.filename)
         else:
             fp = get_data_from_stdin()
 
@@ -1584,16 +1805,15 @@ class StageImage(command.Command):
             # NOTE(stephenfin): we only show a progress bar if the user
             # requested it *and* we're reading from a file (not stdin)
             filesize = os.path.getsize(parsed_args.filename)
-            if filesize is not None:
-                kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-            else:
-                kwargs['data'] = fp
-        elif parsed_args.filename:
-            kwargs['filename'] = parsed_args.filename
+            kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
         elif fp:
             kwargs['data'] = fp
 
-        image_client.stage_image(image, **kwargs)
+        try:
+            image_client.stage_image(image, **kwargs)
+        finally:
+            if parsed_args.filename:
+                fp.close()
 
 
 class ImportImage(command.ShowOne):
@@ -13,6 +13,7 @@
 
 import abc
 import contextlib
+import copy
 import logging
 
 import openstack.exceptions
@@ -20,6 +21,7 @@ from osc_lib.cli import parseractions
 from osc_lib.command import command
 from osc_lib import exceptions
 
+from openstackclient.common import bulk
 from openstackclient.i18n import _
 from openstackclient.network import utils
 
@@ -55,6 +57,38 @@ def check_missing_extension_if_error(client_manager, attrs):
         raise
 
 
+def get_list_fields(resource_type, column_headers, attrs, parsed_args):
+    """Return the fields to request to display the columns of a listing
+
+    Neutron returns only the fields given in the ``fields`` filter, which
+    makes the responses of large listings much smaller.
+
+    :param resource_type: The openstacksdk resource class of the listing
+    :param column_headers: The headers of the columns of the listing
+    :param attrs: The resource attributes displayed in each column
+    :param parsed_args: The parsed arguments, only the columns selected with
+        ``--column`` and the columns sorted with ``--sort-column`` are
+        requested if any
+    :returns: A tuple of the server-side names of the fields, the attributes
+        which are not fields of the resource are ignored
+    """
+    if getattr(parsed_args, 'columns', None):
+        # The rows are sorted before the columns are selected
+        columns = list(parsed_args.columns) + list(
+            getattr(parsed_args, 'sort_columns', None) or []
+        )
+        header_attr_map = dict(zip(column_headers, attrs))
+        attrs = [header_attr_map.get(c, c) for c in columns]
+    fields = []
+    for attr in attrs:
+        # openstacksdk passes the fields as is, they must use the names of
+        # the API rather than the names of the resource attributes
+        field = getattr(getattr(resource_type, attr, None), 'name', None)
+        if field is not None and field not in fields:
+            fields.append(field)
+    return tuple(fields)
+
+
 class NetDetectionMixin(metaclass=abc.ABCMeta):
     """Convenience methods for nova-network vs. neutron decisions.
 
@@ -197,41 +231,31 @@ class NetworkAndComputeDelete(NetworkAndComputeCommand, metaclass=abc.ABCMeta):
     following the rules in doc/source/command-errors.rst.
     """
 
+    def get_parser(self, prog_name):
+        parser = super(NetworkAndComputeDelete, self).get_parser(prog_name)
+        bulk.add_parallel_option(parser)
+        return parser
+
     def take_action(self, parsed_args):
-        ret = 0
         resources = getattr(parsed_args, self.resource, [])
-
-        for r in resources:
-            self.r = r
-            try:
-                if self.app.client_manager.is_network_endpoint_enabled():
-                    self.take_action_network(
-                        self.app.client_manager.network, parsed_args
-                    )
-                else:
-                    self.take_action_compute(
-                        self.app.client_manager.compute, parsed_args
-                    )
-            except Exception as e:
-                msg = _(
-                    "Failed to delete %(resource)s with name or ID "
-                    "'%(name_or_id)s': %(e)s"
-                ) % {
-                    "resource": self.resource,
-                    "name_or_id": r,
-                    "e": e,
-                }
-                LOG.error(msg)
-                ret += 1
-
-        if ret:
-            total = len(resources)
-            msg = _("%(num)s of %(total)s %(resource)ss failed to delete.") % {
-                "num": ret,
-                "total": total,
-                "resource": self.resource,
-            }
-            raise exceptions.CommandError(msg)
+        if self.app.client_manager.is_network_endpoint_enabled():
+            client = self.app.client_manager.network
+            take_action = 'take_action_network'
+        else:
+            client = self.app.client_manager.compute
+            take_action = 'take_action_compute'
+
+        def _delete(r):
+            # Each resource is deleted by its own copy of the command, so
+            # that self.r is not shared by the resources deleted
+            # concurrently
+            cmd = copy.copy(self)
+            cmd.r = r
+            getattr(cmd, take_action)(client, parsed_args)
+
+        bulk.delete(
+            _delete, resources, self.resource, workers=parsed_args.parallel
+        )
 
 
 class NetworkAndComputeLister(
@@ -13,6 +13,7 @@
 
 """IP Floating action implementations"""
 
+from openstack.network.v2 import floating_ip as _floating_ip
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
@@ -45,10 +46,9 @@ def _get_attrs(client_manager, parsed_args):
 
     # Name of a network could be empty string.
     if parsed_args.network is not None:
-        network = network_client.find_network(
-            parsed_args.network, ignore_missing=False
+        attrs['floating_network_id'] = client_manager.find_resource_id(
+            network_client, 'network', parsed_args.network
         )
-        attrs['floating_network_id'] = network.id
 
     if parsed_args.subnet:
         subnet = network_client.find_subnet(
@@ -361,10 +361,10 @@ class ListFloatingIP(common.NetworkAndComputeLister):
         query = {}
 
         if parsed_args.network is not None:
-            network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            network_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
             )
-            query['floating_network_id'] = network.id
+            query['floating_network_id'] = network_id
         if parsed_args.port is not None:
             port = network_client.find_port(
                 parsed_args.port, ignore_missing=False
@@ -391,7 +391,12 @@ class ListFloatingIP(common.NetworkAndComputeLister):
 
         _tag.get_tag_filtering_args(parsed_args, query)
 
-        data = client.ips(**query)
+        data = client.ips(
+            fields=common.get_list_fields(
+                _floating_ip.FloatingIP, headers, columns, parsed_args
+            ),
+            **query,
+        )
 
         return (
             headers,
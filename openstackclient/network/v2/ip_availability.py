@@ -115,9 +115,9 @@ class ShowIPAvailability(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        network_id = client.find_network(
-            parsed_args.network, ignore_missing=False
-        ).id
+        network_id = self.app.client_manager.find_resource_id(
+            client, 'network', parsed_args.network
+        )
         obj = client.find_network_ip_availability(
             network_id, ignore_missing=False
         )
@@ -52,10 +52,9 @@ def _get_attrs(client_manager, parsed_args):
         ).id
         attrs['project_id'] = project_id
     if parsed_args.network:
-        network = network_client.find_network(
-            parsed_args.network, ignore_missing=False
+        attrs['network_id'] = client_manager.find_resource_id(
+            network_client, 'network', parsed_args.network
         )
-        attrs['network_id'] = network.id
     if parsed_args.local_ip_address:
         attrs['local_ip_address'] = parsed_args.local_ip_address
     if parsed_args.local_port:
@@ -266,10 +265,9 @@ class ListLocalIP(command.Lister):
             ).id
             attrs['project_id'] = project_id
         if parsed_args.network is not None:
-            network = client.find_network(
-                parsed_args.network, ignore_missing=False
+            attrs['network_id'] = self.app.client_manager.find_resource_id(
+                client, 'network', parsed_args.network
             )
-            attrs['network_id'] = network.id
         if parsed_args.local_port:
             port = client.find_port(
                 parsed_args.local_port, ignore_missing=False
@@ -14,6 +14,7 @@
 """Network action implementations"""
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import network as _network
 from osc_lib.cli import format_columns
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
@@ -648,7 +649,12 @@ class ListNetwork(common.NetworkAndComputeLister):
 
         _tag.get_tag_filtering_args(parsed_args, args)
 
-        data = client.networks(**args)
+        data = client.networks(
+            fields=common.get_list_fields(
+                _network.Network, column_headers, columns, parsed_args
+            ),
+            **args,
+        )
 
         return (
             column_headers,
@@ -82,8 +82,8 @@ class AddNetworkToAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = self.app.client_manager.find_resource(
+            client, 'network', parsed_args.network
         )
         if parsed_args.dhcp:
             try:
@@ -257,8 +257,8 @@ class ListNetworkAgent(command.Lister):
         filters = {}
 
         if parsed_args.network is not None:
-            network = client.find_network(
-                parsed_args.network, ignore_missing=False
+            network = self.app.client_manager.find_resource(
+                client, 'network', parsed_args.network
             )
             data = client.network_hosting_dhcp_agents(network)
         elif parsed_args.router is not None:
@@ -314,8 +314,8 @@ class RemoveNetworkFromAgent(command.Command):
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         agent = client.get_agent(parsed_args.agent_id)
-        network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        network = self.app.client_manager.find_resource(
+            client, 'network', parsed_args.network
         )
         if parsed_args.dhcp:
             try:
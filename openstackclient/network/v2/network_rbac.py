@@ -43,9 +43,9 @@ def _get_attrs(client_manager, parsed_args):
 
     network_client = client_manager.network
     if parsed_args.type == 'network':
-        object_id = network_client.find_network(
-            parsed_args.rbac_object, ignore_missing=False
-        ).id
+        object_id = client_manager.find_resource_id(
+            network_client, 'network', parsed_args.rbac_object
+        )
     if parsed_args.type == 'qos_policy':
         object_id = network_client.find_qos_policy(
             parsed_args.rbac_object, ignore_missing=False
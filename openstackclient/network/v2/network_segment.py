@@ -86,9 +86,9 @@ class CreateNetworkSegment(
         client = self.app.client_manager.network
         attrs = {}
         attrs['name'] = parsed_args.name
-        attrs['network_id'] = client.find_network(
-            parsed_args.network, ignore_missing=False
-        ).id
+        attrs['network_id'] = self.app.client_manager.find_resource_id(
+            client, 'network', parsed_args.network
+        )
         attrs['network_type'] = parsed_args.network_type
         if parsed_args.description is not None:
             attrs['description'] = parsed_args.description
@@ -172,10 +172,10 @@ class ListNetworkSegment(command.Lister):
 
         filters = {}
         if parsed_args.network:
-            _network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            network_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
             )
-            filters = {'network_id': _network.id}
+            filters = {'network_id': network_id}
         data = network_client.segments(**filters)
 
         headers = (
@@ -19,6 +19,7 @@ import json
 import logging
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import port as _port
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -26,6 +27,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
+from openstackclient.common import bulk
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common
@@ -565,10 +567,9 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        _network = client.find_network(
-            parsed_args.network, ignore_missing=False
+        parsed_args.network = self.app.client_manager.find_resource_id(
+            client, 'network', parsed_args.network
         )
-        parsed_args.network = _network.id
         _prepare_fixed_ips(self.app.client_manager, parsed_args)
         attrs = _get_attrs(self.app.client_manager, parsed_args)
 
@@ -663,33 +664,19 @@ class DeletePort(command.Command):
             nargs="+",
             help=_("Port(s) to delete (name or ID)"),
         )
+        bulk.add_parallel_option(parser)
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        result = 0
 
-        for port in parsed_args.port:
-            try:
-                obj = client.find_port(port, ignore_missing=False)
-                client.delete_port(obj)
-            except Exception as e:
-                result += 1
-                LOG.error(
-                    _(
-                        "Failed to delete port with "
-                        "name or ID '%(port)s': %(e)s"
-                    ),
-                    {'port': port, 'e': e},
-                )
+        def _delete(port):
+            obj = client.find_port(port, ignore_missing=False)
+            client.delete_port(obj)
 
-        if result > 0:
-            total = len(parsed_args.port)
-            msg = _("%(result)s of %(total)s ports failed " "to delete.") % {
-                'result': result,
-                'total': total,
-            }
-            raise exceptions.CommandError(msg)
+        bulk.delete(
+            _delete, parsed_args.port, 'port', workers=parsed_args.parallel
+        )
 
 
 # TODO(abhiraut): Use only the SDK resource mapped attribute names once the
@@ -823,10 +810,9 @@ class ListPort(command.Lister):
         if parsed_args.host:
             filters['binding:host_id'] = parsed_args.host
         if parsed_args.network:
-            network = network_client.find_network(
-                parsed_args.network, ignore_missing=False
+            filters['network_id'] = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
             )
-            filters['network_id'] = network.id
         if parsed_args.mac_address:
             filters['mac_address'] = parsed_args.mac_address
         if parsed_args.project:
@@ -847,11 +833,15 @@ class ListPort(command.Lister):
 
         _tag.get_tag_filtering_args(parsed_args, filters)
 
-        data = network_client.ports(fields=columns, **filters)
-
         headers, attrs = utils.calculate_header_and_attrs(
             column_headers, columns, parsed_args
         )
+        data = network_client.ports(
+            fields=common.get_list_fields(
+                _port.Port, headers, attrs, parsed_args
+            ),
+            **filters,
+        )
         return (
             headers,
             (
@@ -18,6 +18,7 @@ import json
 import logging
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import router as _router
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -116,10 +117,9 @@ def _get_attrs(client_manager, parsed_args):
     if parsed_args.external_gateway:
         gateway_info = {}
         n_client = client_manager.network
-        network = n_client.find_network(
-            parsed_args.external_gateway, ignore_missing=False
+        gateway_info['network_id'] = client_manager.find_resource_id(
+            n_client, 'network', parsed_args.external_gateway
         )
-        gateway_info['network_id'] = network.id
         if parsed_args.disable_snat:
             gateway_info['enable_snat'] = False
         if parsed_args.enable_snat:
@@ -574,6 +574,25 @@ class ListRouter(command.Lister):
 
         _tag.get_tag_filtering_args(parsed_args, args)
 
+        long_columns = ()
+        long_headers = ()
+        if parsed_args.long:
+            long_columns = (
+                'routes',
+                'external_gateway_info',
+            )
+            long_headers = (
+                'Routes',
+                'External gateway info',
+            )
+            # availability zone will be available only when
+            # router_availability_zone extension is enabled
+            if client.find_extension("router_availability_zone"):
+                long_columns = long_columns + ('availability_zones',)
+                long_headers = long_headers + ('Availability zones',)
+            long_columns = long_columns + ('tags',)
+            long_headers = long_headers + ('Tags',)
+
         if parsed_args.agent is not None:
             agent = client.get_agent(parsed_args.agent)
             data = client.agent_hosted_routers(agent)
@@ -581,7 +600,15 @@ class ListRouter(command.Lister):
             # so we need filtering in the client side.
             data = [d for d in data if self._filter_match(d, args)]
         else:
-            data = client.routers(**args)
+            data = client.routers(
+                fields=common.get_list_fields(
+                    _router.Router,
+                    column_headers + ('Distributed', 'HA') + long_headers,
+                    columns + ('is_distributed', 'is_ha') + long_columns,
+                    parsed_args,
+                ),
+                **args,
+            )
 
         # check if "HA" and "Distributed" columns should be displayed also
         data = list(data)
@@ -595,22 +622,8 @@ class ListRouter(command.Lister):
             if d.is_ha is not None and 'is_ha' not in columns:
                 columns = columns + ('is_ha',)
                 column_headers = column_headers + ('HA',)
-        if parsed_args.long:
-            columns = columns + (
-                'routes',
-                'external_gateway_info',
-            )
-            column_headers = column_headers + (
-                'Routes',
-                'External gateway info',
-            )
-            # availability zone will be available only when
-            # router_availability_zone extension is enabled
-            if client.find_extension("router_availability_zone"):
-                columns = columns + ('availability_zones',)
-                column_headers = column_headers + ('Availability zones',)
-            columns = columns + ('tags',)
-            column_headers = column_headers + ('Tags',)
+        columns = columns + long_columns
+        column_headers = column_headers + long_headers
 
         return (
             column_headers,
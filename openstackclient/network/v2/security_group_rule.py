@@ -16,6 +16,7 @@
 import argparse
 import logging
 
+from openstack.network.v2 import security_group_rule as _security_group_rule
 from osc_lib.cli import parseractions
 from osc_lib import exceptions
 from osc_lib import utils
@@ -598,9 +599,17 @@ class ListSecurityGroupRule(common.NetworkAndComputeLister):
         if parsed_args.protocol is not None:
             query['protocol'] = parsed_args.protocol
 
+        # The port range is computed from the minimum and maximum ports, and
+        # the IP range from the ethertype, request all the fields needed
+        fields = common.get_list_fields(
+            _security_group_rule.SecurityGroupRule,
+            column_headers,
+            columns + ('port_range_min', 'port_range_max'),
+            None,
+        )
         rules = [
             self._format_network_security_group_rule(r)
-            for r in client.security_group_rules(**query)
+            for r in client.security_group_rules(fields=fields, **query)
         ]
 
         return (
@@ -683,20 +692,9 @@ class ShowSecurityGroupRule(common.NetworkAndComputeShowOne):
         return (display_columns, data)
 
     def take_action_compute(self, client, parsed_args):
-        # NOTE(rtheis): Unfortunately, compute does not have an API
-        # to get or list security group rules so parse through the
-        # security groups to find all accessible rules in search of
-        # the requested rule.
-        obj = None
-        security_group_rules = []
-        for security_group in client.api.security_group_list():
-            security_group_rules.extend(security_group['rules'])
-        for security_group_rule in security_group_rules:
-            if parsed_args.rule == str(security_group_rule.get('id')):
-                obj = security_group_rule
-                break
-
-        if obj is None:
+        try:
+            obj = client.api.security_group_rule_find(parsed_args.rule)
+        except exceptions.NotFound:
             msg = (
                 _("Could not find security group rule " "with ID '%s'")
                 % parsed_args.rule
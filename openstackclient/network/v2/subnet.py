@@ -17,6 +17,7 @@ import copy
 import logging
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import subnet as _subnet
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -205,9 +206,9 @@ def _get_attrs(client_manager, parsed_args, is_create=True):
                 parsed_args.project_domain,
             ).id
             attrs['project_id'] = project_id
-        attrs['network_id'] = client.find_network(
-            parsed_args.network, ignore_missing=False
-        ).id
+        attrs['network_id'] = client_manager.find_resource_id(
+            client, 'network', parsed_args.network
+        )
         if parsed_args.subnet_pool is not None:
             subnet_pool = client.find_subnet_pool(
                 parsed_args.subnet_pool, ignore_missing=False
@@ -580,9 +581,9 @@ class ListSubnet(command.Lister):
             ).id
             filters['project_id'] = project_id
         if parsed_args.network:
-            network_id = network_client.find_network(
-                parsed_args.network, ignore_missing=False
-            ).id
+            network_id = self.app.client_manager.find_resource_id(
+                network_client, 'network', parsed_args.network
+            )
             filters['network_id'] = network_id
         if parsed_args.gateway:
             filters['gateway_ip'] = parsed_args.gateway
@@ -596,7 +597,6 @@ class ListSubnet(command.Lister):
             ).id
             filters['subnetpool_id'] = subnetpool_id
         _tag.get_tag_filtering_args(parsed_args, filters)
-        data = network_client.subnets(**filters)
 
         headers = ('ID', 'Name', 'Network', 'Subnet')
         columns = ('id', 'name', 'network_id', 'cidr')
@@ -624,6 +624,13 @@ class ListSubnet(command.Lister):
                 'tags',
             )
 
+        data = network_client.subnets(
+            fields=common.get_list_fields(
+                _subnet.Subnet, headers, columns, parsed_args
+            ),
+            **filters,
+        )
+
         return (
             headers,
             (
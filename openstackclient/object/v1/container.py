@@ -16,10 +16,12 @@
 """Container v1 action implementations"""
 
 import logging
+import time
 
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
+from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.i18n import _
@@ -155,6 +157,16 @@ class ListContainer(command.Lister):
             default=False,
             help=_('List all containers (default is 10000)'),
         )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=None,
+            help=_(
+                'With --all, split the listing in <count> ranges of names '
+                'listed concurrently (default: 1)'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -174,6 +186,8 @@ class ListContainer(command.Lister):
             kwargs['limit'] = parsed_args.limit
         if parsed_args.all:
             kwargs['full_listing'] = True
+            if parsed_args.parallel:
+                kwargs['partitions'] = parsed_args.parallel
 
         data = self.app.client_manager.object_store.container_list(**kwargs)
 
@@ -200,12 +214,45 @@ class SaveContainer(command.Command):
             metavar='<container>',
             help=_('Container to save'),
         )
+        parser.add_argument(
+            '--concurrency',
+            metavar='<count>',
+            type=int,
+            default=1,
+            help=_(
+                'Number of objects to download at the same time (default: 1)'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
-        self.app.client_manager.object_store.container_save(
+        start = time.monotonic()
+        data = self.app.client_manager.object_store.container_save(
             container=parsed_args.container,
+            concurrency=parsed_args.concurrency,
         )
+        elapsed = time.monotonic() - start
+        LOG.info(
+            _(
+                'Saved %(count)s objects, %(size)s in %(elapsed).1fs '
+                '(%(rate)s/s)'
+            ),
+            {
+                'count': data['count'],
+                'size': utils.format_size(data['bytes']),
+                'elapsed': elapsed,
+                'rate': utils.format_size(
+                    data['bytes'] / elapsed if elapsed else data['bytes']
+                ),
+            },
+        )
+
+        if data['failed']:
+            msg = _("%(failed)s of %(total)s objects failed to save.") % {
+                'failed': data['failed'],
+                'total': data['count'] + data['failed'],
+            }
+            raise exceptions.CommandError(msg)
 
 
 class SetContainer(command.Command):
@@ -16,6 +16,8 @@
 """Object v1 action implementations"""
 
 import logging
+import os
+import time
 
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
@@ -23,12 +25,31 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import parallel
+from openstackclient.common import streaming
 from openstackclient.i18n import _
 
 
 LOG = logging.getLogger(__name__)
 
 
+def _log_transfer(action, count, size, elapsed):
+    """Log the number of objects transferred and the throughput"""
+    LOG.info(
+        _(
+            '%(action)s %(count)s objects, %(size)s in %(elapsed).1fs '
+            '(%(rate)s/s)'
+        ),
+        {
+            'action': action,
+            'count': count,
+            'size': utils.format_size(size),
+            'elapsed': elapsed,
+            'rate': utils.format_size(size / elapsed if elapsed else size),
+        },
+    )
+
+
 class CreateObject(command.Lister):
     _description = _("Upload object to container")
 
@@ -53,6 +74,15 @@ class CreateObject(command.Lister):
                 'Can only be used when uploading a single object'
             ),
         )
+        parser.add_argument(
+            '--concurrency',
+            metavar='<count>',
+            type=int,
+            default=1,
+            help=_(
+                'Number of objects to upload at the same time (default: 1)'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -63,7 +93,6 @@ class CreateObject(command.Lister):
                     'using --name is not permitted'
                 )
                 raise exceptions.CommandError(msg)
-        results = []
         for obj in parsed_args.objects:
             if len(obj) > 1024:
                 LOG.warning(
@@ -73,26 +102,74 @@ class CreateObject(command.Lister):
                     ),
                     len(obj),
                 )
-            data = self.app.client_manager.object_store.object_create(
-                container=parsed_args.container,
-                object=obj,
-                name=parsed_args.name,
-            )
-            results.append(data)
 
-        columns = ("object", "container", "etag")
-        return (
-            columns,
-            (
-                utils.get_dict_properties(
-                    s,
-                    columns,
-                    formatters={},
+        object_store = self.app.client_manager.object_store
+
+        def _upload(obj):
+            try:
+                return object_store.object_create(
+                    container=parsed_args.container,
+                    object=obj,
+                    name=parsed_args.name,
                 )
-                for s in results
-            ),
+            except Exception as e:
+                return e
+
+        start = time.monotonic()
+        results = parallel.run(
+            _upload, parsed_args.objects, workers=parsed_args.concurrency
+        )
+        errors = [
+            (obj, result)
+            for obj, result in zip(parsed_args.objects, results)
+            if isinstance(result, Exception)
+        ]
+        if errors and len(parsed_args.objects) == 1:
+            raise errors[0][1]
+        uploaded = [
+            obj
+            for obj, result in zip(parsed_args.objects, results)
+            if not isinstance(result, Exception)
+        ]
+        _log_transfer(
+            _('Uploaded'),
+            len(uploaded),
+            sum(os.path.getsize(obj) for obj in uploaded),
+            time.monotonic() - start,
         )
 
+        columns = ("object", "container", "etag")
+        data = [
+            utils.get_dict_properties(
+                s,
+                columns,
+                formatters={},
+            )
+            for s in results
+            if not isinstance(s, Exception)
+        ]
+
+        # The objects uploaded are displayed, the failures are logged and
+        # reported by the exit status, see run()
+        for obj, e in errors:
+            LOG.error(
+                _("Failed to upload object '%(object)s': %(e)s"),
+                {'object': obj, 'e': e},
+            )
+        if errors:
+            LOG.error(
+                _("%(failed)s of %(total)s objects failed to upload."),
+                {'failed': len(errors), 'total': len(parsed_args.objects)},
+            )
+        self._failed = len(errors)
+
+        return columns, data
+
+    def run(self, parsed_args):
+        self._failed = 0
+        result = super(CreateObject, self).run(parsed_args)
+        return result or (1 if self._failed else 0)
+
 
 class DeleteObject(command.Command):
     _description = _("Delete object from container")
@@ -168,8 +245,25 @@ class ListObject(command.Lister):
             default=False,
             help=_('List all objects in container (default is 10000)'),
         )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=None,
+            help=_(
+                'With --all, split the listing in <count> ranges of names '
+                'listed concurrently (default: 1)'
+            ),
+        )
         return parser
 
+    def produce_output(self, parsed_args, column_names, data):
+        if parsed_args.all:
+            self.formatter = streaming.get_formatter(self.formatter)
+        return super(ListObject, self).produce_output(
+            parsed_args, column_names, data
+        )
+
     def take_action(self, parsed_args):
         if parsed_args.long:
             columns = (
@@ -193,12 +287,19 @@ class ListObject(command.Lister):
             kwargs['end_marker'] = parsed_args.end_marker
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
-        if parsed_args.all:
-            kwargs['full_listing'] = True
 
-        data = self.app.client_manager.object_store.object_list(
-            container=parsed_args.container, **kwargs
-        )
+        object_store = self.app.client_manager.object_store
+        if parsed_args.all:
+            # Fetch the objects as they are displayed
+            if parsed_args.parallel:
+                kwargs['partitions'] = parsed_args.parallel
+            data = object_store.object_iter(
+                container=parsed_args.container, **kwargs
+            )
+        else:
+            data = object_store.object_list(
+                container=parsed_args.container, **kwargs
+            )
 
         return (
             columns,
@@ -232,19 +333,71 @@ class SaveObject(command.Command):
             help=_('Download <object> from <container>'),
         )
         parser.add_argument(
-            "object",
+            "objects",
             metavar="<object>",
-            help=_("Object to save"),
+            nargs="+",
+            help=_("Object(s) to save"),
+        )
+        parser.add_argument(
+            '--concurrency',
+            metavar='<count>',
+            type=int,
+            default=1,
+            help=_(
+                'Number of objects to download at the same time (default: 1)'
+            ),
         )
         return parser
 
     def take_action(self, parsed_args):
-        self.app.client_manager.object_store.object_save(
-            container=parsed_args.container,
-            object=parsed_args.object,
-            file=parsed_args.file,
+        if parsed_args.file and len(parsed_args.objects) > 1:
+            msg = _(
+                'Attempting to save multiple objects and '
+                'using --file is not permitted'
+            )
+            raise exceptions.CommandError(msg)
+
+        object_store = self.app.client_manager.object_store
+
+        def _save(obj):
+            try:
+                object_store.object_save(
+                    container=parsed_args.container,
+                    object=obj,
+                    file=parsed_args.file,
+                )
+            except Exception as e:
+                LOG.error(
+                    _("Failed to save object '%(object)s': %(e)s"),
+                    {'object': obj, 'e': e},
+                )
+                return False
+            return True
+
+        start = time.monotonic()
+        results = parallel.run(
+            _save, parsed_args.objects, workers=parsed_args.concurrency
+        )
+        saved = [
+            parsed_args.file or obj
+            for obj, result in zip(parsed_args.objects, results)
+            if result
+        ]
+        _log_transfer(
+            _('Saved'),
+            len(saved),
+            sum(os.path.getsize(f) for f in saved if f != '-'),
+            time.monotonic() - start,
         )
 
+        failed = len(parsed_args.objects) - len(saved)
+        if failed:
+            msg = _("%(failed)s of %(total)s objects failed to save.") % {
+                'failed': failed,
+                'total': len(parsed_args.objects),
+            }
+            raise exceptions.CommandError(msg)
+
 
 class SetObject(command.Command):
     _description = _("Set object properties")
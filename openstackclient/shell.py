@@ -20,11 +20,20 @@ import sys
 import warnings
 
 from osc_lib.api import auth
-from osc_lib.command import commandmanager
+from osc_lib import exceptions
 from osc_lib import shell
+from osc_lib import utils
+from oslo_utils import strutils
 
 import openstackclient
+from openstackclient.common import batch
 from openstackclient.common import clientmanager
+from openstackclient.common import command_index
+from openstackclient.common import discovery_cache
+from openstackclient.common import image_cache
+from openstackclient.common import project_cache
+from openstackclient.common import resolution_cache
+from openstackclient.i18n import _
 
 
 DEFAULT_DOMAIN = 'default'
@@ -35,12 +44,15 @@ class OpenStackShell(shell.OpenStackShell):
         super(OpenStackShell, self).__init__(
             description=__doc__.strip(),
             version=openstackclient.__version__,
-            command_manager=commandmanager.CommandManager('openstack.cli'),
+            command_manager=command_index.CommandManager('openstack.cli'),
             deferred_help=True,
         )
 
         self.api_version = {}
 
+        # Exit status of the batch run, if any
+        self.batch_result = None
+
         # Assume TLS host certificate verification is enabled
         self.verify = True
 
@@ -52,6 +64,91 @@ class OpenStackShell(shell.OpenStackShell):
         parser = super(OpenStackShell, self).build_option_parser(
             description, version
         )
+        parser.add_argument(
+            '--batch',
+            metavar='<file>',
+            help=_(
+                'Run the commands listed in <file>, one per line, '
+                'concurrently and print the result of each command as a '
+                'JSON document. Use "-" to read the commands from standard '
+                'input. A line containing only "wait" waits for all the '
+                'previous commands to complete.'
+            ),
+        )
+        parser.add_argument(
+            '--batch-workers',
+            metavar='<count>',
+            type=int,
+            default=batch.DEFAULT_WORKERS,
+            help=_(
+                'Maximum number of commands run at the same time with '
+                '--batch (default: %d)'
+            )
+            % batch.DEFAULT_WORKERS,
+        )
+        parser.add_argument(
+            '--os-token-cache',
+            action='store_true',
+            default=strutils.bool_from_string(utils.env('OS_TOKEN_CACHE'))
+            or None,
+            help=_(
+                'Cache the token and service catalog in the user cache '
+                'directory, encrypted, and reuse them in later invocations '
+                'with the same credentials until shortly before the token '
+                'expires (Env: OS_TOKEN_CACHE)'
+            ),
+        )
+        parser.add_argument(
+            '--os-discovery-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=utils.env('OS_DISCOVERY_CACHE_TTL'),
+            help=_(
+                'Number of seconds the API versions discovered for each '
+                'service endpoint are cached in the user cache directory, '
+                '0 disables the cache (default: %d) '
+                '(Env: OS_DISCOVERY_CACHE_TTL)'
+            )
+            % discovery_cache.DEFAULT_TTL,
+        )
+        parser.add_argument(
+            '--os-project-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=utils.env('OS_PROJECT_CACHE_TTL'),
+            help=_(
+                'Number of seconds the names of the projects displayed by '
+                'listings are cached in the user cache directory, '
+                '0 disables the cache (default: %d) '
+                '(Env: OS_PROJECT_CACHE_TTL)'
+            )
+            % project_cache.DEFAULT_TTL,
+        )
+        parser.add_argument(
+            '--os-image-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=utils.env('OS_IMAGE_CACHE_TTL'),
+            help=_(
+                'Number of seconds the index of the image properties used '
+                'by server create --image-property is cached in the user '
+                'cache directory, 0 disables the cache (default: %d) '
+                '(Env: OS_IMAGE_CACHE_TTL)'
+            )
+            % image_cache.DEFAULT_TTL,
+        )
+        parser.add_argument(
+            '--os-resolution-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=utils.env('OS_RESOLUTION_CACHE_TTL'),
+            help=_(
+                'Number of seconds the IDs of the resources found by name '
+                'are cached in batch and interactive mode, 0 disables the '
+                'cache (default: %d) (Env: OS_RESOLUTION_CACHE_TTL)'
+            )
+            % resolution_cache.DEFAULT_TTL,
+        )
         parser = clientmanager.build_plugin_option_parser(parser)
         parser = auth.build_auth_plugins_option_parser(parser)
         return parser
@@ -141,6 +238,63 @@ class OpenStackShell(shell.OpenStackShell):
             pw_func=shell.prompt_for_password,
         )
 
+        if getattr(self.options, 'batch', None):
+            if argv:
+                raise exceptions.CommandError(
+                    _("--batch cannot be used with a command")
+                )
+            if self.options.batch_workers < 1:
+                raise exceptions.CommandError(
+                    _("--batch-workers must be a positive integer")
+                )
+
+    def update_resolution_cache(self, cmd):
+        """Forget the resources found by name after a command changed some"""
+        cache = self.client_manager.get_resolution_cache()
+        if cache is not None and type(cmd).__name__.startswith(
+            resolution_cache.CHANGING_COMMANDS
+        ):
+            cache.clear()
+
+    def _log_resolution_cache_stats(self):
+        cache = self.client_manager.get_resolution_cache()
+        if cache is not None:
+            cache.log_stats()
+
+    def clean_up(self, cmd, result, err):
+        super(OpenStackShell, self).clean_up(cmd, result, err)
+        self.client_manager.update_token_cache()
+        self.update_resolution_cache(cmd)
+        self._log_resolution_cache_stats()
+
+    def interact(self):
+        if getattr(self.options, 'batch', None):
+            self.batch_result = self.run_batch(self.options.batch)
+            return
+        super(OpenStackShell, self).interact()
+
+    def run_batch(self, path):
+        """Run the commands of a batch file
+
+        :param path: Path of the batch file, or "-" for standard input
+        :returns: the exit status of the batch
+        """
+        runner = batch.BatchRunner(self, workers=self.options.batch_workers)
+        try:
+            if path == '-':
+                return runner.run(self.stdin)
+            with open(path) as f:
+                return runner.run(f)
+        finally:
+            self.client_manager.update_token_cache()
+            self._log_resolution_cache_stats()
+
+    def run(self, argv):
+        result = super(OpenStackShell, self).run(argv)
+        if self.batch_result is not None:
+            return self.batch_result
+        return result
+
 
 def main(argv=None):
     if argv is None:
@@ -756,3 +756,63 @@ class TestSecurityGroupRule(TestComputeAPIv2):
         ret = self.api.security_group_rule_delete('1')
         self.assertEqual(202, ret.status_code)
         self.assertEqual("", ret.text)
+
+    def test_security_group_rule_find(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/os-security-groups',
+            json={
+                'security_groups': [
+                    {'id': '1', 'rules': []},
+                    {'id': '2', 'rules': [self.FAKE_SECURITY_GROUP_RULE_RESP]},
+                ]
+            },
+            status_code=200,
+        )
+        ret = self.api.security_group_rule_find('1')
+        self.assertEqual(self.FAKE_SECURITY_GROUP_RULE_RESP, ret)
+        ret = self.api.security_group_rule_find(1)
+        self.assertEqual(self.FAKE_SECURITY_GROUP_RULE_RESP, ret)
+        # The rules are listed once
+        self.assertEqual(1, self.requests_mock.call_count)
+
+    def test_security_group_rule_find_not_found(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/os-security-groups',
+            json={
+                'security_groups': [
+                    {'id': '1', 'rules': [self.FAKE_SECURITY_GROUP_RULE_RESP]},
+                ]
+            },
+            status_code=200,
+        )
+        self.api.security_group_rule_find('1')
+        self.assertRaises(
+            osc_lib_exceptions.NotFound,
+            self.api.security_group_rule_find,
+            '2',
+        )
+        # The index is built again when a rule is missing from it
+        self.assertEqual(2, self.requests_mock.call_count)
+
+    def test_security_group_rule_find_after_delete(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/os-security-groups',
+            json={
+                'security_groups': [
+                    {'id': '1', 'rules': [self.FAKE_SECURITY_GROUP_RULE_RESP]},
+                ]
+            },
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/os-security-group-rules/1',
+            status_code=202,
+        )
+        self.api.security_group_rule_find('1')
+        self.api.security_group_rule_delete('1')
+        self.api.security_group_rule_find('1')
+        self.assertEqual(3, self.requests_mock.call_count)
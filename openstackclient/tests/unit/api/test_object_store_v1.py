@@ -13,8 +13,11 @@
 
 """Object Store v1 API Library Tests"""
 
+import os
 from unittest import mock
+import urllib
 
+import fixtures
 from keystoneauth1 import session
 from requests_mock.contrib import fixture
 
@@ -281,6 +284,184 @@ class TestObject(TestObjectAPIv1):
         )
         self.assertEqual(LIST_CONTAINER_RESP, ret)
 
+    def _fake_listing(self, names):
+        """Answer object listings like Swift does"""
+
+        def _list(request, context):
+            query = urllib.parse.parse_qs(
+                urllib.parse.urlparse(request.url).query
+            )
+            prefix = query.get('prefix', [''])[0]
+            marker = query.get('marker', [''])[0]
+            end_marker = query.get('end_marker', [None])[0]
+            delimiter = query.get('delimiter', [None])[0]
+            limit = int(query.get('limit', [10000])[0])
+            entries = []
+            for name in sorted(names):
+                if not name.startswith(prefix) or name <= marker:
+                    continue
+                if end_marker is not None and name >= end_marker:
+                    break
+                if delimiter and delimiter in name[len(prefix) :]:
+                    subdir = name[
+                        : name.index(delimiter, len(prefix)) + len(delimiter)
+                    ]
+                    if subdir <= marker or (
+                        entries and entries[-1].get('subdir') == subdir
+                    ):
+                        continue
+                    entries.append({'subdir': subdir})
+                else:
+                    entries.append({'name': name})
+                if len(entries) == limit:
+                    break
+            return entries
+
+        self.requests_mock.register_uri('GET', FAKE_URL + '/qaz', json=_list)
+
+    def test_object_list_full_listing(self):
+        names = ['a%d' % i for i in range(5)]
+        self._fake_listing(names)
+
+        ret = self.api.object_list(container='qaz', limit=2, full_listing=True)
+
+        self.assertEqual(names, [o['name'] for o in ret])
+        # 3 pages and an empty one
+        self.assertEqual(4, self.requests_mock.call_count)
+
+    def test_object_list_full_listing_partitions(self):
+        # Include names equal to the range boundaries and outside of the
+        # characters used to split the listing
+        names = (
+            ['!', 'G', 'G0', 'Zz', 'f', 'u', 'zz', '~']
+            + ['p/%d' % i for i in range(20)]
+            + ['p/W/x', 'p/f']
+        )
+        self._fake_listing(names)
+
+        ret = self.api.object_list(
+            container='qaz', limit=3, full_listing=True, partitions=8
+        )
+
+        self.assertEqual(sorted(names), [o['name'] for o in ret])
+
+    def test_object_list_full_listing_partitions_prefix(self):
+        names = ['p/%s' % c for c in '0189AGMNZafgmz~'] + ['q', 'p']
+        self._fake_listing(names)
+
+        ret = self.api.object_list(
+            container='qaz',
+            prefix='p/',
+            marker='p/1',
+            end_marker='p/z',
+            limit=2,
+            full_listing=True,
+            partitions=4,
+        )
+
+        self.assertEqual(
+            [
+                n
+                for n in sorted(names)
+                if n.startswith('p/') and 'p/1' < n < 'p/z'
+            ],
+            [o['name'] for o in ret],
+        )
+
+    def test_object_list_full_listing_partitions_delimiter(self):
+        names = ['d/%s/%d' % (c, i) for c in '0GWfu' for i in range(3)]
+        names += ['W', 'f', 'u/']
+        self._fake_listing(names)
+
+        expected = self.api.object_list(
+            container='qaz', delimiter='/', full_listing=True
+        )
+        ret = self.api.object_list(
+            container='qaz',
+            delimiter='/',
+            limit=1,
+            full_listing=True,
+            partitions=8,
+        )
+
+        self.assertEqual(expected, ret)
+        self.assertEqual(
+            [{'name': 'W'}, {'subdir': 'd/'}, {'name': 'f'}, {'subdir': 'u/'}],
+            ret,
+        )
+
+    def test_object_iter(self):
+        names = ['a%d' % i for i in range(5)]
+        self._fake_listing(names)
+
+        objects = self.api.object_iter(container='qaz', limit=2)
+
+        # Nothing is fetched before iterating
+        self.assertEqual(0, self.requests_mock.call_count)
+        self.assertEqual('a0', next(objects)['name'])
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual(names[1:], [o['name'] for o in objects])
+
+    def test_object_iter_partitions(self):
+        names = ['%s%d' % (c, i) for c in '0AGWfu~' for i in range(5)]
+        self._fake_listing(names)
+
+        objects = self.api.object_iter(container='qaz', limit=2, partitions=4)
+
+        self.assertEqual(sorted(names), [o['name'] for o in objects])
+
+    @mock.patch('openstackclient.common.streaming.PAGE_SIZE', 2)
+    def test_container_save(self):
+        names = ['a%d' % i for i in range(5)]
+        self._fake_listing(names)
+
+        with mock.patch.object(self.api, 'object_save') as save_mock:
+            ret = self.api.container_save(container='qaz', concurrency=4)
+
+        self.assertEqual({'count': 5, 'bytes': 0, 'failed': 0}, ret)
+        save_mock.assert_has_calls(
+            [mock.call(container='qaz', object=name) for name in names],
+            any_order=True,
+        )
+        self.assertEqual(5, save_mock.call_count)
+
+    @mock.patch('openstackclient.common.streaming.PAGE_SIZE', 2)
+    def test_container_save_failure(self):
+        names = ['a%d' % i for i in range(5)]
+        self._fake_listing(names)
+
+        def _save(container, object):
+            if object == 'a2':
+                raise Exception('save failed')
+
+        with mock.patch.object(
+            self.api, 'object_save', side_effect=_save
+        ) as save_mock:
+            ret = self.api.container_save(container='qaz', concurrency=4)
+
+        # The other objects are saved anyway
+        self.assertEqual({'count': 4, 'bytes': 0, 'failed': 1}, ret)
+        self.assertEqual(5, save_mock.call_count)
+
+    def test_object_save_existing_directory(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        os.mkdir(os.path.join(tmp_dir, 'dir'))
+        path = os.path.join(tmp_dir, 'dir', FAKE_OBJECT)
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/' + urllib.parse.quote(path),
+            content=b'data',
+            status_code=200,
+        )
+
+        # Another object of the directory may be saved at the same time,
+        # creating the directory after it was found missing
+        with mock.patch.object(os.path, 'exists', return_value=False):
+            self.api.object_save(container='qaz', object=path)
+
+        with open(path, 'rb') as f:
+            self.assertEqual(b'data', f.read())
+
     #     def test_list_objects_full_listing(self):
     #         sess = self.app.client_manager.session
     #
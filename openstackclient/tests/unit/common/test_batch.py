@@ -0,0 +1,158 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import io
+import json
+import threading
+from unittest import mock
+
+from osc_lib.command import command
+from osc_lib import exceptions
+
+from openstackclient.common import batch
+from openstackclient.tests.unit import fakes
+from openstackclient.tests.unit import utils
+
+
+class FakeEcho(command.Command):
+    def get_parser(self, prog_name):
+        parser = super(FakeEcho, self).get_parser(prog_name)
+        parser.add_argument('words', nargs='*')
+        parser.add_argument('--rc', type=int, default=0)
+        return parser
+
+    def take_action(self, parsed_args):
+        self.app.stdout.write(' '.join(parsed_args.words) + '\n')
+        return parsed_args.rc
+
+
+class FakeFail(command.Command):
+    def take_action(self, parsed_args):
+        raise exceptions.CommandError('failed')
+
+
+class FakeBarrier(command.Command):
+    """Block until released, to check the ``wait`` barrier"""
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def take_action(self, parsed_args):
+        self.started.set()
+        self.release.wait(5)
+        return 0
+
+
+COMMANDS = {
+    'echo': FakeEcho,
+    'fail': FakeFail,
+    'block': FakeBarrier,
+}
+
+
+def _find_command(argv):
+    if argv[0] not in COMMANDS:
+        raise ValueError('Unknown command %r' % argv)
+    return COMMANDS[argv[0]], argv[0], argv[1:]
+
+
+class TestParseBatch(utils.TestCase):
+    def test_parse_batch(self):
+        stream = io.StringIO(
+            'server list --long\n'
+            '\n'
+            '# a comment\n'
+            'wait\n'
+            'server show "my server"  # trailing comment\n'
+        )
+
+        self.assertEqual(
+            [
+                (1, ['server', 'list', '--long']),
+                (4, None),
+                (5, ['server', 'show', 'my server']),
+            ],
+            list(batch.parse_batch(stream)),
+        )
+
+    def test_parse_batch_invalid(self):
+        stream = io.StringIO('server show "unterminated\n')
+
+        self.assertRaises(
+            exceptions.CommandError, list, batch.parse_batch(stream)
+        )
+
+
+class TestBatchRunner(utils.TestCase):
+    def setUp(self):
+        super(TestBatchRunner, self).setUp()
+        self.app = mock.Mock()
+        self.app.NAME = 'openstack'
+        self.app.stdout = fakes.FakeStdout()
+        self.app.stderr = fakes.FakeStdout()
+        self.app.options.debug = False
+        self.app.client_manager._auth_required = True
+        self.app.command_manager.find_command.side_effect = _find_command
+        self.output = io.StringIO()
+        self.runner = batch.BatchRunner(self.app, output=self.output)
+
+    def _results(self):
+        return [
+            json.loads(line) for line in self.output.getvalue().splitlines()
+        ]
+
+    def test_run(self):
+        rc = self.runner.run(io.StringIO('echo hello world\n'))
+
+        self.assertEqual(0, rc)
+        results = self._results()
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, results[0]['line'])
+        self.assertEqual('echo hello world', results[0]['command'])
+        self.assertEqual(0, results[0]['rc'])
+        self.assertEqual('hello world\n', results[0]['stdout'])
+        self.assertIn('elapsed', results[0])
+        self.assertEqual(1, self.app.prepare_to_run_command.call_count)
+        # The output of the commands is captured
+        self.assertEqual([], self.app.stdout.content)
+
+    def test_run_failures(self):
+        rc = self.runner.run(
+            io.StringIO('echo ok\necho --rc 2 nok\nfail\nunknown\n')
+        )
+
+        self.assertEqual(1, rc)
+        results = dict((r['line'], r['rc']) for r in self._results())
+        self.assertEqual({1: 0, 2: 2, 3: 1, 4: 1}, results)
+
+    def test_run_barrier(self):
+        FakeBarrier.started.clear()
+        FakeBarrier.release.clear()
+        runner = batch.BatchRunner(self.app, workers=4, output=self.output)
+
+        thread = threading.Thread(
+            target=runner.run,
+            args=(io.StringIO('block\nwait\necho after\n'),),
+        )
+        thread.start()
+        self.assertTrue(FakeBarrier.started.wait(5))
+        # The command after the barrier must not start before the first
+        # one completes
+        self.assertEqual('', self.output.getvalue())
+        FakeBarrier.release.set()
+        thread.join()
+
+        self.assertEqual(
+            ['block', 'echo after'],
+            [r['command'] for r in self._results()],
+        )
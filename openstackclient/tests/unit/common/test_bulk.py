@@ -0,0 +1,76 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import argparse
+from unittest import mock
+
+from osc_lib import exceptions
+
+from openstackclient.common import bulk
+from openstackclient.tests.unit import utils
+
+
+def _delete(name):
+    if name.startswith('bad'):
+        raise Exception('cannot delete ' + name)
+    return name.upper()
+
+
+class TestBulk(utils.TestCase):
+    def test_add_parallel_option(self):
+        parser = argparse.ArgumentParser()
+        bulk.add_parallel_option(parser)
+
+        self.assertEqual(1, parser.parse_args([]).parallel)
+        self.assertEqual(4, parser.parse_args(['--parallel', '4']).parallel)
+
+    @mock.patch.object(bulk.LOG, 'error')
+    def test_run(self, log_mock):
+        results = bulk.run(
+            _delete, ['a', 'bad1', 'b', 'bad2', 'c'], 'thing', workers=3
+        )
+
+        self.assertEqual(['A', 'B', 'C'], results)
+        # The failures are logged in order
+        self.assertEqual(
+            ['bad1', 'bad2'],
+            [c[0][1]['name_or_id'] for c in log_mock.call_args_list],
+        )
+
+    def test_run_fatal(self):
+        def _fatal(name):
+            raise exceptions.CommandError('not supported')
+
+        self.assertRaises(
+            exceptions.CommandError,
+            bulk.run,
+            _fatal,
+            ['a', 'b'],
+            'thing',
+            fatal=(exceptions.CommandError,),
+        )
+
+    def test_delete(self):
+        self.assertEqual(['A', 'B'], bulk.delete(_delete, ['a', 'b'], 'thing'))
+
+    def test_delete_failures(self):
+        exc = self.assertRaises(
+            exceptions.CommandError,
+            bulk.delete,
+            _delete,
+            ['a', 'bad', 'bad2'],
+            'thing',
+            workers=2,
+        )
+
+        self.assertEqual('2 of 3 things failed to delete.', str(exc))
@@ -14,15 +14,26 @@
 #
 
 import copy
+from unittest import mock
 
+import fixtures
 from keystoneauth1 import token_endpoint
 from osc_lib.tests import utils as osc_lib_test_utils
 
 from openstackclient.common import clientmanager
+from openstackclient.common import resolution_cache
 from openstackclient.tests.unit import fakes
 
 
 class TestClientManager(osc_lib_test_utils.TestClientManager):
+    def setUp(self):
+        super(TestClientManager, self).setUp()
+        self.useFixture(
+            fixtures.EnvironmentVariable(
+                'XDG_CACHE_HOME', self.useFixture(fixtures.TempDir()).path
+            )
+        )
+
     def _clientmanager_class(self):
         """Allow subclasses to override the ClientManager class"""
         return clientmanager.ClientManager
@@ -70,3 +81,159 @@ class TestClientManager(osc_lib_test_utils.TestClientManager):
         # This is True because ClientManager.auth_ref returns None in this
         # test; "no service catalog" means use Network API by default now
         self.assertTrue(client_manager.is_network_endpoint_enabled())
+
+    def test_client_manager_token_cache(self):
+        auth_args = copy.deepcopy(self.default_password_auth)
+        auth_args.update(
+            {
+                'user_domain_name': 'default',
+                'project_domain_name': 'default',
+            }
+        )
+
+        def _make_clientmanager():
+            return self._make_clientmanager(
+                auth_args=auth_args,
+                config_args={'token_cache': True},
+                identity_api_version='3',
+                auth_plugin_name='v3password',
+                auth_required=True,
+            )
+
+        client_manager = _make_clientmanager()
+        auth_requests = self.requests.call_count
+        token = client_manager.auth_ref.auth_token
+
+        # A second invocation uses the cached token
+        client_manager = _make_clientmanager()
+
+        self.assertEqual(token, client_manager.auth_ref.auth_token)
+        self.assertEqual(auth_requests, self.requests.call_count)
+
+    def test_client_manager_discovery_cache(self):
+        def _make_clientmanager(config_args=None):
+            client_manager = self._make_clientmanager(
+                config_args=config_args,
+                auth_required=True,
+            )
+            client_manager.auth_ref
+            return [r.method for r in self.requests.request_history]
+
+        history = _make_clientmanager()
+        self.assertEqual(['GET', 'POST'], history)
+
+        # The identity version discovery is not done again
+        history = _make_clientmanager()
+        self.assertEqual(['GET', 'POST', 'POST'], history)
+
+        # unless the cache is disabled
+        history = _make_clientmanager({'discovery_cache_ttl': 0})
+        self.assertEqual(['GET', 'POST', 'POST', 'GET', 'POST'], history)
+
+    def test_client_manager_project_lookup(self):
+        client_manager = self._make_clientmanager(
+            config_args={'project_cache_ttl': 60},
+        )
+
+        projects = client_manager.get_project_lookup()
+
+        # The lookup is shared by the commands
+        self.assertIs(projects, client_manager.get_project_lookup())
+        self.assertEqual(60, projects.ttl)
+        self.assertEqual(
+            client_manager._cli_options.config['auth']['auth_url'],
+            projects.scope,
+        )
+
+    def test_client_manager_project_lookup_identity_v2(self):
+        client_manager = self._make_clientmanager()
+        client_manager._api_version = {'identity': '2.0'}
+        # keystoneclient v2.0 only knows about tenants
+        identity = mock.Mock(spec=['tenants'])
+        identity.tenants.get.return_value = mock.Mock(id='p1')
+        client_manager.identity = identity
+
+        projects = client_manager.get_project_lookup()
+        projects.resolve(['p1'])
+
+        identity.tenants.get.assert_called_once_with('p1')
+        self.assertEqual('p1', projects.get('p1').id)
+
+    def test_client_manager_project_lookup_identity_v3(self):
+        client_manager = self._make_clientmanager()
+        client_manager._api_version = {'identity': '3'}
+        identity = mock.Mock(spec=['projects'])
+        identity.projects.get.return_value = mock.Mock(id='p1')
+        client_manager.identity = identity
+
+        projects = client_manager.get_project_lookup()
+        projects.resolve(['p1'])
+
+        identity.projects.get.assert_called_once_with('p1')
+        self.assertEqual('p1', projects.get('p1').id)
+
+    def test_client_manager_image_index(self):
+        client_manager = self._make_clientmanager()
+
+        images = client_manager.get_image_index()
+
+        # The index is shared by the commands, and disabled by default
+        self.assertIs(images, client_manager.get_image_index())
+        self.assertEqual(0, images.ttl)
+        self.assertIsNone(images.scope)
+
+    @mock.patch.object(
+        clientmanager.ClientManager,
+        'auth_ref',
+        new_callable=mock.PropertyMock,
+        return_value=mock.Mock(project_id='project-id'),
+    )
+    def test_client_manager_image_index_ttl(self, auth_ref):
+        client_manager = self._make_clientmanager(
+            config_args={'image_cache_ttl': 60},
+        )
+
+        images = client_manager.get_image_index()
+
+        # The images are stored per project
+        self.assertEqual(60, images.ttl)
+        self.assertEqual(
+            '%s project-id'
+            % client_manager._cli_options.config['auth']['auth_url'],
+            images.scope,
+        )
+
+    def test_client_manager_resolution_cache(self):
+        client_manager = self._make_clientmanager()
+        other_client_manager = self._make_clientmanager()
+
+        cache = client_manager.get_resolution_cache()
+
+        # The cache is bound to the session
+        self.assertIsNotNone(cache)
+        self.assertIs(cache, client_manager.get_resolution_cache())
+        self.assertIsNot(cache, other_client_manager.get_resolution_cache())
+
+        self.assertEqual(resolution_cache.DEFAULT_TTL, cache.ttl)
+
+    def test_client_manager_resolution_cache_ttl(self):
+        client_manager = self._make_clientmanager(
+            config_args={'resolution_cache_ttl': '10'},
+        )
+
+        self.assertEqual(10, client_manager.get_resolution_cache().ttl)
+
+    def test_client_manager_find_resource_id(self):
+        client_manager = self._make_clientmanager()
+        proxy = mock.Mock(service_type='network')
+        proxy.find_network.return_value = mock.Mock(id='network-id')
+
+        for _ in range(2):
+            self.assertEqual(
+                'network-id',
+                client_manager.find_resource_id(proxy, 'network', 'name'),
+            )
+
+        proxy.find_network.assert_called_once_with(
+            'name', ignore_missing=False
+        )
@@ -0,0 +1,130 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import importlib.metadata
+import os
+from unittest import mock
+
+import fixtures
+
+from openstackclient.common import cache
+from openstackclient.common import command_index
+from openstackclient.common import module as osc_module
+from openstackclient.tests.unit import utils
+
+
+GROUPS = {
+    'openstack.common': [
+        ['command_list', 'openstackclient.common.module:ListCommand'],
+        ['module_list', 'openstackclient.common.module:ListModule'],
+    ],
+}
+DISTRIBUTIONS = {'python-openstackclient': '1.0.0'}
+
+
+class TestCommandIndex(utils.TestCase):
+    def setUp(self):
+        super(TestCommandIndex, self).setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'index.json'
+        )
+        self.scan_mock = self.useFixture(
+            fixtures.MockPatch(
+                'openstackclient.common.command_index._scan_entry_points',
+                return_value=(GROUPS, DISTRIBUTIONS),
+            )
+        ).mock
+        self.stamp_mock = self.useFixture(
+            fixtures.MockPatch(
+                'openstackclient.common.command_index._get_stamp',
+                return_value='stamp-1',
+            )
+        ).mock
+
+    def test_build_index(self):
+        index = command_index.CommandIndex(path=self.path)
+
+        eps = index.get_entry_points('openstack.common')
+
+        self.scan_mock.assert_called_once_with()
+        self.assertEqual(
+            ['command_list', 'module_list'], [ep.name for ep in eps]
+        )
+        self.assertEqual(
+            'openstackclient.common.module:ListCommand', eps[0].value
+        )
+        data = cache.read_json(self.path)
+        self.assertEqual('stamp-1', data['stamp'])
+        self.assertEqual(GROUPS, data['groups'])
+        self.assertEqual(DISTRIBUTIONS, data['distributions'])
+
+    def test_reuse_index(self):
+        command_index.CommandIndex(path=self.path).data
+        self.scan_mock.reset_mock()
+
+        index = command_index.CommandIndex(path=self.path)
+
+        self.assertEqual(GROUPS, index.data['groups'])
+        self.scan_mock.assert_not_called()
+
+    def test_rebuild_index_on_package_change(self):
+        command_index.CommandIndex(path=self.path).data
+        self.scan_mock.reset_mock()
+        self.stamp_mock.return_value = 'stamp-2'
+
+        index = command_index.CommandIndex(path=self.path)
+
+        self.assertEqual('stamp-2', index.data['stamp'])
+        self.scan_mock.assert_called_once_with()
+
+    def test_unknown_group(self):
+        index = command_index.CommandIndex(path=self.path)
+
+        self.assertEqual([], index.get_entry_points('openstack.unknown'))
+
+
+class TestCommandManager(utils.TestCase):
+    def setUp(self):
+        super(TestCommandManager, self).setUp()
+        self.index = mock.Mock()
+        self.index.get_entry_points.side_effect = lambda group: [
+            importlib.metadata.EntryPoint(name, value, group)
+            for name, value in GROUPS.get(group, [])
+        ]
+
+    def test_load_commands(self):
+        cm = command_index.CommandManager('openstack.common', index=self.index)
+
+        self.assertEqual(['openstack.common'], cm.get_command_groups())
+        self.assertEqual(['command list', 'module list'], sorted(cm.commands))
+        self.assertEqual(
+            ['command list', 'module list'],
+            cm.get_command_names('openstack.common'),
+        )
+
+    def test_find_command(self):
+        cm = command_index.CommandManager('openstack.common', index=self.index)
+
+        cmd_class, name, args = cm.find_command(['module', 'list', '--all'])
+
+        self.assertIs(osc_module.ListModule, cmd_class)
+        self.assertEqual('module list', name)
+        self.assertEqual(['--all'], args)
+
+    @mock.patch('cliff.commandmanager.CommandManager.load_commands')
+    def test_load_commands_index_failure(self, load_mock):
+        self.index.get_entry_points.side_effect = OSError('boom')
+
+        command_index.CommandManager('openstack.common', index=self.index)
+
+        load_mock.assert_called_once_with('openstack.common')
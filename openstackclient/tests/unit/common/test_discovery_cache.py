@@ -0,0 +1,113 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import json
+import os
+import time
+from unittest import mock
+
+import fixtures
+from keystoneauth1 import discover
+from keystoneauth1 import fixture as ksa_fixture
+from keystoneauth1 import session
+from requests_mock.contrib import fixture as rm_fixture
+
+from openstackclient.common import discovery_cache
+from openstackclient.tests.unit import utils
+
+
+COMPUTE_URL = 'http://compute.example.com'
+VOLUME_URL = 'http://volume.example.com'
+
+
+def _versions(min_version='2.1', max_version='2.90'):
+    disc = ksa_fixture.DiscoveryList(href=COMPUTE_URL, v2=False, v3=False)
+    disc.add_nova_microversion(
+        href=COMPUTE_URL + '/v2.1',
+        id='v2.1',
+        min_version=min_version,
+        version=max_version,
+    )
+    return disc
+
+
+class TestDiscoveryCache(utils.TestCase):
+    def setUp(self):
+        super(TestDiscoveryCache, self).setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'discovery.json'
+        )
+        self.requests = self.useFixture(rm_fixture.Fixture())
+        self.requests.get(COMPUTE_URL, json=_versions())
+        self.requests.get(VOLUME_URL, json=_versions())
+
+    def _discover(self, url=COMPUTE_URL, cache=None):
+        sess = session.Session(
+            discovery_cache=cache
+            or discovery_cache.DiscoveryCache(path=self.path)
+        )
+        return discover.get_discovery(sess, url)
+
+    def _max_version(self, disc):
+        return disc.raw_version_data()[0]['version']
+
+    def test_store_and_reuse(self):
+        self._discover()
+        self.assertEqual(1, self.requests.call_count)
+
+        disc = self._discover()
+
+        self.assertEqual(1, self.requests.call_count)
+        self.assertEqual('2.90', self._max_version(disc))
+
+    def test_other_endpoint(self):
+        self._discover()
+        self._discover(url=VOLUME_URL)
+        self.assertEqual(2, self.requests.call_count)
+
+        # Both documents are kept
+        self._discover()
+        self._discover(url=VOLUME_URL)
+        self.assertEqual(2, self.requests.call_count)
+
+    def test_expired(self):
+        self._discover()
+
+        self.requests.get(COMPUTE_URL, json=_versions(max_version='2.95'))
+        with mock.patch.object(time, 'time', return_value=time.time() + 7200):
+            disc = self._discover()
+
+        self.assertEqual(2, self.requests.call_count)
+        self.assertEqual('2.95', self._max_version(disc))
+
+    def test_refresh(self):
+        self._discover()
+
+        self.requests.get(COMPUTE_URL, json=_versions(max_version='2.95'))
+        cache = discovery_cache.DiscoveryCache(path=self.path)
+        cache.refresh()
+        self._discover(cache=cache)
+        self.assertEqual(2, self.requests.call_count)
+
+        # The stored document is replaced
+        disc = self._discover()
+        self.assertEqual(2, self.requests.call_count)
+        self.assertEqual('2.95', self._max_version(disc))
+
+    def test_invalid_file(self):
+        with open(self.path, 'w') as f:
+            json.dump({'format': 1, 'entries': {COMPUTE_URL: 'garbage'}}, f)
+
+        self._discover()
+
+        self.assertEqual(1, self.requests.call_count)
@@ -0,0 +1,184 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+import time
+from unittest import mock
+
+import fixtures
+
+from openstackclient.common import image_cache
+from openstackclient.tests.unit.image.v2 import fakes as image_fakes
+from openstackclient.tests.unit import utils
+
+
+SCOPE = 'http://identity.example.com project-id'
+
+
+class TestImagePropertyIndex(utils.TestCase):
+    def setUp(self):
+        super(TestImagePropertyIndex, self).setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'images.json'
+        )
+        self.images = [
+            image_fakes.create_one_image(
+                {
+                    'name': 'cirros',
+                    'visibility': 'public',
+                    'hypervisor_type': 'qemu',
+                    'min_disk': 1,
+                }
+            ),
+            image_fakes.create_one_image(
+                {
+                    'name': 'ubuntu',
+                    'visibility': 'public',
+                    'properties': {'hypervisor_type': 'qemu', 'os': 'linux'},
+                }
+            ),
+            image_fakes.create_one_image(
+                {'name': 'other', 'properties': {'os': 'linux'}}
+            ),
+        ]
+        self.list_images = mock.Mock(return_value=self.images)
+        self.get_image = mock.Mock(
+            side_effect=lambda image_id: next(
+                (i for i in self.images if i.id == image_id), None
+            )
+        )
+
+    def _index(self, ttl=60, scope=SCOPE):
+        return image_cache.ImagePropertyIndex(
+            self.list_images,
+            self.get_image,
+            ttl=ttl,
+            scope=scope,
+            path=self.path,
+        )
+
+    def _ids(self, *positions):
+        return [self.images[p].id for p in positions]
+
+    def test_find_without_index(self):
+        images = self._index(ttl=0)
+
+        image_ids, image = images.find(
+            {'visibility': 'public', 'hypervisor_type': 'qemu'}
+        )
+
+        # Only the properties the Image service filters on are sent
+        self.list_images.assert_called_once_with(visibility='public')
+        self.assertEqual(self._ids(0, 1), image_ids)
+        self.assertIs(self.images[0], image)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_find_without_index_not_filtered(self):
+        images = self._index(ttl=0)
+
+        image_ids, image = images.find(
+            {'visibility': 'unknown', 'min_disk': '1'}
+        )
+
+        # An invalid value would be rejected by the Image service, and only
+        # string values can match
+        self.list_images.assert_called_once_with()
+        self.assertEqual([], image_ids)
+        self.assertIsNone(image)
+
+    def test_find_no_scope(self):
+        images = self._index(scope=None)
+
+        images.find({'os': 'linux'})
+
+        self.list_images.assert_called_once_with()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_find_with_index(self):
+        images = self._index()
+
+        image_ids, image = images.find({'os': 'linux'})
+        self.assertEqual(self._ids(1, 2), image_ids)
+        self.assertIs(self.images[1], image)
+
+        image_ids, image = images.find(
+            {'os': 'linux', 'hypervisor_type': 'qemu'}
+        )
+        self.assertEqual(self._ids(1), image_ids)
+
+        image_ids, image = images.find({'os': 'windows'})
+        self.assertEqual([], image_ids)
+        self.assertIsNone(image)
+
+        # The images are listed once, without filters
+        self.list_images.assert_called_once_with()
+        self.get_image.assert_not_called()
+
+    def test_find_stored_index(self):
+        self._index().find({'name': 'cirros'})
+
+        image_ids, image = self._index().find({'name': 'ubuntu'})
+
+        self.list_images.assert_called_once_with()
+        self.get_image.assert_called_once_with(self.images[1].id)
+        self.assertEqual(self._ids(1), image_ids)
+        self.assertIs(self.images[1], image)
+
+    def test_find_stored_index_expired(self):
+        self._index().find({'name': 'cirros'})
+
+        with mock.patch.object(time, 'time', return_value=time.time() + 61):
+            self._index().find({'name': 'cirros'})
+
+        self.assertEqual(2, self.list_images.call_count)
+
+    def test_find_stored_index_other_scope(self):
+        self._index().find({'name': 'cirros'})
+        self._index(scope='http://other.example.com project-id').find(
+            {'name': 'cirros'}
+        )
+
+        self.assertEqual(2, self.list_images.call_count)
+
+    def test_find_stored_index_deleted_image(self):
+        self._index().find({'name': 'cirros'})
+        deleted = self.images.pop(0)
+
+        image_ids, image = self._index().find({'hypervisor_type': 'qemu'})
+
+        # The index is built again when an image no longer exists
+        self.get_image.assert_called_once_with(deleted.id)
+        self.assertEqual(2, self.list_images.call_count)
+        self.assertEqual(self._ids(0), image_ids)
+        self.assertIs(self.images[0], image)
+
+    def test_find_stored_index_changed_image(self):
+        self._index().find({'name': 'cirros'})
+        self.images[0].name = 'renamed'
+
+        image_ids, image = self._index().find({'name': 'cirros'})
+
+        # The index is built again when an image no longer matches
+        self.get_image.assert_called_once_with(self.images[0].id)
+        self.assertEqual(2, self.list_images.call_count)
+        self.assertEqual([], image_ids)
+        self.assertIsNone(image)
+
+    def test_find_invalid_file(self):
+        with open(self.path, 'w') as f:
+            f.write('{"format": 1, "entries": {"%s": {"ids": 1}}}' % SCOPE)
+
+        image_ids, image = self._index().find({'name': 'other'})
+
+        self.list_images.assert_called_once_with()
+        self.assertEqual(self._ids(2), image_ids)
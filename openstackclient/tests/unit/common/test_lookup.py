@@ -0,0 +1,144 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from unittest import mock
+
+from openstackclient.common import lookup
+from openstackclient.tests.unit import utils
+
+
+def _resource(resource_id):
+    return mock.Mock(id=resource_id, name='name-' + resource_id)
+
+
+def _list_resources(ids):
+    return [_resource(i) for i in ids if i != 'missing']
+
+
+class TestChunkIds(utils.TestCase):
+    def test_chunk_ids(self):
+        self.assertEqual(
+            [['aaa', 'bbb'], ['ccc', 'dd'], ['eeeeeeeeee']],
+            lookup.chunk_ids(
+                ['aaa', 'bbb', 'ccc', 'dd', 'eeeeeeeeee'], max_length=7
+            ),
+        )
+
+    def test_chunk_ids_empty(self):
+        self.assertEqual([], lookup.chunk_ids([]))
+
+
+class TestResourceLookup(utils.TestCase):
+    def test_resolve_list(self):
+        list_resources = mock.Mock(side_effect=_list_resources)
+        get_resource = mock.Mock(side_effect=_resource)
+        resources = lookup.ResourceLookup(
+            get_resource=get_resource, list_resources=list_resources
+        )
+
+        resources.resolve(['a', 'b', 'missing', 'a'])
+
+        list_resources.assert_called_once_with(['a', 'b', 'missing'])
+        get_resource.assert_not_called()
+        self.assertEqual('a', resources.get('a').id)
+        self.assertEqual('b', resources['b'].id)
+        self.assertIsNone(resources.get('missing'))
+
+        # The results are reused
+        resources.resolve(['a', 'missing', 'c'])
+
+        list_resources.assert_called_with(['c'])
+        self.assertEqual(2, list_resources.call_count)
+
+    def test_resolve_list_chunked(self):
+        list_resources = mock.Mock(side_effect=_list_resources)
+        resources = lookup.ResourceLookup(list_resources=list_resources)
+        ids = ['%036d' % i for i in range(300)]
+
+        resources.resolve(ids)
+
+        self.assertEqual(3, list_resources.call_count)
+        for call in list_resources.call_args_list:
+            self.assertLessEqual(
+                len(','.join(call[0][0])), lookup.MAX_FILTER_LENGTH
+            )
+        self.assertEqual(ids, [resources[i].id for i in ids])
+
+    def test_resolve_list_not_chunked(self):
+        list_resources = mock.Mock(side_effect=_list_resources)
+        resources = lookup.ResourceLookup(
+            list_resources=list_resources, chunked=False
+        )
+        ids = ['%036d' % i for i in range(300)]
+
+        resources.resolve(ids)
+
+        list_resources.assert_called_once_with(ids)
+
+    def test_resolve_list_failure(self):
+        list_resources = mock.Mock(side_effect=Exception('not supported'))
+        get_resource = mock.Mock(side_effect=_resource)
+        resources = lookup.ResourceLookup(
+            get_resource=get_resource, list_resources=list_resources
+        )
+
+        resources.resolve(['a', 'b'])
+
+        # Falls back to looking up the resources one by one
+        get_resource.assert_has_calls(
+            [mock.call('a'), mock.call('b')], any_order=True
+        )
+        self.assertEqual('a', resources.get('a').id)
+        self.assertEqual('b', resources.get('b').id)
+
+    def test_resolve_one_by_one(self):
+        def _get_resource(resource_id):
+            if resource_id == 'missing':
+                raise Exception('not found')
+            return _resource(resource_id)
+
+        get_resource = mock.Mock(side_effect=_get_resource)
+        resources = lookup.ResourceLookup(get_resource=get_resource)
+
+        resources.resolve(['a', 'missing'])
+        resources.resolve(['a', 'missing'])
+
+        self.assertEqual(2, get_resource.call_count)
+        self.assertEqual('a', resources.get('a').id)
+        self.assertIsNone(resources.get('missing'))
+
+    def test_defer(self):
+        get_resource = mock.Mock(side_effect=_resource)
+        resources = lookup.ResourceLookup(get_resource=get_resource)
+
+        resources.defer(['a', 'b'])
+        resources.defer(['a'])
+
+        get_resource.assert_not_called()
+        self.assertEqual('a', resources.get('a').id)
+        self.assertEqual('b', resources['b'].id)
+        self.assertEqual(2, get_resource.call_count)
+
+    def test_resolve_several(self):
+        images = lookup.ResourceLookup(
+            list_resources=mock.Mock(side_effect=_list_resources)
+        )
+        flavors = lookup.ResourceLookup(
+            get_resource=mock.Mock(side_effect=_resource)
+        )
+
+        lookup.resolve([(images, ['i1', 'i2']), (flavors, ['f1', 'f2'])])
+
+        self.assertEqual('i2', images.get('i2').id)
+        self.assertEqual('f1', flavors.get('f1').id)
+        self.assertIsNone(images.get('f1'))
@@ -0,0 +1,110 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import threading
+
+from openstackclient.common import parallel
+from openstackclient.tests.unit import utils
+
+
+class TestRun(utils.TestCase):
+    def test_run(self):
+        self.assertEqual(
+            [0, 2, 4, 6],
+            parallel.run(lambda i: i * 2, range(4), workers=2),
+        )
+
+    def test_run_single_item(self):
+        threads = parallel.run(lambda i: threading.current_thread(), [1])
+
+        self.assertEqual([threading.current_thread()], threads)
+
+    def test_run_exception(self):
+        def _func(i):
+            if i == 2:
+                raise ValueError(i)
+            return i
+
+        self.assertRaises(ValueError, parallel.run, _func, range(4))
+
+
+class TestImap(utils.TestCase):
+    def test_imap(self):
+        self.assertEqual(
+            [i * 2 for i in range(20)],
+            list(parallel.imap(lambda i: i * 2, range(20), workers=3)),
+        )
+
+    def test_imap_lazy(self):
+        called = []
+
+        def _func(i):
+            called.append(i)
+            return i
+
+        results = parallel.imap(_func, range(100), workers=2)
+        self.assertEqual(0, next(results))
+        results.close()
+
+        # Only a few calls were made ahead of the results consumed
+        self.assertLessEqual(len(called), 3)
+
+    def test_imap_exception(self):
+        def _func(i):
+            if i == 2:
+                raise ValueError(i)
+            return i
+
+        results = parallel.imap(_func, range(4), workers=2)
+
+        self.assertEqual([0, 1], [next(results) for _ in range(2)])
+        self.assertRaises(ValueError, next, results)
+
+
+class TestChain(utils.TestCase):
+    def test_chain(self):
+        self.assertEqual(
+            list(range(30)),
+            list(
+                parallel.chain(
+                    [range(0, 10), range(10, 20), iter([]), range(20, 30)],
+                    workers=2,
+                )
+            ),
+        )
+
+    def test_chain_buffer(self):
+        consumed = []
+
+        def _items(start):
+            for i in range(start, start + 10):
+                consumed.append(i)
+                yield i
+
+        items = parallel.chain([_items(0), _items(10)], buffer_size=2)
+        self.assertEqual(0, next(items))
+        items.close()
+
+        # The iterables were not consumed much further than the buffer
+        self.assertLessEqual(len([i for i in consumed if i < 10]), 4)
+        self.assertLessEqual(len([i for i in consumed if i >= 10]), 3)
+
+    def test_chain_exception(self):
+        def _failing():
+            yield 3
+            raise ValueError('failed')
+
+        items = parallel.chain([iter([1, 2]), _failing(), iter([4])])
+
+        self.assertEqual([1, 2, 3], [next(items) for _ in range(3)])
+        self.assertRaises(ValueError, next, items)
@@ -0,0 +1,109 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import json
+import os
+import time
+from unittest import mock
+
+import fixtures
+
+from openstackclient.common import project_cache
+from openstackclient.tests.unit import utils
+
+
+AUTH_URL = 'http://identity.example.com'
+
+
+def _get_project(project_id):
+    if project_id == 'missing':
+        raise Exception('not found')
+    project = mock.Mock(id=project_id)
+    project.name = 'name-' + project_id
+    return project
+
+
+class TestProjectLookup(utils.TestCase):
+    def setUp(self):
+        super(TestProjectLookup, self).setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'projects.json'
+        )
+        self.get_project = mock.Mock(side_effect=_get_project)
+
+    def _lookup(self, ttl=60, scope=AUTH_URL):
+        return project_cache.ProjectLookup(
+            self.get_project, ttl=ttl, scope=scope, path=self.path
+        )
+
+    def test_resolve(self):
+        projects = self._lookup(ttl=0)
+
+        projects.resolve(['p1', 'p2', '', None, 'p1', 'missing'])
+
+        self.assertEqual(3, self.get_project.call_count)
+        self.assertEqual('name-p1', projects.get('p1').name)
+        self.assertEqual('name-p2', projects['p2'].name)
+        self.assertIsNone(projects.get('missing'))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_store_and_reuse(self):
+        self._lookup().resolve(['p1', 'missing'])
+        self.assertEqual(2, self.get_project.call_count)
+
+        projects = self._lookup()
+        projects.resolve(['p1', 'p2', 'missing'])
+
+        # Only the projects found are stored
+        self.get_project.assert_has_calls(
+            [mock.call('p2'), mock.call('missing')], any_order=True
+        )
+        self.assertEqual(4, self.get_project.call_count)
+        self.assertEqual('name-p1', projects.get('p1').name)
+
+        with open(self.path) as f:
+            stored = json.load(f)['entries'][AUTH_URL]
+        self.assertEqual(['p1', 'p2'], sorted(stored))
+
+    def test_expired(self):
+        self._lookup().resolve(['p1'])
+
+        with mock.patch.object(time, 'time', return_value=time.time() + 61):
+            self._lookup().resolve(['p1'])
+
+        self.assertEqual(2, self.get_project.call_count)
+
+    def test_other_scope(self):
+        self._lookup().resolve(['p1'])
+        self._lookup(scope='http://other.example.com').resolve(['p1'])
+
+        self.assertEqual(2, self.get_project.call_count)
+
+        with open(self.path) as f:
+            entries = json.load(f)['entries']
+        self.assertEqual(2, len(entries))
+
+    def test_no_scope(self):
+        self._lookup(scope=None).resolve(['p1'])
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_invalid_file(self):
+        with open(self.path, 'w') as f:
+            f.write('{"format": 1, "entries": {"%s": {"p1": 1}}}' % AUTH_URL)
+
+        projects = self._lookup()
+        projects.resolve(['p1'])
+
+        self.get_project.assert_called_once_with('p1')
+        self.assertEqual('name-p1', projects.get('p1').name)
@@ -197,6 +197,18 @@ class TestQuotaList(TestQuota):
 
         self.cmd = quota.ListQuota(self.app, None)
 
+    def _by_project(self, results):
+        """Return the results for the projects, whatever the order of calls"""
+        results = dict(zip([p.id for p in self.projects], results))
+
+        def _get(project_id):
+            result = results[project_id]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return _get
+
     @staticmethod
     def _get_detailed_reference_data(quota):
         reference_data = []
@@ -309,7 +321,7 @@ class TestQuotaList(TestQuota):
     def test_quota_list_compute(self):
         # Two projects with non-default quotas
         self.compute.quotas.get = mock.Mock(
-            side_effect=self.compute_quotas,
+            side_effect=self._by_project(self.compute_quotas),
         )
 
         arglist = [
@@ -326,14 +338,20 @@ class TestQuotaList(TestQuota):
         self.assertEqual(self.compute_column_header, columns)
         self.assertEqual(self.compute_reference_data, ret_quotas[0])
         self.assertEqual(2, len(ret_quotas))
+        # The defaults are the same for all the projects
+        self.compute.quotas.defaults.assert_called_once_with(
+            self.projects[0].id
+        )
 
     def test_quota_list_compute_default(self):
         # One of the projects is at defaults
         self.compute.quotas.get = mock.Mock(
-            side_effect=[
-                self.compute_quotas[0],
-                compute_fakes.create_one_default_comp_quota(),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.compute_quotas[0],
+                    compute_fakes.create_one_default_comp_quota(),
+                ]
+            ),
         )
 
         arglist = [
@@ -354,10 +372,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_compute_no_project_not_found(self):
         # Make one of the projects disappear
         self.compute.quotas.get = mock.Mock(
-            side_effect=[
-                self.compute_quotas[0],
-                exceptions.NotFound("NotFound"),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.compute_quotas[0],
+                    exceptions.NotFound("NotFound"),
+                ]
+            ),
         )
 
         arglist = [
@@ -378,10 +398,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_compute_no_project_4xx(self):
         # Make one of the projects disappear
         self.compute.quotas.get = mock.Mock(
-            side_effect=[
-                self.compute_quotas[0],
-                exceptions.BadRequest("Bad request"),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.compute_quotas[0],
+                    exceptions.BadRequest("Bad request"),
+                ]
+            ),
         )
 
         arglist = [
@@ -402,10 +424,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_compute_no_project_5xx(self):
         # Make one of the projects disappear
         self.compute.quotas.get = mock.Mock(
-            side_effect=[
-                self.compute_quotas[0],
-                exceptions.HTTPNotImplemented("Not implemented??"),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.compute_quotas[0],
+                    exceptions.HTTPNotImplemented("Not implemented??"),
+                ]
+            ),
         )
 
         arglist = [
@@ -416,11 +440,9 @@ class TestQuotaList(TestQuota):
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        self.assertRaises(
-            exceptions.HTTPNotImplemented,
-            self.cmd.take_action,
-            parsed_args,
-        )
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertRaises(exceptions.HTTPNotImplemented, list, data)
 
     def test_quota_list_compute_by_project(self):
         # Two projects with non-default quotas
@@ -449,7 +471,7 @@ class TestQuotaList(TestQuota):
     def test_quota_list_network(self):
         # Two projects with non-default quotas
         self.network_client.get_quota = mock.Mock(
-            side_effect=self.network_quotas,
+            side_effect=self._by_project(self.network_quotas),
         )
 
         arglist = [
@@ -470,10 +492,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_network_default(self):
         # Two projects with non-default quotas
         self.network_client.get_quota = mock.Mock(
-            side_effect=[
-                self.network_quotas[0],
-                network_fakes.FakeQuota.create_one_default_net_quota(),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.network_quotas[0],
+                    network_fakes.FakeQuota.create_one_default_net_quota(),
+                ]
+            ),
         )
 
         arglist = [
@@ -494,10 +518,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_network_no_project(self):
         # Two projects with non-default quotas
         self.network_client.get_quota = mock.Mock(
-            side_effect=[
-                self.network_quotas[0],
-                exceptions.NotFound("NotFound"),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.network_quotas[0],
+                    exceptions.NotFound("NotFound"),
+                ]
+            ),
         )
 
         arglist = [
@@ -542,7 +568,7 @@ class TestQuotaList(TestQuota):
     def test_quota_list_volume(self):
         # Two projects with non-default quotas
         self.volume.quotas.get = mock.Mock(
-            side_effect=self.volume_quotas,
+            side_effect=self._by_project(self.volume_quotas),
         )
 
         arglist = [
@@ -563,10 +589,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_volume_default(self):
         # Two projects with non-default quotas
         self.volume.quotas.get = mock.Mock(
-            side_effect=[
-                self.volume_quotas[0],
-                volume_fakes.create_one_default_vol_quota(),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.volume_quotas[0],
+                    volume_fakes.create_one_default_vol_quota(),
+                ]
+            ),
         )
 
         arglist = [
@@ -587,10 +615,12 @@ class TestQuotaList(TestQuota):
     def test_quota_list_volume_no_project(self):
         # Two projects with non-default quotas
         self.volume.quotas.get = mock.Mock(
-            side_effect=[
-                self.volume_quotas[0],
-                volume_fakes.create_one_default_vol_quota(),
-            ],
+            side_effect=self._by_project(
+                [
+                    self.volume_quotas[0],
+                    volume_fakes.create_one_default_vol_quota(),
+                ]
+            ),
         )
 
         arglist = [
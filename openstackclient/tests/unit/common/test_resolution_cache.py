@@ -0,0 +1,269 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import time
+from unittest import mock
+
+from openstack import exceptions as sdk_exceptions
+from osc_lib import exceptions
+
+from openstackclient.common import resolution_cache
+from openstackclient.tests.unit import utils
+
+
+class TestResolutionCache(utils.TestCase):
+    def setUp(self):
+        super(TestResolutionCache, self).setUp()
+        self.cache = resolution_cache.ResolutionCache()
+
+    def test_resolve(self):
+        find = mock.Mock(return_value='resource')
+
+        self.assertEqual('resource', self.cache.resolve('key', find))
+        self.assertEqual('resource', self.cache.resolve('key', find))
+
+        find.assert_called_once_with()
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_resolve_not_found(self):
+        find = mock.Mock(side_effect=exceptions.CommandError('not found'))
+
+        for _ in range(2):
+            self.assertRaises(
+                exceptions.CommandError,
+                self.cache.resolve,
+                'key',
+                find,
+                not_found=(exceptions.CommandError,),
+            )
+
+        find.assert_called_once_with()
+        self.assertEqual(1, self.cache.hits)
+
+    def test_resolve_error_not_cached(self):
+        find = mock.Mock(side_effect=[ValueError('error'), 'resource'])
+
+        self.assertRaises(
+            ValueError,
+            self.cache.resolve,
+            'key',
+            find,
+            not_found=(exceptions.CommandError,),
+        )
+        self.assertEqual('resource', self.cache.resolve('key', find))
+
+        self.assertEqual(2, find.call_count)
+
+    def test_resolve_expired(self):
+        find = mock.Mock(return_value='id')
+        self.cache.resolve('key', find)
+
+        with mock.patch.object(
+            time, 'monotonic', return_value=time.monotonic() + 61
+        ):
+            self.cache.resolve('key', find)
+
+        self.assertEqual(2, find.call_count)
+
+    def test_resolve_not_found_expired(self):
+        find = mock.Mock(side_effect=[exceptions.CommandError('x'), 'id'])
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cache.resolve,
+            'key',
+            find,
+            not_found=(exceptions.CommandError,),
+        )
+
+        with mock.patch.object(
+            time, 'monotonic', return_value=time.monotonic() + 61
+        ):
+            self.assertEqual('id', self.cache.resolve('key', find))
+
+    def test_resolve_disabled(self):
+        cache = resolution_cache.ResolutionCache(ttl=0)
+        find = mock.Mock(return_value='id')
+
+        cache.resolve('key', find)
+        cache.resolve('key', find)
+
+        self.assertEqual(2, find.call_count)
+
+    def test_discard(self):
+        find = mock.Mock(return_value='id')
+        self.cache.resolve('key', find)
+
+        self.cache.discard('key')
+        self.cache.resolve('key', find)
+
+        self.assertEqual(2, find.call_count)
+
+    def test_clear(self):
+        find = mock.Mock(return_value='resource')
+        self.cache.resolve('key', find)
+
+        self.cache.clear()
+        self.cache.resolve('key', find)
+
+        self.assertEqual(2, find.call_count)
+
+    def test_clear_while_resolving(self):
+        def find():
+            # A command changed the resources during the lookup
+            self.cache.clear()
+            return 'outdated'
+
+        self.assertEqual('outdated', self.cache.resolve('key', find))
+        self.assertEqual(
+            'resource', self.cache.resolve('key', lambda: 'resource')
+        )
+
+    def test_log_stats(self):
+        self.cache.resolve('key', lambda: 'resource')
+        self.cache.resolve('key', lambda: 'resource')
+
+        with mock.patch.object(resolution_cache.LOG, 'debug') as debug:
+            self.cache.log_stats()
+
+        debug.assert_called_once_with(
+            'Name resolution cache: %(hits)d hits, %(misses)d misses',
+            {'hits': 1, 'misses': 1},
+        )
+
+    def test_get_cache(self):
+        session = mock.Mock()
+
+        cache = resolution_cache.get_cache(session)
+
+        self.assertIs(cache, resolution_cache.get_cache(session))
+        self.assertIsNot(cache, resolution_cache.get_cache(mock.Mock()))
+        self.assertEqual(resolution_cache.DEFAULT_TTL, cache.ttl)
+
+        resolution_cache.get_cache(session, ttl=10)
+        self.assertEqual(10, cache.ttl)
+
+
+UUID = '6a2f9cbd-2a42-4a37-8e9b-5c1a43bd4b5e'
+
+
+class TestFindSDKResource(utils.TestCase):
+    def setUp(self):
+        super(TestFindSDKResource, self).setUp()
+        self.cache = resolution_cache.ResolutionCache()
+        self.server = mock.Mock(id=UUID)
+        self.proxy = mock.Mock(service_type='compute')
+        self.proxy.find_server.return_value = self.server
+        self.proxy.get_server.return_value = self.server
+
+    def test_find_resource_id(self):
+        for _ in range(2):
+            self.assertEqual(
+                UUID,
+                resolution_cache.find_sdk_resource_id(
+                    self.cache, self.proxy, 'server', 'name'
+                ),
+            )
+
+        self.proxy.find_server.assert_called_once_with(
+            'name', ignore_missing=False
+        )
+        self.assertEqual(1, self.cache.hits)
+
+    def test_find_resource_id_uuid(self):
+        for _ in range(2):
+            resolution_cache.find_sdk_resource_id(
+                self.cache, self.proxy, 'server', UUID
+            )
+
+        self.assertEqual(2, self.proxy.find_server.call_count)
+        self.assertEqual(0, self.cache.misses)
+
+    def test_find_resource_id_scope(self):
+        for project_id in ('p1', 'p2', 'p1'):
+            resolution_cache.find_sdk_resource_id(
+                self.cache,
+                self.proxy,
+                'server',
+                'name',
+                project_id=project_id,
+            )
+
+        self.assertEqual(2, self.proxy.find_server.call_count)
+
+    def test_find_resource_id_not_found(self):
+        self.proxy.find_server.side_effect = sdk_exceptions.NotFoundException(
+            'missing'
+        )
+
+        for _ in range(2):
+            self.assertRaises(
+                sdk_exceptions.NotFoundException,
+                resolution_cache.find_sdk_resource_id,
+                self.cache,
+                self.proxy,
+                'server',
+                'name',
+            )
+
+        self.proxy.find_server.assert_called_once_with(
+            'name', ignore_missing=False
+        )
+
+    def test_find_resource_id_unhashable(self):
+        for _ in range(2):
+            resolution_cache.find_sdk_resource_id(
+                self.cache, self.proxy, 'server', 'name', tags=['a']
+            )
+
+        self.assertEqual(2, self.proxy.find_server.call_count)
+
+    def test_find_resource_id_no_cache(self):
+        for _ in range(2):
+            resolution_cache.find_sdk_resource_id(
+                None, self.proxy, 'server', 'name'
+            )
+
+        self.assertEqual(2, self.proxy.find_server.call_count)
+
+    def test_find_resource(self):
+        for _ in range(2):
+            self.assertIs(
+                self.server,
+                resolution_cache.find_sdk_resource(
+                    self.cache, self.proxy, 'server', 'name'
+                ),
+            )
+
+        # The server is fetched again by ID rather than cached
+        self.proxy.find_server.assert_called_once_with(
+            'name', ignore_missing=False
+        )
+        self.proxy.get_server.assert_called_once_with(UUID)
+
+    def test_find_resource_deleted(self):
+        resolution_cache.find_sdk_resource(
+            self.cache, self.proxy, 'server', 'name'
+        )
+        self.proxy.get_server.side_effect = sdk_exceptions.NotFoundException(
+            'deleted'
+        )
+
+        self.assertIs(
+            self.server,
+            resolution_cache.find_sdk_resource(
+                self.cache, self.proxy, 'server', 'name'
+            ),
+        )
+
+        self.assertEqual(2, self.proxy.find_server.call_count)
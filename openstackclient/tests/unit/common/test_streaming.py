@@ -0,0 +1,98 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import argparse
+import io
+
+from cliff.formatters import commaseparated
+from cliff.formatters import json_format
+from osc_lib.cli import format_columns
+
+from openstackclient.common import streaming
+from openstackclient.tests.unit import utils
+
+
+class TestPages(utils.TestCase):
+    def test_pages(self):
+        self.assertEqual(
+            [[0, 1, 2], [3, 4, 5], [6]],
+            list(streaming.pages(range(7), size=3)),
+        )
+
+    def test_pages_empty(self):
+        self.assertEqual([], list(streaming.pages([])))
+
+    def test_pages_lazy(self):
+        fetched = []
+
+        def _items():
+            for i in range(4):
+                fetched.append(i)
+                yield i
+
+        pages = streaming.pages(_items(), size=2)
+
+        self.assertEqual([0, 1], next(pages))
+        self.assertEqual([0, 1], fetched)
+
+
+class TestJSONFormatter(utils.TestCase):
+    columns = ('ID', 'Name', 'Properties')
+    rows = [
+        ('1', 'one', format_columns.DictColumn({'a': 'b'})),
+        ('2', 'two', format_columns.DictColumn({})),
+    ]
+
+    def _emit(self, formatter, rows, noindent):
+        stdout = io.StringIO()
+        parsed_args = argparse.Namespace(noindent=noindent)
+        formatter.emit_list(self.columns, iter(rows), stdout, parsed_args)
+        return stdout.getvalue()
+
+    def _check(self, rows, noindent=False):
+        self.assertEqual(
+            self._emit(json_format.JSONFormatter(), rows, noindent),
+            self._emit(streaming.JSONFormatter(), rows, noindent),
+        )
+
+    def test_emit_list(self):
+        self._check(self.rows)
+
+    def test_emit_list_noindent(self):
+        self._check(self.rows, noindent=True)
+
+    def test_emit_list_empty(self):
+        self._check([])
+        self._check([], noindent=True)
+
+    def test_emit_list_incremental(self):
+        stdout = io.StringIO()
+        parsed_args = argparse.Namespace(noindent=True)
+
+        def _rows():
+            yield self.rows[0]
+            # The first item is written before the next one is produced
+            self.assertIn('"one"', stdout.getvalue())
+            yield self.rows[1]
+
+        streaming.JSONFormatter().emit_list(
+            self.columns, _rows(), stdout, parsed_args
+        )
+
+    def test_get_formatter(self):
+        self.assertIsInstance(
+            streaming.get_formatter(json_format.JSONFormatter()),
+            streaming.JSONFormatter,
+        )
+        csv_formatter = commaseparated.CSVLister()
+        self.assertIs(csv_formatter, streaming.get_formatter(csv_formatter))
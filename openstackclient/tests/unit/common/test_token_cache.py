@@ -0,0 +1,149 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import datetime
+import json
+import os
+
+import fixtures
+from keystoneauth1 import fixture as ksa_fixture
+from keystoneauth1.identity import v3
+
+from openstackclient.common import token_cache
+from openstackclient.tests.unit import utils
+
+
+AUTH_URL = 'http://identity.example.com/v3'
+
+
+def _make_auth(password='secret', project_name='project'):
+    return v3.Password(
+        auth_url=AUTH_URL,
+        username='user',
+        password=password,
+        user_domain_id='default',
+        project_name=project_name,
+        project_domain_id='default',
+    )
+
+
+def _set_token(auth, token_id='token-1', expires_in=3600):
+    token = ksa_fixture.V3Token(
+        expires=datetime.datetime.utcnow()
+        + datetime.timedelta(seconds=expires_in),
+    )
+    token.set_project_scope()
+    auth.set_auth_state(json.dumps({'auth_token': token_id, 'body': token}))
+
+
+class TestTokenCache(utils.TestCase):
+    def setUp(self):
+        super(TestTokenCache, self).setUp()
+        self.directory = self.useFixture(fixtures.TempDir()).path
+
+    def _save(self, auth=None, **kwargs):
+        auth = auth or _make_auth()
+        _set_token(auth, **kwargs)
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+        cache.save()
+        return cache
+
+    def test_save_and_load(self):
+        saved = self._save()
+
+        auth = _make_auth()
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+
+        self.assertTrue(cache.load())
+        self.assertEqual('token-1', auth.auth_ref.auth_token)
+        self.assertEqual(saved.path, cache.path)
+
+    def test_entry_encrypted(self):
+        saved = self._save()
+
+        with open(saved.path) as f:
+            content = f.read()
+
+        self.assertNotIn('token-1', content)
+        self.assertEqual(0o600, os.stat(saved.path).st_mode & 0o777)
+
+    def test_load_other_credentials(self):
+        self._save()
+
+        auth = _make_auth(password='other')
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+
+        self.assertFalse(cache.load())
+        self.assertIsNone(auth.auth_ref)
+
+    def test_load_other_project(self):
+        self._save()
+
+        auth = _make_auth(project_name='other')
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+
+        self.assertFalse(cache.load())
+
+    def test_load_expiring_token(self):
+        self._save(expires_in=60)
+
+        auth = _make_auth()
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+
+        self.assertFalse(cache.load())
+        self.assertIsNone(auth.auth_ref)
+
+    def test_load_corrupted_entry(self):
+        saved = self._save()
+        with open(saved.path, 'w') as f:
+            json.dump({'state': 'garbage'}, f)
+
+        cache = token_cache.TokenCache(_make_auth(), directory=self.directory)
+
+        self.assertFalse(cache.load())
+        self.assertFalse(os.path.exists(saved.path))
+
+    def test_save_new_token(self):
+        auth = _make_auth()
+        cache = self._save(auth=auth)
+
+        # The session re-authenticated after the token was rejected
+        _set_token(auth, token_id='token-2')
+        cache.save()
+
+        auth = _make_auth()
+        self.assertTrue(
+            token_cache.TokenCache(auth, directory=self.directory).load()
+        )
+        self.assertEqual('token-2', auth.auth_ref.auth_token)
+
+    def test_save_invalidated_token(self):
+        auth = _make_auth()
+        cache = self._save(auth=auth)
+
+        auth.invalidate()
+        cache.save()
+
+        self.assertFalse(os.path.exists(cache.path))
+
+    def test_plugin_without_cache_id(self):
+        auth = _make_auth()
+        auth.get_cache_id = lambda: None
+
+        cache = token_cache.TokenCache(auth, directory=self.directory)
+
+        self.assertFalse(cache.enabled)
+        self.assertFalse(cache.load())
+        with cache.lock():
+            cache.save()
+        self.assertEqual([], os.listdir(self.directory))
@@ -0,0 +1,172 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from unittest import mock
+
+from novaclient import exceptions as nova_exceptions
+from openstack import exceptions as sdk_exceptions
+
+from openstackclient.common import wait
+from openstackclient.tests.unit import utils
+
+
+class FakeCloud(object):
+    """Resources going through a list of statuses, one per poll"""
+
+    def __init__(self, statuses):
+        self.statuses = {i: list(s) for i, s in statuses.items()}
+
+    def _resource(self, resource_id):
+        statuses = self.statuses[resource_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if status is None:
+            raise sdk_exceptions.NotFoundException(resource_id)
+        return mock.Mock(id=resource_id, status=status, progress=None)
+
+    def get(self, resource_id):
+        return self._resource(resource_id)
+
+    def list(self, ids):
+        resources = []
+        for resource_id in self.statuses:
+            try:
+                resources.append(self._resource(resource_id))
+            except sdk_exceptions.NotFoundException:
+                pass
+        return resources
+
+
+@mock.patch('time.sleep')
+class TestWaitForStatus(utils.TestCase):
+    def test_wait_for_status(self, sleep_mock):
+        cloud = FakeCloud(
+            {
+                'a': ['BUILD', 'ACTIVE'],
+                'b': ['BUILD', 'BUILD', 'BUILD', 'ACTIVE'],
+                'c': ['BUILD', 'ERROR'],
+            }
+        )
+        get_mock = mock.Mock(side_effect=cloud.get)
+        list_mock = mock.Mock(side_effect=cloud.list)
+        callback = mock.Mock()
+
+        failed = wait.wait_for_status(
+            get_mock,
+            ['a', 'b', 'c'],
+            list_resources=list_mock,
+            callback=callback,
+        )
+
+        self.assertEqual(['c'], failed)
+        # A single listing per poll, then a single resource is left
+        self.assertEqual(2, list_mock.call_count)
+        get_mock.assert_has_calls([mock.call('b'), mock.call('b')])
+        self.assertEqual(3, sleep_mock.call_count)
+        callback.assert_called_with(0)
+
+    def test_wait_for_status_backoff(self, sleep_mock):
+        cloud = FakeCloud({'a': ['BUILD'] * 4 + ['ACTIVE']})
+
+        failed = wait.wait_for_status(cloud.get, ['a'], sleep_time=2)
+
+        self.assertEqual([], failed)
+        self.assertEqual(
+            [mock.call(3), mock.call(4.5), mock.call(6.75), mock.call(10.125)],
+            sleep_mock.call_args_list,
+        )
+
+    def test_wait_for_status_timeout(self, sleep_mock):
+        cloud = FakeCloud({'a': ['BUILD'], 'b': ['BUILD', 'ACTIVE']})
+
+        with mock.patch('time.monotonic', side_effect=[0, 5, 11]):
+            failed = wait.wait_for_status(
+                cloud.get, ['a', 'b'], sleep_time=5, timeout=10
+            )
+
+        self.assertEqual(['a'], failed)
+        sleep_mock.assert_called_once_with(5)
+
+    def test_wait_for_status_missing(self, sleep_mock):
+        cloud = FakeCloud({'a': [None]})
+
+        self.assertEqual(['a'], wait.wait_for_status(cloud.get, ['a']))
+
+    def test_wait_for_status_deleted(self, sleep_mock):
+        # A listing of the changed servers returns the deleted ones
+        cloud = FakeCloud({'a': ['BUILD', 'DELETED'], 'b': ['ACTIVE']})
+
+        failed = wait.wait_for_status(
+            cloud.get, ['a', 'b'], list_resources=cloud.list
+        )
+
+        self.assertEqual(['a'], failed)
+
+    def test_wait_for_status_missing_novaclient(self, sleep_mock):
+        get_mock = mock.Mock(side_effect=nova_exceptions.NotFound(404))
+
+        self.assertEqual(['a'], wait.wait_for_status(get_mock, ['a']))
+
+    def test_wait_for_status_get_failure(self, sleep_mock):
+        get_mock = mock.Mock(
+            side_effect=sdk_exceptions.HttpException('server error')
+        )
+
+        self.assertRaises(
+            sdk_exceptions.HttpException,
+            wait.wait_for_status,
+            get_mock,
+            ['a'],
+        )
+
+
+@mock.patch('time.sleep')
+class TestWaitForDelete(utils.TestCase):
+    def test_wait_for_delete(self, sleep_mock):
+        cloud = FakeCloud(
+            {
+                'a': ['DELETING', None],
+                'b': ['DELETING', 'DELETING', None],
+                'c': ['DELETING', 'ERROR'],
+            }
+        )
+        get_mock = mock.Mock(side_effect=cloud.get)
+
+        failed = wait.wait_for_delete(
+            get_mock, ['a', 'b', 'c'], list_resources=cloud.list
+        )
+
+        self.assertEqual(['c'], failed)
+        # The resources missing from the listings are checked individually
+        get_mock.assert_has_calls(
+            [mock.call('a'), mock.call('b')], any_order=True
+        )
+
+    def test_wait_for_delete_deleted(self, sleep_mock):
+        cloud = FakeCloud({'a': ['DELETING', 'DELETED'], 'b': [None]})
+
+        failed = wait.wait_for_delete(
+            cloud.get, ['a', 'b'], list_resources=cloud.list
+        )
+
+        self.assertEqual([], failed)
+
+    def test_wait_for_delete_list_failure(self, sleep_mock):
+        cloud = FakeCloud({'a': ['DELETING', None], 'b': [None]})
+
+        failed = wait.wait_for_delete(
+            cloud.get,
+            ['a', 'b'],
+            list_resources=mock.Mock(side_effect=Exception('not supported')),
+        )
+
+        self.assertEqual([], failed)
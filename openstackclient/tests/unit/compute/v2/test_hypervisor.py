@@ -17,6 +17,7 @@ import json
 from unittest import mock
 
 from novaclient import exceptions as nova_exceptions
+from openstack import exceptions as sdk_exceptions
 from openstack import utils as sdk_utils
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
@@ -286,6 +287,151 @@ class TestHypervisorList(TestHypervisor):
             '--os-compute-api-version 2.33 or greater is required', str(ex)
         )
 
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=True)
+    def test_hypervisor_list_aggregates(self, sm_mock):
+        self.hypervisors[1].service_details = {'host': 'cell1@bbb', 'id': 2}
+        self.sdk_client.aggregates.return_value = [
+            compute_fakes.create_one_aggregate(
+                {'name': 'agg1', 'hosts': ['aaa', 'bbb']}
+            ),
+            compute_fakes.create_one_aggregate(
+                {'name': 'cell1@agg2', 'hosts': ['bbb']}
+            ),
+            compute_fakes.create_one_aggregate({'name': 'agg3'}),
+        ]
+        arglist = [
+            '--aggregates',
+        ]
+        verifylist = [
+            ('aggregates', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # The aggregates are listed once for all the hypervisors
+        self.sdk_client.aggregates.assert_called_once_with()
+        self.assertEqual(self.columns + ('Aggregates',), columns)
+        self.assertEqual(
+            (
+                self.data[0] + (format_columns.ListColumn(['agg1']),),
+                self.data[1] + (format_columns.ListColumn(['cell1@agg2']),),
+            ),
+            tuple(data),
+        )
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=True)
+    def test_hypervisor_list_uptime(self, sm_mock):
+        self.hypervisors[0].uptime = (
+            ' 01:28:24 up 3 days, 11:15,  1 user, '
+            ' load average: 0.94, 0.62, 0.50\n'
+        )
+        self.hypervisors[1].uptime = None
+        arglist = [
+            '--uptime',
+        ]
+        verifylist = [
+            ('uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.get_hypervisor_uptime.assert_not_called()
+        self.assertEqual(self.columns + ('Uptime', 'Load Average'), columns)
+        self.assertEqual(
+            (
+                self.data[0] + ('3 days, 11:15', '0.94, 0.62, 0.50'),
+                self.data[1] + ('', ''),
+            ),
+            tuple(data),
+        )
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=False)
+    def test_hypervisor_list_uptime_pre_v288(self, sm_mock):
+        uptimes = {
+            self.hypervisors[0].id: {
+                'uptime': (
+                    ' 01:28:24 up 3 days, 11:15,  1 user, '
+                    ' load average: 0.94, 0.62, 0.50\n'
+                ),
+            },
+        }
+
+        def get_hypervisor_uptime(hypervisor_id):
+            if hypervisor_id not in uptimes:
+                raise nova_exceptions.HTTPNotImplemented(501)
+            return uptimes[hypervisor_id]
+
+        self.sdk_client.get_hypervisor_uptime.side_effect = (
+            get_hypervisor_uptime
+        )
+        arglist = [
+            '--long',
+            '--uptime',
+        ]
+        verifylist = [
+            ('long', True),
+            ('uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.get_hypervisor_uptime.assert_has_calls(
+            [
+                mock.call(self.hypervisors[0].id),
+                mock.call(self.hypervisors[1].id),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(
+            self.columns_long + ('Uptime', 'Load Average'), columns
+        )
+        self.assertEqual(
+            (
+                self.data_long[0] + ('3 days, 11:15', '0.94, 0.62, 0.50'),
+                self.data_long[1] + ('', ''),
+            ),
+            tuple(data),
+        )
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=False)
+    def test_hypervisor_list_uptime_not_implemented(self, sm_mock):
+        self.sdk_client.get_hypervisor_uptime.side_effect = (
+            sdk_exceptions.HttpException('not implemented', http_status=501)
+        )
+        arglist = [
+            '--uptime',
+        ]
+        verifylist = [
+            ('uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            tuple(row + ('', '') for row in self.data), tuple(data)
+        )
+
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=False)
+    def test_hypervisor_list_uptime_error(self, sm_mock):
+        self.sdk_client.get_hypervisor_uptime.side_effect = (
+            sdk_exceptions.HttpException('forbidden', http_status=403)
+        )
+        arglist = [
+            '--uptime',
+        ]
+        verifylist = [
+            ('uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            sdk_exceptions.HttpException, self.cmd.take_action, parsed_args
+        )
+
 
 class TestHypervisorShow(TestHypervisor):
     def setUp(self):
@@ -571,6 +571,47 @@ class TestKeypairList(TestKeypair):
             tuple(data),
         )
 
+    @mock.patch.object(sdk_utils, 'supports_microversion', return_value=True)
+    def test_keypair_list_with_project_several_users(self, sm_mock):
+        projects_mock = self.app.client_manager.identity.tenants
+        projects_mock.reset_mock()
+        projects_mock.get.return_value = fakes.FakeResource(
+            None,
+            copy.deepcopy(identity_fakes.PROJECT),
+            loaded=True,
+        )
+
+        users = [
+            fakes.FakeResource(None, {'id': 'user-%d' % i}, loaded=True)
+            for i in range(3)
+        ]
+        self.app.client_manager.identity.users.list.return_value = users
+        keypairs = {
+            user.id: compute_fakes.create_keypairs(count=2) for user in users
+        }
+        self.sdk_client.keypairs.side_effect = lambda user_id: iter(
+            keypairs[user_id]
+        )
+
+        arglist = ['--project', identity_fakes.project_name]
+        verifylist = [('project', identity_fakes.project_name)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.keypairs.assert_has_calls(
+            [mock.call(user_id=user.id) for user in users]
+        )
+        # The keypairs are returned user by user
+        self.assertEqual(
+            tuple(
+                (keypair.name, keypair.fingerprint, keypair.type)
+                for user in users
+                for keypair in keypairs[user.id]
+            ),
+            tuple(data),
+        )
+
     @mock.patch.object(sdk_utils, 'supports_microversion', return_value=False)
     def test_keypair_list_with_project_pre_v210(self, sm_mock):
         arglist = ['--project', identity_fakes.project_name]
@@ -29,6 +29,7 @@ from osc_lib.cli import format_columns
 from osc_lib import exceptions
 from osc_lib import utils as common_utils
 
+from openstackclient.common import wait
 from openstackclient.compute.v2 import server
 from openstackclient.tests.unit.compute.v2 import fakes as compute_fakes
 from openstackclient.tests.unit.image.v2 import fakes as image_fakes
@@ -4568,7 +4569,7 @@ class TestServerDelete(TestServer):
             all_tenants=True,
         )
 
-    @mock.patch.object(common_utils, 'wait_for_delete', return_value=True)
+    @mock.patch.object(wait, 'wait_for_delete', return_value=[])
     def test_server_delete_wait_ok(self, mock_wait_for_delete):
         servers = self.setup_servers_mock(count=1)
 
@@ -4582,15 +4583,17 @@ class TestServerDelete(TestServer):
 
         self.servers_mock.delete.assert_called_with(servers[0].id)
         mock_wait_for_delete.assert_called_once_with(
-            self.servers_mock,
-            servers[0].id,
+            self.servers_mock.get,
+            [servers[0].id],
+            list_resources=mock.ANY,
             callback=mock.ANY,
         )
         self.assertIsNone(result)
 
-    @mock.patch.object(common_utils, 'wait_for_delete', return_value=False)
+    @mock.patch.object(wait, 'wait_for_delete')
     def test_server_delete_wait_fails(self, mock_wait_for_delete):
         servers = self.setup_servers_mock(count=1)
+        mock_wait_for_delete.return_value = [servers[0].id]
 
         arglist = [servers[0].id, '--wait']
         verifylist = [
@@ -4602,11 +4605,46 @@ class TestServerDelete(TestServer):
 
         self.servers_mock.delete.assert_called_with(servers[0].id)
         mock_wait_for_delete.assert_called_once_with(
-            self.servers_mock,
-            servers[0].id,
+            self.servers_mock.get,
+            [servers[0].id],
+            list_resources=mock.ANY,
+            callback=mock.ANY,
+        )
+
+    @mock.patch.object(wait, 'wait_for_delete', return_value=[])
+    def test_server_delete_multi_servers_wait(self, mock_wait_for_delete):
+        servers = self.setup_servers_mock(count=3)
+
+        arglist = [s.id for s in servers] + ['--wait']
+        verifylist = [
+            ('server', [s.id for s in servers]),
+            ('wait', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        # All the servers are deleted before waiting for them at once
+        self.servers_mock.delete.assert_has_calls(
+            [call(s.id) for s in servers]
+        )
+        mock_wait_for_delete.assert_called_once_with(
+            self.servers_mock.get,
+            [s.id for s in servers],
+            list_resources=mock.ANY,
             callback=mock.ANY,
         )
 
+        list_servers = mock_wait_for_delete.call_args[1]['list_resources']
+        # The deleted servers are looked up individually
+        for s, status in zip(servers, ('ACTIVE', 'DELETED', 'DELETED')):
+            s.status = status
+        self.servers_mock.list.return_value = servers
+        self.assertEqual(servers[:1], list_servers([s.id for s in servers]))
+        self.servers_mock.list.assert_called_once_with(
+            search_opts={'all_tenants': False, 'changes-since': mock.ANY},
+        )
+
 
 class TestServerDumpCreate(TestServer):
     def setUp(self):
@@ -4958,6 +4996,50 @@ class TestServerList(_TestServerList):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, tuple(data))
 
+    @mock.patch.object(server.lookup, 'MAX_FILTER_LENGTH', 1)
+    def test_server_list_name_lookup_chunked(self):
+        arglist = []
+        verifylist = [
+            ('no_name_lookup', False),
+            ('name_lookup_one_by_one', False),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # One request per image ID since they do not fit together in a
+        # filter
+        image_ids = {s.image['id'] for s in self.servers if s.image}
+        self.image_client.images.assert_has_calls(
+            [mock.call(id=f'in:{image_id}') for image_id in image_ids],
+            any_order=True,
+        )
+        self.assertEqual(len(image_ids), self.image_client.images.call_count)
+        self.sdk_client.flavors.assert_called_once_with(is_public=None)
+        self.image_client.get_image.assert_not_called()
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data, tuple(data))
+
+    @mock.patch.object(server.streaming, 'PAGE_SIZE', 2)
+    def test_server_list_stream(self):
+        arglist = ['--stream']
+        verifylist = [
+            ('stream', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # Nothing is looked up before the rows are consumed
+        self.image_client.images.assert_not_called()
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data, tuple(data))
+        self.sdk_client.servers.assert_called_with(**self.kwargs)
+        # The names found for the first page are reused for the second one
+        self.assertEqual(1, self.image_client.images.call_count)
+        self.assertEqual(1, self.sdk_client.flavors.call_count)
+
     def test_server_list_with_image(self):
         arglist = ['--image', self.image.id]
         verifylist = [('image', self.image.id)]
@@ -8183,7 +8265,7 @@ class TestServerShelve(TestServer):
         self.sdk_client.shelve_server.assert_not_called()
         self.sdk_client.shelve_offload_server.assert_not_called()
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
+    @mock.patch.object(wait, 'wait_for_status', return_value=[])
     def test_shelve_with_wait(self, mock_wait_for_status):
         arglist = ['--wait', self.server.name]
         verifylist = [
@@ -8204,12 +8286,13 @@ class TestServerShelve(TestServer):
         self.sdk_client.shelve_offload_server.assert_not_called()
         mock_wait_for_status.assert_called_once_with(
             self.sdk_client.get_server,
-            self.server.id,
+            [self.server.id],
+            list_resources=mock.ANY,
             callback=mock.ANY,
             success_status=('shelved', 'shelved_offloaded'),
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
+    @mock.patch.object(wait, 'wait_for_status', return_value=[])
     def test_shelve_offload(self, mock_wait_for_status):
         arglist = ['--offload', self.server.name]
         verifylist = [
@@ -8222,25 +8305,60 @@ class TestServerShelve(TestServer):
         result = self.cmd.take_action(parsed_args)
         self.assertIsNone(result)
 
-        # two calls - one to retrieve the server state before shelving and
-        # another to do this before offloading
-        self.sdk_client.find_server.assert_has_calls(
-            [
-                mock.call(self.server.name, ignore_missing=False),
-                mock.call(self.server.name, ignore_missing=False),
-            ]
+        # the server state is retrieved before shelving and again before
+        # offloading
+        self.sdk_client.find_server.assert_called_once_with(
+            self.server.name, ignore_missing=False
         )
+        self.sdk_client.get_server.assert_called_once_with(self.server.id)
         self.sdk_client.shelve_server.assert_called_with(self.server.id)
         self.sdk_client.shelve_offload_server.assert_called_once_with(
             self.server.id,
         )
         mock_wait_for_status.assert_called_once_with(
             self.sdk_client.get_server,
-            self.server.id,
+            [self.server.id],
+            list_resources=mock.ANY,
             callback=mock.ANY,
             success_status=('shelved', 'shelved_offloaded'),
         )
 
+    def test_shelve_with_wait_list_servers(self):
+        arglist = ['--wait', self.server.name]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        deleted_server = compute_fakes.create_one_sdk_server(
+            attrs={'status': 'DELETED'},
+        )
+        self.sdk_client.get_project_id.return_value = self.server.project_id
+        self.sdk_client.servers.return_value = [self.server, deleted_server]
+
+        with mock.patch.object(
+            wait, 'wait_for_status', return_value=[]
+        ) as mock_wait_for_status:
+            self.cmd.take_action(parsed_args)
+
+        list_servers = mock_wait_for_status.call_args[1]['list_resources']
+        self.assertEqual([self.server], list_servers([self.server.id]))
+        self.sdk_client.servers.assert_called_once_with(
+            changes_since=mock.ANY, all_projects=False
+        )
+
+    def test_shelve_with_wait_list_servers_all_projects(self):
+        arglist = ['--wait', self.server.name]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.sdk_client.get_project_id.return_value = 'other-project'
+        self.sdk_client.servers.return_value = []
+
+        with mock.patch.object(
+            wait, 'wait_for_status', return_value=[]
+        ) as mock_wait_for_status:
+            self.cmd.take_action(parsed_args)
+
+        mock_wait_for_status.call_args[1]['list_resources']([self.server.id])
+        self.sdk_client.servers.assert_called_once_with(
+            changes_since=mock.ANY, all_projects=True
+        )
+
 
 class TestServerShow(TestServer):
     def setUp(self):
@@ -8981,7 +9099,7 @@ class TestServerUnshelve(TestServer):
             str(ex),
         )
 
-    @mock.patch.object(common_utils, 'wait_for_status', return_value=True)
+    @mock.patch.object(wait, 'wait_for_status', return_value=[])
     def test_unshelve_with_wait(self, mock_wait_for_status):
         arglist = [
             '--wait',
@@ -9003,7 +9121,8 @@ class TestServerUnshelve(TestServer):
         self.sdk_client.unshelve_server.assert_called_with(self.server.id)
         mock_wait_for_status.assert_called_once_with(
             self.sdk_client.get_server,
-            self.server.id,
+            [self.server.id],
+            list_resources=mock.ANY,
             callback=mock.ANY,
             success_status=('active', 'shutoff'),
         )
@@ -110,7 +110,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('long', False),
         ]
 
@@ -132,7 +132,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('long', True),
         ]
 
@@ -157,7 +157,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_since', '2016-03-04T06:27:59Z'),
         ]
 
@@ -189,7 +189,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_since', 'Invalid time value'),
         ]
 
@@ -212,7 +212,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_since', '2016-03-04T06:27:59Z'),
         ]
 
@@ -237,7 +237,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_before', '2016-03-04T06:27:59Z'),
         ]
 
@@ -269,7 +269,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_before', 'Invalid time value'),
         ]
 
@@ -290,7 +290,7 @@ class TestListServerEvent(TestServerEvent):
             self.fake_server.name,
         ]
         verifylist = [
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
             ('changes_before', '2016-03-04T06:27:59Z'),
         ]
 
@@ -314,7 +314,7 @@ class TestListServerEvent(TestServerEvent):
         ]
         verifylist = [
             ('limit', 1),
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
         ]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -336,7 +336,7 @@ class TestListServerEvent(TestServerEvent):
         ]
         verifylist = [
             ('limit', 1),
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
         ]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -361,7 +361,7 @@ class TestListServerEvent(TestServerEvent):
         ]
         verifylist = [
             ('marker', 'test_event'),
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
         ]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -382,7 +382,7 @@ class TestListServerEvent(TestServerEvent):
         ]
         verifylist = [
             ('marker', 'test_event'),
-            ('server', self.fake_server.name),
+            ('server', [self.fake_server.name]),
         ]
 
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -394,6 +394,157 @@ class TestListServerEvent(TestServerEvent):
             '--os-compute-api-version 2.58 or greater is required', str(ex)
         )
 
+    def _set_server_actions(self):
+        servers = [compute_fakes.create_one_server() for _ in range(2)]
+        self.sdk_client.find_server.side_effect = lambda name, **kwargs: next(
+            server for server in servers if server.name == name
+        )
+        actions = {
+            servers[0].id: [
+                compute_fakes.create_one_server_action(
+                    {
+                        'server_id': servers[0].id,
+                        'start_time': '2017-02-27T09:00:00.000000',
+                    }
+                ),
+                compute_fakes.create_one_server_action(
+                    {
+                        'server_id': servers[0].id,
+                        'start_time': '2017-02-27T07:00:00.000000',
+                    }
+                ),
+            ],
+            servers[1].id: [
+                compute_fakes.create_one_server_action(
+                    {
+                        'server_id': servers[1].id,
+                        'start_time': '2017-02-27T08:00:00.000000',
+                    }
+                ),
+            ],
+        }
+        self.sdk_client.server_actions.side_effect = (
+            lambda server_id, **kwargs: iter(actions[server_id])
+        )
+        return servers, [
+            actions[servers[0].id][0],
+            actions[servers[1].id][0],
+            actions[servers[0].id][1],
+        ]
+
+    def test_server_event_list_multiple_servers(self):
+        servers, actions = self._set_server_actions()
+
+        arglist = [server.name for server in servers]
+        verifylist = [
+            ('server', [server.name for server in servers]),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.server_actions.assert_has_calls(
+            [mock.call(server.id) for server in servers], any_order=True
+        )
+
+        # The events are merged, most recent first
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(
+            tuple(
+                (a.request_id, a.server_id, a.action, a.start_time)
+                for a in actions
+            ),
+            tuple(data),
+        )
+
+    def test_server_event_list_multiple_servers_with_limit(self):
+        self._set_mock_microversion('2.58')
+        servers, actions = self._set_server_actions()
+
+        arglist = ['--limit', '2'] + [server.name for server in servers]
+        verifylist = [
+            ('limit', 2),
+            ('server', [server.name for server in servers]),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            [a.request_id for a in actions[:2]],
+            [row[0] for row in data],
+        )
+
+    def test_server_event_list_multiple_servers_with_marker(self):
+        self._set_mock_microversion('2.58')
+        servers, actions = self._set_server_actions()
+
+        arglist = ['--marker', 'test_event'] + [s.name for s in servers]
+        verifylist = [
+            ('marker', 'test_event'),
+            ('server', [server.name for server in servers]),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+    def test_server_event_list_host(self):
+        servers, actions = self._set_server_actions()
+        self.sdk_client.servers.return_value = servers
+
+        arglist = ['--host', 'host1']
+        verifylist = [
+            ('host', 'host1'),
+            ('server', []),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.servers.assert_called_once_with(
+            host='host1', all_projects=True
+        )
+        self.sdk_client.find_server.assert_not_called()
+        self.assertEqual(
+            [a.request_id for a in actions],
+            [row[0] for row in data],
+        )
+
+    def test_server_event_list_no_server(self):
+        parsed_args = self.check_parser(self.cmd, [], [('server', [])])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+    def test_server_event_list_details(self):
+        self.sdk_client.get_server_action.return_value = self.fake_event
+
+        arglist = [
+            '--details',
+            self.fake_server.name,
+        ]
+        verifylist = [
+            ('server', [self.fake_server.name]),
+            ('details', True),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+        data = tuple(data)
+
+        self.sdk_client.get_server_action.assert_called_once_with(
+            self.fake_event.request_id,
+            self.fake_event.server_id,
+        )
+        self.assertEqual(self.columns + ('Events',), columns)
+        self.assertEqual(self.data[0], data[0][:-1])
+        self.assertIsInstance(
+            data[0][-1], server_event.ServerActionEventColumn
+        )
+
 
 class TestShowServerEvent(TestServerEvent):
     fake_event = compute_fakes.create_one_server_action()
@@ -60,7 +60,7 @@ class TestUsageList(TestUsage):
 
         self.sdk_client.usages.return_value = self.usages
 
-        self.projects_mock.list.return_value = [self.project]
+        self.projects_mock.get.return_value = self.project
         # Get the command object to test
         self.cmd = usage_cmds.ListUsage(self.app, None)
 
@@ -75,10 +75,18 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.list.assert_not_called()
 
         self.assertCountEqual(self.columns, columns)
-        self.assertCountEqual(tuple(self.data), tuple(data))
+        data = tuple(data)
+        self.assertCountEqual(tuple(self.data), data)
+
+        # The projects are fetched when their names are displayed
+        self.projects_mock.get.assert_not_called()
+        self.assertEqual(self.project.name, data[0][0].human_readable())
+        self.projects_mock.get.assert_called_once_with(
+            self.usages[0].project_id
+        )
 
     def test_usage_list_with_options(self):
         arglist = [
@@ -96,7 +104,7 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.list.assert_not_called()
         self.sdk_client.usages.assert_called_with(
             start='2016-11-11T00:00:00',
             end='2016-12-20T00:00:00',
@@ -117,7 +125,7 @@ class TestUsageList(TestUsage):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.projects_mock.list.assert_called_with()
+        self.projects_mock.list.assert_not_called()
         self.sdk_client.usages.assert_has_calls(
             [mock.call(start=mock.ANY, end=mock.ANY, detailed=True)]
         )
@@ -19,6 +19,10 @@ from unittest import mock
 from keystoneauth1 import fixture
 import requests
 
+from openstackclient.common import image_cache
+from openstackclient.common import project_cache
+from openstackclient.common import resolution_cache
+
 
 AUTH_TOKEN = "foobar"
 AUTH_URL = "http://0.0.0.0"
@@ -144,6 +148,29 @@ class FakeClientManager(object):
 
         return config
 
+    def get_project_lookup(self):
+        return project_cache.ProjectLookup(
+            lambda project_id: self.identity.projects.get(project_id)
+        )
+
+    def get_image_index(self):
+        return image_cache.ImagePropertyIndex(
+            lambda **query: self.image.images(**query),
+            lambda image_id: self.image.find_image(
+                image_id, ignore_missing=True
+            ),
+        )
+
+    def find_resource_id(self, proxy, resource, name_or_id, **attrs):
+        return resolution_cache.find_sdk_resource_id(
+            None, proxy, resource, name_or_id, **attrs
+        )
+
+    def find_resource(self, proxy, resource, name_or_id, **attrs):
+        return resolution_cache.find_sdk_resource(
+            None, proxy, resource, name_or_id, **attrs
+        )
+
     def is_network_endpoint_enabled(self):
         return self.network_endpoint_enabled
 
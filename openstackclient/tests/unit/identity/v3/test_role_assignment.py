@@ -14,6 +14,8 @@
 import copy
 from unittest import mock
 
+from keystoneclient import exceptions as identity_exc
+
 from openstackclient.identity.v3 import role_assignment
 from openstackclient.tests.unit import fakes
 from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
@@ -619,17 +621,30 @@ class TestRoleAssignmentList(TestRoleAssignment):
         )
         self.assertEqual(datalist, tuple(data))
 
+    def _set_names(self):
+        for manager, info in (
+            (self.roles_mock, identity_fakes.ROLE),
+            (self.users_mock, identity_fakes.USER),
+            (self.groups_mock, identity_fakes.GROUP),
+            (self.projects_mock, identity_fakes.PROJECT),
+            (self.domains_mock, identity_fakes.DOMAIN),
+        ):
+            manager.list.return_value = [
+                fakes.FakeResource(None, copy.deepcopy(info), loaded=True)
+            ]
+
     def test_role_assignment_list_include_names(self):
         fake_role_assignment_a = copy.deepcopy(
-            identity_fakes.ASSIGNMENT_WITH_PROJECT_ID_AND_USER_ID_INCLUDE_NAMES
+            identity_fakes.ASSIGNMENT_WITH_PROJECT_ID_AND_USER_ID
         )
         fake_role_assignment_b = copy.deepcopy(
-            identity_fakes.ASSIGNMENT_WITH_DOMAIN_ID_AND_USER_ID_INCLUDE_NAMES
+            identity_fakes.ASSIGNMENT_WITH_DOMAIN_ID_AND_USER_ID
         )
         self.role_assignments_mock.list.return_value = [
             fakes.FakeResource(None, fake_role_assignment_a, loaded=True),
             fakes.FakeResource(None, fake_role_assignment_b, loaded=True),
         ]
+        self._set_names()
 
         arglist = ['--names']
         verifylist = [
@@ -646,12 +661,10 @@ class TestRoleAssignmentList(TestRoleAssignment):
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
         # DisplayCommandBase.take_action() returns two tuples
-
-        # This test will not run correctly until the patch in the python
-        # client is merged. Once that is done 'data' should return the
-        # correct information
         columns, data = self.cmd.take_action(parsed_args)
 
+        # keystone does not join the names to the assignments, they are
+        # listed once instead
         self.role_assignments_mock.list.assert_called_with(
             domain=None,
             system=None,
@@ -661,7 +674,7 @@ class TestRoleAssignmentList(TestRoleAssignment):
             role=None,
             user=None,
             os_inherit_extension_inherited_to=None,
-            include_names=True,
+            include_names=False,
         )
 
         collist = (
@@ -703,6 +716,61 @@ class TestRoleAssignmentList(TestRoleAssignment):
         )
         self.assertEqual(tuple(data), datalist1)
 
+        for manager in (
+            self.roles_mock,
+            self.users_mock,
+            self.projects_mock,
+            self.domains_mock,
+        ):
+            manager.list.assert_called_once_with()
+            manager.get.assert_not_called()
+        self.groups_mock.list.assert_not_called()
+
+    def test_role_assignment_list_include_names_missing(self):
+        fake_role_assignment = copy.deepcopy(
+            identity_fakes.ASSIGNMENT_WITH_PROJECT_ID_AND_USER_ID
+        )
+        self.role_assignments_mock.list.return_value = [
+            fakes.FakeResource(None, fake_role_assignment, loaded=True),
+        ]
+        self._set_names()
+        # The caller can neither list nor get the users
+        self.users_mock.list.side_effect = identity_exc.Forbidden()
+        self.users_mock.get.side_effect = identity_exc.Forbidden()
+        # The project is not in the listing, and its domain is unknown
+        self.projects_mock.list.return_value = []
+        project = copy.deepcopy(identity_fakes.PROJECT)
+        project['domain_id'] = 'unknown'
+        self.projects_mock.get.return_value = fakes.FakeResource(
+            None, project, loaded=True
+        )
+        self.domains_mock.get.side_effect = identity_exc.NotFound()
+
+        arglist = ['--names']
+        verifylist = [
+            ('names', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        datalist = (
+            (
+                identity_fakes.role_name,
+                identity_fakes.user_id,
+                '',
+                identity_fakes.project_name,
+                '',
+                '',
+                False,
+            ),
+        )
+        self.assertEqual(datalist, tuple(data))
+        self.projects_mock.get.assert_called_once_with(
+            identity_fakes.project_id
+        )
+        self.domains_mock.get.assert_called_once_with('unknown')
+
     def test_role_assignment_list_domain_role(self):
         self.role_assignments_mock.list.return_value = [
             fakes.FakeResource(
@@ -13,11 +13,15 @@
 #   under the License.
 
 import copy
+import hashlib
 import io
+import json
+import os
 import tempfile
 from unittest import mock
 
 from cinderclient import api_versions
+import fixtures
 from openstack import exceptions as sdk_exceptions
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
@@ -54,6 +58,7 @@ class TestImageCreate(TestImage):
 
         self.new_image = image_fakes.create_one_image()
         self.image_client.create_image.return_value = self.new_image
+        self.image_client.get_image.return_value = self.new_image
         self.image_client.update_image.return_value = self.new_image
 
         self.project_mock.get.return_value = self.project
@@ -241,12 +246,59 @@ class TestImageCreate(TestImage):
             Alpha='1',
             Beta='2',
             tags=self.new_image.tags,
-            filename=imagefile.name,
+            data=mock.ANY,
+            validate_checksum=False,
         )
+        self.image_client.get_image.assert_called_once_with(self.new_image.id)
 
         self.assertEqual(self.expected_columns, columns)
         self.assertCountEqual(self.expected_data, data)
 
+    def _create_image_checksum(self, checksum):
+        imagefile = tempfile.NamedTemporaryFile(delete=False)
+        imagefile.write(b'some fake data')
+        imagefile.close()
+
+        def create_image(**kwargs):
+            # The data is read once, while it is uploaded
+            self.assertEqual(b'some fake data', kwargs['data'].read())
+            self.assertEqual(b'', kwargs['data'].read())
+            return self.new_image
+
+        self.image_client.create_image.side_effect = create_image
+        self.image_client.get_image.return_value = (
+            image_fakes.create_one_image(
+                {'id': self.new_image.id, 'checksum': checksum}
+            )
+        )
+
+        arglist = [
+            '--file',
+            imagefile.name,
+            self.new_image.name,
+        ]
+        verifylist = [
+            ('filename', imagefile.name),
+            ('name', self.new_image.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        return self.cmd.take_action(parsed_args)
+
+    def test_image_create_file_checksum(self):
+        checksum = hashlib.md5(b'some fake data').hexdigest()
+
+        columns, data = self._create_image_checksum(checksum)
+
+        self.assertIn(checksum, data)
+
+    def test_image_create_file_checksum_mismatch(self):
+        self.assertRaises(
+            exceptions.CommandError,
+            self._create_image_checksum,
+            hashlib.md5(b'other data').hexdigest(),
+        )
+
     @mock.patch('openstackclient.image.v2.image.get_data_from_stdin')
     def test_image_create__progress_ignore_with_stdin(
         self,
@@ -272,7 +324,7 @@ class TestImageCreate(TestImage):
             allow_duplicates=True,
             container_format=_image.DEFAULT_CONTAINER_FORMAT,
             disk_format=_image.DEFAULT_DISK_FORMAT,
-            data=fake_stdin,
+            data=mock.ANY,
             validate_checksum=False,
         )
 
@@ -1825,8 +1877,11 @@ class TestImageStage(TestImage):
 
         self.image_client.stage_image.assert_called_once_with(
             self.image,
-            filename=imagefile.name,
+            data=mock.ANY,
         )
+        fp = self.image_client.stage_image.call_args.kwargs['data']
+        self.assertEqual(imagefile.name, fp.name)
+        self.assertTrue(fp.closed)
 
     @mock.patch('openstackclient.image.v2.image.get_data_from_stdin')
     def test_stage_image__from_stdin(self, mock_get_data_from_stdin):
@@ -2092,6 +2147,126 @@ class TestImageSave(TestImage):
         )
 
 
+@mock.patch.object(_image, 'DOWNLOAD_RANGE_SIZE', 4)
+class TestImageSaveParallel(TestImage):
+    data = b'some fake image data'
+    image = image_fakes.create_one_image(
+        {
+            'size': len(data),
+            'checksum': hashlib.md5(data).hexdigest(),
+            'hash_algo': 'sha512',
+            'hash_value': hashlib.sha512(data).hexdigest(),
+        }
+    )
+
+    def setUp(self):
+        super().setUp()
+
+        self.filename = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'image'
+        )
+        self.image_client.find_image.return_value = self.image
+        self.image_client.get.side_effect = self._get
+
+        self.cmd = _image.SaveImage(self.app, None)
+
+    def _get(self, url, headers, stream):
+        self.assertEqual('/images/%s/file' % self.image.id, url)
+        start, end = headers['Range'][len('bytes=') :].split('-')
+        response = mock.Mock(status_code=206)
+        response.iter_content.return_value = [
+            self.data[int(start) : int(end) + 1]
+        ]
+        return response
+
+    def _save(self, *args):
+        arglist = ['--file', self.filename] + list(args) + [self.image.id]
+        verifylist = [
+            ('filename', self.filename),
+            ('image', self.image.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        return self.cmd.take_action(parsed_args)
+
+    def _ranges(self):
+        return [
+            call.kwargs['headers']['Range']
+            for call in self.image_client.get.call_args_list
+        ]
+
+    def test_save_parallel(self):
+        self._save('--parallel', '3')
+
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+        self.assertCountEqual(
+            [
+                'bytes=0-3',
+                'bytes=4-7',
+                'bytes=8-11',
+                'bytes=12-15',
+                'bytes=16-19',
+            ],
+            self._ranges(),
+        )
+        self.assertFalse(os.path.exists(self.filename + '.ranges'))
+        self.image_client.download_image.assert_not_called()
+
+    def test_save_parallel_resume(self):
+        with open(self.filename, 'wb') as f:
+            f.write(self.data[:8] + b'\0' * 4 + self.data[12:16])
+        with open(self.filename + '.ranges', 'w') as f:
+            json.dump(
+                {
+                    'image': self.image.id,
+                    'size': self.image.size,
+                    'checksum': self.image.checksum,
+                    'range_size': 4,
+                    'ranges': [0, 4, 12],
+                },
+                f,
+            )
+
+        self._save('--parallel', '3')
+
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+        self.assertCountEqual(['bytes=8-11', 'bytes=16-19'], self._ranges())
+
+    def test_save_parallel_checksum_mismatch(self):
+        self.image_client.get.side_effect = None
+        response = mock.Mock(status_code=206)
+        response.iter_content.return_value = [b'abcd']
+        self.image_client.get.return_value = response
+
+        self.assertRaises(
+            exceptions.CommandError, self._save, '--parallel', '3'
+        )
+        self.assertFalse(os.path.exists(self.filename + '.ranges'))
+
+    def test_save_parallel_ranges_not_supported(self):
+        self.image_client.get.side_effect = None
+        self.image_client.get.return_value = mock.Mock(status_code=200)
+
+        self._save('--parallel', '3')
+
+        self.image_client.download_image.assert_called_once_with(
+            self.image.id, stream=True, output=self.filename
+        )
+
+    def test_save_parallel_without_file(self):
+        arglist = ['--parallel', '3', self.image.id]
+        verifylist = [
+            ('parallel', 3),
+            ('image', self.image.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+
 class TestImageGetData(TestImage):
     def test_get_data_from_stdin(self):
         fd = io.BytesIO(b"some initial binary data: \x00\x01")
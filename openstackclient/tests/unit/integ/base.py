@@ -10,6 +10,7 @@
 #   License for the specific language governing permissions and limitations
 #   under the License.
 
+import fixtures
 from keystoneauth1 import fixture as ksa_fixture
 from requests_mock.contrib import fixture
 
@@ -121,4 +122,12 @@ class TestInteg(utils.TestCase):
     def setUp(self):
         super(TestInteg, self).setUp()
 
+        # Do not share the on-disk caches with the user or between tests,
+        # the tests replace the whole environment so XDG_CACHE_HOME is lost
+        self.useFixture(
+            fixtures.MockPatch(
+                'openstackclient.common.cache.get_cache_dir',
+                return_value=self.useFixture(fixtures.TempDir()).path,
+            )
+        )
         self.requests_mock = self.useFixture(fixture.Fixture())
@@ -99,6 +99,22 @@ class FakeNetworkAndComputeShowOne(common.NetworkAndComputeShowOne):
         return client.compute_action(parsed_args)
 
 
+class FakeNetworkAndComputeDelete(common.NetworkAndComputeDelete):
+    # Used by base class to find resources in parsed_args.
+    resource = 'network'
+    r = None
+
+    def update_parser_common(self, parser):
+        parser.add_argument('network', metavar='<network>', nargs='+')
+        return parser
+
+    def take_action_network(self, client, parsed_args):
+        client.network_action(self.r)
+
+    def take_action_compute(self, client, parsed_args):
+        client.compute_action(self.r)
+
+
 class FakeCreateNeutronCommandWithExtraArgs(
     common.NeutronCommandWithExtraArgs
 ):
@@ -203,6 +219,38 @@ class TestNetworkAndComputeShowOne(TestNetworkAndCompute):
             )
 
 
+class TestNetworkAndComputeDelete(TestNetworkAndCompute):
+    def setUp(self):
+        super(TestNetworkAndComputeDelete, self).setUp()
+        self.cmd = FakeNetworkAndComputeDelete(self.app, self.namespace)
+
+    def test_take_action_network(self):
+        arglist = ['n1', 'n2', 'n3', '--parallel', '3']
+        verifylist = [('network', ['n1', 'n2', 'n3']), ('parallel', 3)]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        # Each concurrent deletion sees its own resource
+        self.network_client.network_action.assert_has_calls(
+            [mock.call('n1'), mock.call('n2'), mock.call('n3')],
+            any_order=True,
+        )
+        self.assertEqual(3, self.network_client.network_action.call_count)
+
+    def test_take_action_compute(self):
+        arglist = ['n1', 'n2']
+        verifylist = [('network', ['n1', 'n2'])]
+
+        self.app.client_manager.network_endpoint_enabled = False
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.compute.compute_action.assert_has_calls(
+            [mock.call('n1'), mock.call('n2')]
+        )
+
+
 class TestNeutronCommandWithExtraArgs(utils.TestCommand):
     def setUp(self):
         super(TestNeutronCommandWithExtraArgs, self).setUp()
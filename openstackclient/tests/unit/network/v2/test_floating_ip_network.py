@@ -22,6 +22,24 @@ from openstackclient.tests.unit.network.v2 import fakes as network_fakes
 from openstackclient.tests.unit import utils as tests_utils
 
 
+LIST_FIELDS_TO_RETRIEVE = (
+    'id',
+    'floating_ip_address',
+    'fixed_ip_address',
+    'port_id',
+    'floating_network_id',
+    'project_id',
+)
+LIST_FIELDS_TO_RETRIEVE_LONG = LIST_FIELDS_TO_RETRIEVE + (
+    'router_id',
+    'status',
+    'description',
+    'tags',
+    'dns_name',
+    'dns_domain',
+)
+
+
 class TestFloatingIPNetwork(network_fakes.TestNetworkV2):
     def setUp(self):
         super(TestFloatingIPNetwork, self).setUp()
@@ -488,7 +506,9 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.ips.assert_called_once_with()
+        self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, list(data))
 
@@ -505,6 +525,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'floating_network_id': 'fake_network_id',
             }
@@ -525,6 +546,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'port_id': 'fake_port_id',
             }
@@ -545,6 +567,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'fixed_ip_address': self.floating_ips[0].fixed_ip_address,
             }
@@ -565,6 +588,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'floating_ip_address': self.floating_ips[
                     0
@@ -586,7 +610,9 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.ips.assert_called_once_with()
+        self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG
+        )
         self.assertEqual(self.columns_long, columns)
         self.assertEqual(self.data_long, list(data))
 
@@ -604,6 +630,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG,
             **{
                 'status': 'ACTIVE',
             }
@@ -626,7 +653,9 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.ips.assert_called_once_with(**filters)
+        self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
 
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, list(data))
@@ -648,7 +677,9 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.ips.assert_called_once_with(**filters)
+        self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, list(data))
 
@@ -666,6 +697,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG,
             **{
                 'router_id': 'fake_router_id',
             }
@@ -694,6 +726,7 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.ips.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'tags': 'red,blue',
                 'any_tags': 'red,green',
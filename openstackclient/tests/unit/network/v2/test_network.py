@@ -38,6 +38,22 @@ class TestNetwork(network_fakes.TestNetworkV2):
         self.domains_mock = self.app.client_manager.identity.domains
 
 
+LIST_FIELDS_TO_RETRIEVE = ('id', 'name', 'subnets')
+LIST_FIELDS_TO_RETRIEVE_LONG = (
+    'id',
+    'name',
+    'status',
+    'project_id',
+    'admin_state_up',
+    'shared',
+    'subnets',
+    'provider:network_type',
+    'router:external',
+    'availability_zones',
+    'tags',
+)
+
+
 class TestCreateNetworkIdentityV3(TestNetwork):
     project = identity_fakes_v3.FakeProject.create_one_project()
     domain = identity_fakes_v3.FakeDomain.create_one_domain()
@@ -505,6 +521,23 @@ class TestDeleteNetwork(TestNetwork):
         self.network_client.delete_network.assert_has_calls(calls)
         self.assertIsNone(result)
 
+    def test_delete_multiple_networks_parallel(self):
+        arglist = [n.id for n in self._networks] + ['--parallel', '3']
+        verifylist = [
+            ('network', [n.id for n in self._networks]),
+            ('parallel', 3),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        # Each thread looks up its own network
+        self.network_client.delete_network.assert_has_calls(
+            [call(n) for n in self._networks], any_order=True
+        )
+        self.assertEqual(3, self.network_client.delete_network.call_count)
+        self.assertIsNone(result)
+
     def test_delete_multiple_networks_exception(self):
         arglist = [
             self._networks[0].id,
@@ -626,7 +659,9 @@ class TestListNetwork(TestNetwork):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.networks.assert_called_once_with()
+        self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -646,6 +681,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'router:external': True, 'is_router_external': True}
         )
         self.assertEqual(self.columns, columns)
@@ -663,6 +699,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'router:external': False, 'is_router_external': False}
         )
         self.assertEqual(self.columns, columns)
@@ -683,10 +720,52 @@ class TestListNetwork(TestNetwork):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.networks.assert_called_once_with()
+        self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG
+        )
         self.assertEqual(self.columns_long, columns)
         self.assertCountEqual(self.data_long, list(data))
 
+    def test_network_list_selected_columns(self):
+        arglist = [
+            '--long',
+            '-c',
+            'Name',
+            '-c',
+            'Network Type',
+        ]
+        verifylist = [
+            ('long', True),
+            ('columns', ['Name', 'Network Type']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.network_client.networks.assert_called_once_with(
+            fields=('name', 'provider:network_type')
+        )
+
+    def test_network_list_selected_columns_sorted(self):
+        arglist = [
+            '-c',
+            'ID',
+            '--sort-column',
+            'Name',
+        ]
+        verifylist = [
+            ('columns', ['ID']),
+            ('sort_columns', ['Name']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        # The sorted column is needed too
+        self.network_client.networks.assert_called_once_with(
+            fields=('id', 'name')
+        )
+
     def test_list_name(self):
         test_name = "fakename"
         arglist = [
@@ -702,7 +781,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
-            **{'name': test_name}
+            fields=LIST_FIELDS_TO_RETRIEVE, **{'name': test_name}
         )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
@@ -720,6 +799,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'admin_state_up': True, 'is_admin_state_up': True}
         )
         self.assertEqual(self.columns, columns)
@@ -734,6 +814,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'admin_state_up': False, 'is_admin_state_up': False}
         )
         self.assertEqual(self.columns, columns)
@@ -753,7 +834,7 @@ class TestListNetwork(TestNetwork):
 
         columns, data = self.cmd.take_action(parsed_args)
         self.network_client.networks.assert_called_once_with(
-            **{'project_id': project.id}
+            fields=LIST_FIELDS_TO_RETRIEVE, **{'project_id': project.id}
         )
 
         self.assertEqual(self.columns, columns)
@@ -776,7 +857,9 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.networks.assert_called_once_with(**filters)
+        self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -792,6 +875,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'shared': True, 'is_shared': True}
         )
         self.assertEqual(self.columns, columns)
@@ -809,6 +893,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'shared': False, 'is_shared': False}
         )
         self.assertEqual(self.columns, columns)
@@ -829,7 +914,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
-            **{'status': test_status}
+            fields=LIST_FIELDS_TO_RETRIEVE, **{'status': test_status}
         )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
@@ -847,6 +932,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'provider:network_type': network_type,
                 'provider_network_type': network_type,
@@ -868,6 +954,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'provider:physical_network': physical_network,
                 'provider_physical_network': physical_network,
@@ -889,6 +976,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'provider:segmentation_id': segmentation_id,
                 'provider_segmentation_id': segmentation_id,
@@ -935,6 +1023,7 @@ class TestListNetwork(TestNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.networks.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'tags': 'red,blue',
                 'any_tags': 'red,green',
@@ -27,7 +27,7 @@ from openstackclient.tests.unit import utils as tests_utils
 
 
 LIST_FIELDS_TO_RETRIEVE = ('id', 'name', 'mac_address', 'fixed_ips', 'status')
-LIST_FIELDS_TO_RETRIEVE_LONG = ('security_group_ids', 'device_owner', 'tags')
+LIST_FIELDS_TO_RETRIEVE_LONG = ('security_groups', 'device_owner', 'tags')
 
 
 class TestPort(network_fakes.TestNetworkV2):
@@ -1120,6 +1120,21 @@ class TestDeletePort(TestPort):
         self.network_client.delete_port.assert_has_calls(calls)
         self.assertIsNone(result)
 
+    def test_multi_ports_delete_parallel(self):
+        arglist = [p.name for p in self._ports] + ['--parallel', '2']
+        verifylist = [
+            ('port', [p.name for p in self._ports]),
+            ('parallel', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.network_client.delete_port.assert_has_calls(
+            [call(p) for p in self._ports], any_order=True
+        )
+        self.assertIsNone(result)
+
     def test_multi_ports_delete_with_exception(self):
         arglist = [
             self._ports[0].name,
@@ -23,6 +23,23 @@ from openstackclient.tests.unit.network.v2 import fakes as network_fakes
 from openstackclient.tests.unit import utils as tests_utils
 
 
+LIST_FIELDS_TO_RETRIEVE = (
+    'id',
+    'name',
+    'status',
+    'admin_state_up',
+    'project_id',
+    'distributed',
+    'ha',
+)
+LIST_FIELDS_TO_RETRIEVE_LONG = LIST_FIELDS_TO_RETRIEVE + (
+    'routes',
+    'external_gateway_info',
+    'availability_zones',
+    'tags',
+)
+
+
 class TestRouter(network_fakes.TestNetworkV2):
     def setUp(self):
         super(TestRouter, self).setUp()
@@ -604,7 +621,9 @@ class TestListRouter(TestRouter):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.routers.assert_called_once_with()
+        self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -641,7 +660,9 @@ class TestListRouter(TestRouter):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.routers.assert_called_once_with()
+        self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG
+        )
         self.assertEqual(self.columns_long, columns)
         self.assertCountEqual(self.data_long, list(data))
 
@@ -662,7 +683,13 @@ class TestListRouter(TestRouter):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.routers.assert_called_once_with()
+        self.network_client.routers.assert_called_once_with(
+            fields=tuple(
+                f
+                for f in LIST_FIELDS_TO_RETRIEVE_LONG
+                if f != 'availability_zones'
+            )
+        )
         self.assertEqual(self.columns_long_no_az, columns)
         self.assertCountEqual(self.data_long_no_az, list(data))
 
@@ -680,7 +707,7 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.routers.assert_called_once_with(
-            **{'name': test_name}
+            fields=LIST_FIELDS_TO_RETRIEVE, **{'name': test_name}
         )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
@@ -697,6 +724,7 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'admin_state_up': True, 'is_admin_state_up': True}
         )
         self.assertEqual(self.columns, columns)
@@ -711,6 +739,7 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{'admin_state_up': False, 'is_admin_state_up': False}
         )
 
@@ -732,7 +761,9 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.routers.assert_called_once_with(**filters)
+        self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -754,7 +785,9 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.routers.assert_called_once_with(**filters)
+        self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -814,6 +847,7 @@ class TestListRouter(TestRouter):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.routers.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'tags': 'red,blue',
                 'any_tags': 'red,green',
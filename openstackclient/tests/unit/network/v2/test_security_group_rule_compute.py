@@ -551,3 +551,16 @@ class TestShowSecurityGroupRuleCompute(TestSecurityGroupRuleCompute):
         self.compute.api.security_group_list.assert_called_once_with()
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, data)
+
+    def test_security_group_rule_show_not_found(self):
+        arglist = [
+            'unknown-rule',
+        ]
+        verifylist = [
+            ('rule', 'unknown-rule'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
@@ -22,6 +22,20 @@ from openstackclient.tests.unit.network.v2 import fakes as network_fakes
 from openstackclient.tests.unit import utils as tests_utils
 
 
+LIST_FIELDS_TO_RETRIEVE = (
+    'id',
+    'protocol',
+    'ethertype',
+    'remote_ip_prefix',
+    'direction',
+    'remote_group_id',
+    'remote_address_group_id',
+    'security_group_id',
+    'port_range_min',
+    'port_range_max',
+)
+
+
 class TestSecurityGroupRuleNetwork(network_fakes.TestNetworkV2):
     def setUp(self):
         super(TestSecurityGroupRuleNetwork, self).setUp()
@@ -1169,7 +1183,9 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.security_group_rules.assert_called_once_with(**{})
+        self.network_client.security_group_rules.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.expected_columns_no_group, columns)
         self.assertEqual(self.expected_data_no_group, list(data))
 
@@ -1186,6 +1202,9 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.security_group_rules.assert_called_once_with(
+            fields=tuple(
+                f for f in LIST_FIELDS_TO_RETRIEVE if f != 'security_group_id'
+            ),
             **{
                 'security_group_id': self._security_group.id,
             }
@@ -1205,7 +1224,9 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.security_group_rules.assert_called_once_with(**{})
+        self.network_client.security_group_rules.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.expected_columns_no_group, columns)
         self.assertEqual(self.expected_data_no_group, list(data))
 
@@ -1223,6 +1244,7 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.security_group_rules.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'protocol': 'tcp',
             }
@@ -1243,6 +1265,7 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.security_group_rules.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'direction': 'ingress',
             }
@@ -1263,6 +1286,7 @@ class TestListSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.security_group_rules.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'direction': 'egress',
             }
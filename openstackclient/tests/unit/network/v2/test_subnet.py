@@ -23,6 +23,20 @@ from openstackclient.tests.unit.network.v2 import fakes as network_fakes
 from openstackclient.tests.unit import utils as tests_utils
 
 
+LIST_FIELDS_TO_RETRIEVE = ('id', 'name', 'network_id', 'cidr')
+LIST_FIELDS_TO_RETRIEVE_LONG = LIST_FIELDS_TO_RETRIEVE + (
+    'project_id',
+    'enable_dhcp',
+    'dns_nameservers',
+    'allocation_pools',
+    'host_routes',
+    'ip_version',
+    'gateway_ip',
+    'service_types',
+    'tags',
+)
+
+
 class TestSubnet(network_fakes.TestNetworkV2):
     def setUp(self):
         super(TestSubnet, self).setUp()
@@ -772,7 +786,9 @@ class TestListSubnet(TestSubnet):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.subnets.assert_called_once_with()
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -787,7 +803,9 @@ class TestListSubnet(TestSubnet):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.network_client.subnets.assert_called_once_with()
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE_LONG
+        )
         self.assertEqual(self.columns_long, columns)
         self.assertCountEqual(self.data_long, list(data))
 
@@ -804,7 +822,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'ip_version': 4}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -820,7 +840,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'enable_dhcp': True, 'is_dhcp_enabled': True}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -836,7 +858,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'enable_dhcp': False, 'is_dhcp_enabled': False}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -852,7 +876,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'service_types': ['network:router_gateway']}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -871,7 +897,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -897,7 +925,9 @@ class TestListSubnet(TestSubnet):
                 'network:floatingip_agent_gateway',
             ]
         }
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -919,7 +949,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'project_id': project.id}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -938,7 +970,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'network_id': network.id}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -957,7 +991,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'gateway_ip': subnet.gateway_ip}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -976,7 +1012,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'name': subnet.name}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -995,7 +1033,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'cidr': subnet.cidr}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -1020,7 +1060,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'subnetpool_id': subnet_pool.id}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -1045,7 +1087,9 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
         filters = {'subnetpool_id': subnet_pool.id}
 
-        self.network_client.subnets.assert_called_once_with(**filters)
+        self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE, **filters
+        )
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
@@ -1070,6 +1114,7 @@ class TestListSubnet(TestSubnet):
         columns, data = self.cmd.take_action(parsed_args)
 
         self.network_client.subnets.assert_called_once_with(
+            fields=LIST_FIELDS_TO_RETRIEVE,
             **{
                 'tags': 'red,blue',
                 'any_tags': 'red,green',
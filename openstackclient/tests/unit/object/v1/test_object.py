@@ -283,11 +283,14 @@ class TestObjectList(TestObject):
         )
         self.assertEqual(datalist, tuple(data))
 
-    def test_object_list_objects_all(self, o_mock):
-        o_mock.return_value = [
-            copy.deepcopy(object_fakes.OBJECT),
-            copy.deepcopy(object_fakes.OBJECT_2),
-        ]
+    @mock.patch('openstackclient.api.object_store_v1.APIv1.object_iter')
+    def test_object_list_objects_all(self, o_iter_mock, o_mock):
+        o_iter_mock.return_value = iter(
+            [
+                copy.deepcopy(object_fakes.OBJECT),
+                copy.deepcopy(object_fakes.OBJECT_2),
+            ]
+        )
 
         arglist = [
             '--all',
@@ -304,13 +307,49 @@ class TestObjectList(TestObject):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        # Set expected values
+        o_iter_mock.assert_called_with(
+            container=object_fakes.container_name,
+        )
+        o_mock.assert_not_called()
+
+        self.assertEqual(self.columns, columns)
+        datalist = (
+            (object_fakes.object_name_1,),
+            (object_fakes.object_name_2,),
+        )
+        self.assertEqual(datalist, tuple(data))
+
+    @mock.patch('openstackclient.api.object_store_v1.APIv1.object_iter')
+    def test_object_list_objects_all_parallel(self, o_iter_mock, o_mock):
+        o_iter_mock.return_value = iter(
+            [
+                copy.deepcopy(object_fakes.OBJECT),
+                copy.deepcopy(object_fakes.OBJECT_2),
+            ]
+        )
+
+        arglist = [
+            '--all',
+            '--parallel',
+            '4',
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('all', True),
+            ('parallel', 4),
+            ('container', object_fakes.container_name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
         kwargs = {
-            'full_listing': True,
+            'partitions': 4,
         }
-        o_mock.assert_called_with(
+        o_iter_mock.assert_called_with(
             container=object_fakes.container_name, **kwargs
         )
+        o_mock.assert_not_called()
 
         self.assertEqual(self.columns, columns)
         datalist = (
@@ -13,8 +13,10 @@
 
 import copy
 import io
+import os
 from unittest import mock
 
+import fixtures
 from osc_lib import exceptions
 from requests_mock.contrib import fixture
 
@@ -60,6 +62,88 @@ class TestObjectCreate(TestObjectAll):
             exceptions.CommandError, self.cmd.take_action, parsed_args
         )
 
+    def test_object_create_concurrency(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        files = []
+        for name in ('one', 'two', 'three'):
+            path = os.path.join(tmp_dir, name)
+            with open(path, 'w') as f:
+                f.write(name)
+            files.append(path)
+        for path in files:
+            self.requests_mock.register_uri(
+                'PUT',
+                object_fakes.ENDPOINT
+                + '/'
+                + object_fakes.container_name
+                + '/'
+                + path,
+                headers={'Etag': 'etag-' + os.path.basename(path)},
+                status_code=201,
+            )
+
+        arglist = (
+            [object_fakes.container_name] + files + ['--concurrency', '2']
+        )
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('objects', files),
+            ('concurrency', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('object', 'container', 'etag'), columns)
+        self.assertEqual(
+            [
+                (path, object_fakes.container_name, 'etag-' + name)
+                for path, name in zip(files, ('one', 'two', 'three'))
+            ],
+            list(data),
+        )
+
+    def test_object_create_concurrency_failure(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        path = os.path.join(tmp_dir, 'one')
+        with open(path, 'w') as f:
+            f.write('one')
+        self.requests_mock.register_uri(
+            'PUT',
+            object_fakes.ENDPOINT
+            + '/'
+            + object_fakes.container_name
+            + '/'
+            + path,
+            status_code=201,
+        )
+
+        arglist = [
+            object_fakes.container_name,
+            path,
+            os.path.join(tmp_dir, 'missing'),
+            '--concurrency',
+            '2',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        # The other object is uploaded anyway, and displayed
+        self.assertEqual(1, self.cmd.run(parsed_args))
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertIn(path, self.app.stdout.make_string())
+
+    def test_object_create_failure(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+
+        arglist = [
+            object_fakes.container_name,
+            os.path.join(tmp_dir, 'missing'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        # The error of a single object is raised as is
+        self.assertRaises(FileNotFoundError, self.cmd.run, parsed_args)
+
 
 class TestObjectList(TestObjectAll):
     columns = ('Name',)
@@ -213,6 +297,53 @@ class TestObjectSave(TestObjectAll):
         # Get the command object to test
         self.cmd = object_cmds.SaveObject(self.app, None)
 
+    def test_save_multiple_objects(self):
+        tmp_dir = self.useFixture(fixtures.TempDir()).path
+        objects = [object_fakes.object_name_1, object_fakes.object_name_2]
+        for name in objects:
+            self.requests_mock.register_uri(
+                'GET',
+                object_fakes.ENDPOINT
+                + '/'
+                + object_fakes.container_name
+                + '/'
+                + name,
+                status_code=200,
+                content=name.encode(),
+            )
+
+        arglist = [object_fakes.container_name] + objects
+        arglist += ['--concurrency', '2']
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('objects', objects),
+            ('concurrency', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        self.addCleanup(os.chdir, cwd)
+        self.cmd.take_action(parsed_args)
+
+        for name in objects:
+            with open(os.path.join(tmp_dir, name), 'rb') as f:
+                self.assertEqual(name.encode(), f.read())
+
+    def test_save_multiple_objects_with_file(self):
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            object_fakes.object_name_2,
+            '--file',
+            'out',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
     def test_save_to_stdout(self):
         self.requests_mock.register_uri(
             'GET',
@@ -234,7 +365,7 @@ class TestObjectSave(TestObjectAll):
 
         verifylist = [
             ('container', object_fakes.container_name),
-            ('object', object_fakes.object_name_1),
+            ('objects', [object_fakes.object_name_1]),
             ('file', '-'),
         ]
 
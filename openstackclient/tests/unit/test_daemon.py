@@ -0,0 +1,193 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+import threading
+from unittest import mock
+
+import fixtures
+
+from openstackclient import daemon
+from openstackclient.tests.unit import utils
+
+
+class TestSocketPath(utils.TestCase):
+    def test_socket_path_per_environment(self):
+        path_1 = daemon.get_socket_path({'OS_CLOUD': 'one'})
+        path_2 = daemon.get_socket_path({'OS_CLOUD': 'two'})
+
+        self.assertNotEqual(path_1, path_2)
+        self.assertEqual(path_1, daemon.get_socket_path({'OS_CLOUD': 'one'}))
+
+    def test_socket_path_runtime_dir(self):
+        self.useFixture(
+            fixtures.EnvironmentVariable('XDG_RUNTIME_DIR', '/run/user/42')
+        )
+
+        path = daemon.get_socket_path({})
+
+        self.assertTrue(path.startswith('/run/user/42/openstackclient/'))
+
+
+class TestDaemon(utils.TestCase):
+    def setUp(self):
+        super(TestDaemon, self).setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.path = os.path.join(self.tmpdir, 'run', 'daemon.sock')
+
+        self.app = mock.Mock()
+        self.app.client_manager._auth_ref = None
+        self.app.run_subcommand.side_effect = self._run_subcommand
+        self.server = daemon.DaemonServer(self.path, self.app)
+        self.addCleanup(self.server.server_close)
+
+        # Stand-ins for the standard streams of the client
+        streams = []
+        for name in ('stdin', 'stdout', 'stderr'):
+            stream = open(os.path.join(self.tmpdir, name), 'w+')
+            self.addCleanup(stream.close)
+            self.useFixture(fixtures.MonkeyPatch('sys.' + name, stream))
+            streams.append(stream)
+        self.stdin, self.stdout, self.stderr = streams
+
+    def _run_subcommand(self, argv):
+        self.app.stdout.write('out: %s\n' % ' '.join(argv))
+        self.app.stderr.write('err\n')
+        return 3
+
+    def _run_remote(self, argv):
+        thread = threading.Thread(target=self.server.handle_request)
+        thread.start()
+        try:
+            return daemon.run_remote(argv, path=self.path)
+        finally:
+            thread.join()
+
+    def _read(self, stream):
+        stream.seek(0)
+        return stream.read()
+
+    def test_run_remote(self):
+        rc = self._run_remote(['server', 'list'])
+
+        self.assertEqual(3, rc)
+        self.app.run_subcommand.assert_called_once_with(['server', 'list'])
+        self.assertEqual('out: server list\n', self._read(self.stdout))
+        self.assertEqual('err\n', self._read(self.stderr))
+
+    def test_run_remote_environment_mismatch(self):
+        self.server.environment_hash = 'other'
+
+        rc = self._run_remote(['server', 'list'])
+
+        self.assertIsNone(rc)
+        self.app.run_subcommand.assert_not_called()
+
+    def test_run_remote_token_expired(self):
+        auth_ref = self.app.client_manager._auth_ref = mock.Mock()
+        auth_ref.will_expire_soon.return_value = True
+        self.app.client_manager.auth.invalidate.return_value = False
+
+        rc = self._run_remote(['server', 'list'])
+
+        self.assertIsNone(rc)
+        self.assertTrue(self.server.stopped)
+        self.app.run_subcommand.assert_not_called()
+
+    def test_run_remote_no_daemon(self):
+        rc = daemon.run_remote(
+            ['server', 'list'], path=os.path.join(self.tmpdir, 'none.sock')
+        )
+
+        self.assertIsNone(rc)
+
+    def test_run_remote_lost_response(self):
+        recv = daemon._recv
+
+        def _recv(sock, max_fds=0):
+            if max_fds:
+                return recv(sock, max_fds)
+            # The daemon died before answering the client
+            return None, []
+
+        with mock.patch.object(daemon, '_recv', side_effect=_recv):
+            rc = self._run_remote(['server', 'create', 'vm'])
+
+        self.assertEqual(daemon.LOST_RESPONSE_STATUS, rc)
+        self.app.run_subcommand.assert_called_once_with(
+            ['server', 'create', 'vm']
+        )
+
+    @mock.patch.object(daemon, '_recv', side_effect=ValueError('bad json'))
+    def test_run_remote_invalid_response(self, recv_mock):
+        rc = self._run_remote(['volume', 'delete', 'vol'])
+
+        self.assertEqual(daemon.LOST_RESPONSE_STATUS, rc)
+
+    def test_refresh_auth(self):
+        cm = self.app.client_manager
+        auth_ref = cm._auth_ref = mock.Mock()
+        auth_ref.will_expire_soon.return_value = True
+        cm.auth.invalidate.return_value = True
+
+        self.assertTrue(self.server.refresh_auth())
+
+        auth_ref.will_expire_soon.assert_called_once_with(
+            daemon.TOKEN_STALE_DURATION
+        )
+        self.assertIsNone(cm._auth_ref)
+
+    def test_refresh_auth_valid_token(self):
+        cm = self.app.client_manager
+        auth_ref = cm._auth_ref = mock.Mock()
+        auth_ref.will_expire_soon.return_value = False
+
+        self.assertTrue(self.server.refresh_auth())
+
+        self.assertIs(auth_ref, cm._auth_ref)
+        cm.auth.invalidate.assert_not_called()
+
+    def test_idle_timeout(self):
+        self.server.idle_timeout = 10
+        self.server.last_request -= 11
+
+        self.server.handle_timeout()
+
+        self.assertTrue(self.server.stopped)
+
+
+class TestClientMain(utils.TestCase):
+    @mock.patch.object(daemon, '_run_local', return_value=0)
+    @mock.patch.object(daemon, 'run_remote', return_value=None)
+    def test_fallback_to_local(self, remote_mock, local_mock):
+        self.assertEqual(0, daemon.client_main(['server', 'list']))
+
+        remote_mock.assert_called_once_with(['server', 'list'])
+        local_mock.assert_called_once_with(['server', 'list'])
+
+    @mock.patch.object(daemon, '_run_local')
+    @mock.patch.object(daemon, 'run_remote', return_value=2)
+    def test_remote(self, remote_mock, local_mock):
+        self.assertEqual(2, daemon.client_main(['server', 'list']))
+
+        local_mock.assert_not_called()
+
+    @mock.patch.object(daemon, '_run_local', return_value=0)
+    @mock.patch.object(daemon, 'run_remote')
+    def test_global_options_run_local(self, remote_mock, local_mock):
+        daemon.client_main(['--os-cloud', 'other', 'server', 'list'])
+
+        remote_mock.assert_not_called()
+        local_mock.assert_called_once_with(
+            ['--os-cloud', 'other', 'server', 'list']
+        )
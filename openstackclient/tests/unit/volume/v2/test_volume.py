@@ -1230,6 +1230,34 @@ class TestVolumeList(TestVolume):
         )
         self.assertCountEqual(datalist, tuple(data))
 
+    def test_volume_list_attached_servers(self):
+        server_id = self.mock_volume.attachments[0]['server_id']
+        device = self.mock_volume.attachments[0]['device']
+        fake_server = mock.Mock()
+        fake_server.name = 'fake-server-name'
+        compute_client = mock.Mock()
+        compute_client.servers.get.return_value = fake_server
+        self.app.client_manager.compute = compute_client
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+        attachments = list(data)[0][4]
+
+        # The servers are only fetched when their names are displayed
+        compute_client.servers.get.assert_not_called()
+        self.assertEqual(
+            self.mock_volume.attachments, attachments.machine_readable()
+        )
+        compute_client.servers.get.assert_not_called()
+
+        self.assertEqual(
+            'Attached to fake-server-name on %s ' % device,
+            attachments.human_readable(),
+        )
+        compute_client.servers.get.assert_called_once_with(server_id)
+        compute_client.servers.list.assert_not_called()
+
     def test_volume_list_with_marker_and_limit(self):
         arglist = [
             "--marker",
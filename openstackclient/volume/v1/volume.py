@@ -26,6 +26,7 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import lookup
 from openstackclient.i18n import _
 
 
@@ -36,7 +37,8 @@ class AttachmentsColumn(cliff_columns.FormattableColumn):
     """Formattable column for attachments column.
 
     Unlike the parent FormattableColumn class, the initializer of the
-    class takes server_cache as the second argument.
+    class takes server_cache as the second argument, a mapping of server IDs
+    to servers such as a ``lookup.ResourceLookup``.
     osc_lib.utils.get_item_properties instantiate cliff FormattableColumn
     object with a single parameter "column value", so you need to pass
     a partially initialized class like
@@ -56,8 +58,9 @@ class AttachmentsColumn(cliff_columns.FormattableColumn):
         msg = ''
         for attachment in self._value:
             server = attachment['server_id']
-            if server in self._server_cache.keys():
-                server = self._server_cache[server].name
+            cached = self._server_cache.get(server)
+            if cached is not None:
+                server = cached.name
             device = attachment['device']
             msg += 'Attached to %s on %s ' % (server, device)
         return msg
@@ -390,7 +393,6 @@ class ListVolume(command.Lister):
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        compute_client = self.app.client_manager.compute
 
         if parsed_args.long:
             columns = (
@@ -429,16 +431,16 @@ class ListVolume(command.Lister):
                 'Attached to',
             )
 
-        # Cache the server list
-        server_cache = {}
-        try:
-            for s in compute_client.servers.list():
-                server_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        # The names of the servers the volumes are attached to are only
+        # displayed by the human readable formats, only the servers of the
+        # listed volumes are fetched and only once a name is needed
+        servers = lookup.ResourceLookup(
+            get_resource=lambda server_id: (
+                self.app.client_manager.compute.servers.get(server_id)
+            )
+        )
         AttachmentsColumnWithCache = functools.partial(
-            AttachmentsColumn, server_cache=server_cache
+            AttachmentsColumn, server_cache=servers
         )
 
         search_opts = {
@@ -454,6 +456,11 @@ class ListVolume(command.Lister):
             search_opts=search_opts,
             limit=parsed_args.limit,
         )
+        servers.defer(
+            attachment['server_id']
+            for volume in data
+            for attachment in volume.attachments
+        )
         column_headers = utils.backward_compat_col_lister(
             column_headers, parsed_args.columns, {'Display Name': 'Name'}
         )
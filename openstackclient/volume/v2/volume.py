@@ -26,6 +26,8 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import bulk
+from openstackclient.common import lookup
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
@@ -37,7 +39,8 @@ class AttachmentsColumn(cliff_columns.FormattableColumn):
     """Formattable column for attachments column.
 
     Unlike the parent FormattableColumn class, the initializer of the
-    class takes server_cache as the second argument.
+    class takes server_cache as the second argument, a mapping of server IDs
+    to servers such as a ``lookup.ResourceLookup``.
     osc_lib.utils.get_item_properties instantiate cliff FormattableColumn
     object with a single parameter "column value", so you need to pass
     a partially initialized class like
@@ -57,8 +60,9 @@ class AttachmentsColumn(cliff_columns.FormattableColumn):
         msg = ''
         for attachment in self._value:
             server = attachment['server_id']
-            if server in self._server_cache.keys():
-                server = self._server_cache[server].name
+            cached = self._server_cache.get(server)
+            if cached is not None:
+                server = cached.name
             device = attachment['device']
             msg += 'Attached to %s on %s ' % (server, device)
         return msg
@@ -358,38 +362,27 @@ class DeleteVolume(command.Command):
                 "(defaults to False)"
             ),
         )
+        bulk.add_parallel_option(parser)
         return parser
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        result = 0
 
-        for i in parsed_args.volumes:
-            try:
-                volume_obj = utils.find_resource(volume_client.volumes, i)
-                if parsed_args.force:
-                    volume_client.volumes.force_delete(volume_obj.id)
-                else:
-                    volume_client.volumes.delete(
-                        volume_obj.id, cascade=parsed_args.purge
-                    )
-            except Exception as e:
-                result += 1
-                LOG.error(
-                    _(
-                        "Failed to delete volume with "
-                        "name or ID '%(volume)s': %(e)s"
-                    ),
-                    {'volume': i, 'e': e},
+        def _delete(volume):
+            volume_obj = utils.find_resource(volume_client.volumes, volume)
+            if parsed_args.force:
+                volume_client.volumes.force_delete(volume_obj.id)
+            else:
+                volume_client.volumes.delete(
+                    volume_obj.id, cascade=parsed_args.purge
                 )
 
-        if result > 0:
-            total = len(parsed_args.volumes)
-            msg = _("%(result)s of %(total)s volumes failed " "to delete.") % {
-                'result': result,
-                'total': total,
-            }
-            raise exceptions.CommandError(msg)
+        bulk.delete(
+            _delete,
+            parsed_args.volumes,
+            'volume',
+            workers=parsed_args.parallel,
+        )
 
 
 class ListVolume(command.Lister):
@@ -475,17 +468,16 @@ class ListVolume(command.Lister):
             column_headers = copy.deepcopy(columns)
             column_headers[4] = 'Attached to'
 
-        # Cache the server list
-        server_cache = {}
-        try:
-            compute_client = self.app.client_manager.compute
-            for s in compute_client.servers.list():
-                server_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        # The names of the servers the volumes are attached to are only
+        # displayed by the human readable formats, only the servers of the
+        # listed volumes are fetched and only once a name is needed
+        servers = lookup.ResourceLookup(
+            get_resource=lambda server_id: (
+                self.app.client_manager.compute.servers.get(server_id)
+            )
+        )
         AttachmentsColumnWithCache = functools.partial(
-            AttachmentsColumn, server_cache=server_cache
+            AttachmentsColumn, server_cache=servers
         )
 
         project_id = None
@@ -518,6 +510,11 @@ class ListVolume(command.Lister):
             marker=parsed_args.marker,
             limit=parsed_args.limit,
         )
+        servers.defer(
+            attachment['server_id']
+            for volume in data
+            for attachment in volume.attachments
+        )
         column_headers = utils.backward_compat_col_lister(
             column_headers, parsed_args.columns, {'Display Name': 'Name'}
         )